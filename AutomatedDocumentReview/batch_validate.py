@@ -0,0 +1,280 @@
+"""
+Headless batch validation of PPT test reports.
+
+Validates every .pptx found in the given directories / globs against the release
+catalog (config/SampleReleases.xlsx), in parallel across CPU cores, and writes one
+consolidated Excel report.
+
+Each deck is matched to its release row by one or more key columns, whose values
+are read from the deck's Slide 1 (e.g. "Enterprise Release ID"). When that finds
+no row, the whole Slide 1 text is looked up in the catalog's key index instead
+(ReleaseCatalog.best_matches), so decks with an unusual title page are still
+validated unattended as long as a single release matches best.
+
+Usage (from the AutomatedDocumentReview folder):
+    python batch_validate.py reports/ "archive/*.pptx" --key-column "Enterprise Release ID" --key-column "Release"
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from ppt_validator import (extract_slide1_fields, extract_slide1_text, normalize_text, open_pptx_package,
+                           validate_ppt_package)
+from release_catalog import load_catalog
+
+DEFAULT_RELEASES_FILE = os.path.join(os.getcwd(), "config", "SampleReleases.xlsx")
+DEFAULT_KEY_COLUMNS = ["Enterprise Release ID"]
+DEFAULT_OUTPUT = "Batch_PPT_Validation_Report.xlsx"
+
+# Per-worker release catalog, loaded once by the pool initializer
+_release_catalog = None
+_catalog = None
+_key_columns = None
+_key_index = None
+_key_indexes = {}  # (catalog version, key columns) -> build_key_index(), for the current catalog version
+
+
+def load_release_catalog(releases_file):
+    """The release catalog with every cell as text so IDs like 2025.3 or 1002 stay verbatim."""
+    return load_catalog(releases_file).frame
+
+
+def collect_pptx_files(inputs):
+    """Expands directories and glob patterns into a sorted, de-duplicated list of .pptx paths."""
+    files = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = glob.glob(os.path.join(item, "*.pptx"))
+        else:
+            candidates = glob.glob(item)
+        files.update(os.path.abspath(f) for f in candidates if f.lower().endswith(".pptx"))
+    return sorted(files)
+
+
+def _normalized_key(values):
+    return tuple(normalize_text(value).lower() for value in values)
+
+
+def build_key_index(catalog, key_columns):
+    """Normalized key column values -> catalog positions, built once instead of scanning the catalog per deck."""
+    columns = [catalog[key].map(lambda value: normalize_text(value).lower()).tolist() for key in key_columns]
+    index = {}
+    for position, key in enumerate(zip(*columns)):
+        index.setdefault(key, []).append(position)
+    return index
+
+
+def catalog_key_index(release_catalog, key_columns):
+    """build_key_index() of a ReleaseCatalog, kept per process for its current version."""
+    cache_key = (release_catalog.version, tuple(key_columns))
+    index = _key_indexes.get(cache_key)
+    if index is None:
+        if any(version != release_catalog.version for version, _ in _key_indexes):
+            _key_indexes.clear()  # ♻️ A new catalog version was published
+        index = _key_indexes[cache_key] = build_key_index(release_catalog.frame, key_columns)
+    return index
+
+
+def match_release_row(catalog, key_columns, slide1_fields, key_index=None):
+    """
+    Finds the catalog rows whose key columns equal the values extracted from Slide 1.
+
+    :param key_index: build_key_index(catalog, key_columns); built here (a full catalog scan) when omitted.
+    :return: (matched rows as list of dicts, error message or None)
+    """
+    missing = [key for key in key_columns if not slide1_fields.get(key)]
+    if missing:
+        return [], f"Key field(s) not found on Slide 1: {', '.join(missing)}"
+
+    if key_index is None:
+        key_index = build_key_index(catalog, key_columns)
+    positions = key_index.get(_normalized_key(slide1_fields[key] for key in key_columns), [])
+    rows = catalog.iloc[positions].to_dict(orient="records")
+    if not rows:
+        keys = ", ".join(f"{key}={slide1_fields[key]}" for key in key_columns)
+        return [], f"No release row matches {keys}"
+    return rows, None
+
+
+def match_release_by_text(release_catalog, slide1_text):
+    """
+    Finds the release whose key column values occur most in the Slide 1 text.
+
+    :return: (matched row as dict or None, description of the match or error message)
+    """
+    matches = release_catalog.best_matches(slide1_text)
+    if not matches:
+        return None, "No release key found in the Slide 1 text"
+    if len(matches) > 1:
+        return None, f"{len(matches)} releases match the Slide 1 text equally well"
+    position, columns = matches[0]
+    return release_catalog.row(position).to_dict(), f"auto-matched on {', '.join(sorted(columns))}"
+
+
+def _init_worker(releases_file, key_columns):
+    global _release_catalog, _catalog, _key_columns, _key_index
+    _release_catalog = load_catalog(releases_file)
+    _catalog = _release_catalog.frame
+    _key_columns = key_columns
+    _key_index = catalog_key_index(_release_catalog, key_columns)  # ⚡ Each deck is then one dict lookup
+
+
+def validate_deck(pptx_path):
+    """Validates one deck inside a worker process. Never raises: failures are reported in the result."""
+    started = time.perf_counter()
+    outcome = {"File": pptx_path, "Status": "FAILED", "Matched Release": "", "Error": "", "Results": {}}
+    try:
+        with open_pptx_package(pptx_path) as package:
+            rows, error = match_release_row(_catalog, _key_columns, extract_slide1_fields(package), _key_index)
+            match_note = None
+            if error:
+                # Fall back to the key index over the whole Slide 1 text
+                row, match_note = match_release_by_text(_release_catalog, extract_slide1_text(package))
+                rows = [row] if row is not None else []
+                match_note = f"{error}; {match_note}"
+            if not rows:
+                outcome["Status"] = "UNMATCHED"
+                outcome["Error"] = match_note
+            else:
+                row = rows[0]
+                outcome["Matched Release"] = " / ".join(str(row[key]) for key in _key_columns)
+                if len(rows) > 1:
+                    outcome["Error"] = f"{len(rows)} release rows matched; validated against the first one"
+                elif match_note:
+                    outcome["Error"] = match_note
+                outcome["Results"] = validate_ppt_package(package, row)
+                outcome["Status"] = "VALIDATED"
+    except Exception:
+        outcome["Error"] = traceback.format_exc(limit=5)
+    outcome["Seconds"] = round(time.perf_counter() - started, 3)
+    return outcome
+
+
+def _crashed_outcome(path):
+    return {"File": path, "Status": "CRASHED", "Matched Release": "",
+            "Error": "Worker process terminated abruptly", "Results": {}, "Seconds": None}
+
+
+def _validate_on_pool(paths, releases_file, key_columns, workers, outcomes):
+    """
+    Validates decks on a new pool, with at most `workers` decks in flight, storing their outcomes.
+
+    :return: (decks not started, decks in flight when a worker died); both are empty when no worker died.
+    """
+    queue = deque(paths)
+    broken = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(releases_file, key_columns)) as pool:
+        in_flight = {}
+        while (queue or in_flight) and not broken:
+            while queue and len(in_flight) < workers:
+                path = queue.popleft()
+                in_flight[pool.submit(validate_deck, path)] = path
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                done = list(in_flight)  # The pool is gone: every deck in flight is finished or failed
+            for future in done:
+                path = in_flight.pop(future)
+                try:
+                    outcomes[path] = future.result()
+                except BrokenProcessPool:
+                    broken.append(path)
+                    continue
+                print(f"{outcomes[path]['Status']:<10} {os.path.basename(path)}", flush=True)
+    return list(queue), broken
+
+
+def run_batch(pptx_files, releases_file, key_columns, workers=None):
+    """
+    Validates all decks with a process pool and returns one outcome per deck, in input order.
+
+    When a worker dies (e.g. out of memory), only the decks it may have been handling are
+    suspects: those in flight at that moment (at most one per worker). The pool is replaced
+    and the batch goes on; each suspect is then retried alone in a fresh worker, so only the
+    deck that actually crashes its worker is marked CRASHED.
+    """
+    workers = workers or os.cpu_count() or 1
+    outcomes = {}
+    pending, suspects = list(pptx_files), []
+    while pending:
+        pending, broken = _validate_on_pool(pending, releases_file, key_columns, workers, outcomes)
+        suspects.extend(broken)
+
+    for path in suspects:
+        _, broken = _validate_on_pool([path], releases_file, key_columns, 1, outcomes)
+        if broken:
+            # ❌ The worker died (e.g. out of memory) while handling this deck alone
+            outcomes[path] = _crashed_outcome(path)
+            print(f"{'CRASHED':<10} {os.path.basename(path)}", flush=True)
+    return [outcomes[path] for path in pptx_files]
+
+
+def write_batch_report(outcomes, output_path):
+    """Writes a Summary sheet (one row per deck) and a Details sheet (one row per check)."""
+    summary = []
+    details = []
+    for outcome in outcomes:
+        checks = [(slide, check, result)
+                  for slide, slide_results in outcome["Results"].items()
+                  for check, result in slide_results.items()]
+        summary.append({
+            "File": os.path.basename(outcome["File"]),
+            "Status": outcome["Status"],
+            "Matched Release": outcome["Matched Release"],
+            "Checks": len(checks),
+            "Failed Checks": sum(1 for _, _, result in checks if not str(result).startswith("✅")),
+            "Seconds": outcome["Seconds"],
+            "Error": outcome["Error"],
+        })
+        details.extend({"File": os.path.basename(outcome["File"]), "Slide": slide,
+                        "Check": check, "Validation Result": result}
+                       for slide, check, result in checks)
+
+    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+        pd.DataFrame(summary).to_excel(writer, sheet_name="Summary", index=False)
+        pd.DataFrame(details, columns=["File", "Slide", "Check", "Validation Result"]).to_excel(
+            writer, sheet_name="Details", index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate a batch of PPT test reports against the release catalog.")
+    parser.add_argument("inputs", nargs="+", help="Directories and/or glob patterns of .pptx files")
+    parser.add_argument("--releases", default=DEFAULT_RELEASES_FILE, help="Release catalog (SampleReleases.xlsx)")
+    parser.add_argument("--key-column", action="append", dest="key_columns",
+                        help="Catalog column used to match a deck to its release (repeatable). "
+                             "Default: Enterprise Release ID")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Consolidated Excel report path")
+    args = parser.parse_args(argv)
+
+    key_columns = args.key_columns or DEFAULT_KEY_COLUMNS
+    unknown = [key for key in key_columns if key not in load_release_catalog(args.releases).columns]
+    if unknown:
+        parser.error(f"Unknown key column(s) in {args.releases}: {', '.join(unknown)}")
+
+    pptx_files = collect_pptx_files(args.inputs)
+    if not pptx_files:
+        parser.error("No .pptx files found for the given inputs")
+
+    started = time.perf_counter()
+    outcomes = run_batch(pptx_files, args.releases, key_columns, args.workers)
+    write_batch_report(outcomes, args.output)
+
+    failed = [o for o in outcomes if o["Status"] != "VALIDATED"]
+    print(f"✅ {len(outcomes) - len(failed)}/{len(outcomes)} decks validated in "
+          f"{time.perf_counter() - started:.1f}s. Report: {args.output}")
+    for outcome in failed:
+        print(f"❌ {os.path.basename(outcome['File'])}: {outcome['Status']} - {outcome['Error'].strip().splitlines()[-1]}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Benchmark suite: the PPT extractors and end-to-end validation over a synthetic corpus.
+
+Every stage is timed on the decks of benchmarks.synthetic_decks.CORPUS_PROFILES
+(slide count, table size, embedded workbooks and media vary per deck). Each
+timing opens a fresh PptxPackage, so nothing parsed by an earlier run is reused.
+
+Results are written to benchmarks/results/latest.json and appended to
+benchmarks/results/history.jsonl. When a baseline exists (benchmarks/results/baseline.json,
+see --save-baseline) every stage is compared against it and a regression is flagged
+when its median is more than --tolerance slower and at least --min-delta-ms slower;
+the exit code is then 1, so the suite can gate a CI job.
+
+Baselines are machine specific: record one on the machine that runs the comparison.
+
+Usage (from the AutomatedDocumentReview folder):
+    python benchmarks/bench_extractors.py --save-baseline          # record the baseline
+    python benchmarks/bench_extractors.py [--repeat 7] [--profiles small large]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_decks import CHECKLIST_ROW, CORPUS_PROFILES, build_corpus  # noqa: E402
+from ppt_validator import (PptxPackage, extract_embedded_files, extract_named_shapes,  # noqa: E402
+                           extract_slide1_fields, extract_tables_from_slide, extract_text_from_slide,
+                           get_total_slides, inspect_embedded_workbook, validate_ppt, write_excel_report)
+from rules import load_ruleset  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+DEFAULT_TOLERANCE = 0.25   # 25% slower than the baseline median
+DEFAULT_MIN_DELTA_MS = 1.0  # Ignore sub-millisecond noise on fast stages
+
+
+def _all_slides(deck, extractor):
+    with PptxPackage(deck) as package:
+        for slide_number in range(1, package.total_slides + 1):
+            extractor(package, slide_number)
+
+
+def _embedded_workbooks(deck, ruleset):
+    with PptxPackage(deck) as package:
+        for embedded_object in extract_embedded_files(package, 2):
+            inspect_embedded_workbook(embedded_object, ruleset)
+
+
+def build_stages(deck, ruleset, report_input):
+    """{stage name: zero-argument callable} for one deck."""
+    return {
+        "open_package": lambda: PptxPackage(deck).close(),
+        "get_total_slides": lambda: get_total_slides(deck),
+        "extract_named_shapes": lambda: _all_slides(deck, extract_named_shapes),
+        "extract_text_from_slide": lambda: _all_slides(deck, extract_text_from_slide),
+        "extract_tables_from_slide": lambda: _all_slides(deck, extract_tables_from_slide),
+        "extract_slide1_fields": lambda: extract_slide1_fields(deck, ruleset),
+        "embedded_workbooks": lambda: _embedded_workbooks(deck, ruleset),
+        "validate_ppt": lambda: validate_ppt(deck, CHECKLIST_ROW, ruleset=ruleset),
+        "write_excel_report": lambda: write_excel_report(report_input),  # Unmemoized report build
+    }
+
+
+def time_stage(stage, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        stage()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": round(statistics.median(timings), 3), "min_ms": round(min(timings), 3)}
+
+
+def run_suite(decks, repeat):
+    """Times every stage on every deck; returns {"<profile>/<stage>": {"median_ms", "min_ms"}}."""
+    ruleset = load_ruleset()
+    results = {}
+    for profile, deck in decks.items():
+        report_input = validate_ppt(deck, CHECKLIST_ROW, ruleset=ruleset)
+        for stage_name, stage in build_stages(deck, ruleset, report_input).items():
+            stage()  # Warm-up: imports, rule caches, allocator
+            results[f"{profile}/{stage_name}"] = time_stage(stage, repeat)
+    return results
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """
+    Compares the medians against the baseline.
+
+    :return: List of (key, baseline median, current median, status) with status
+             "ok", "faster", "REGRESSION" or "new".
+    """
+    rows = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            rows.append((key, None, current["median_ms"], "new"))
+            continue
+        before, after = previous["median_ms"], current["median_ms"]
+        if after > before * (1 + tolerance) and after - before >= min_delta_ms:
+            status = "REGRESSION"
+        elif after < before / (1 + tolerance) and before - after >= min_delta_ms:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((key, before, after, status))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", choices=list(CORPUS_PROFILES), default=list(CORPUS_PROFILES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--corpus-dir", help="Keep the generated decks here (default: a temporary folder)")
+    parser.add_argument("--results-dir", default=RESULTS_DIR)
+    parser.add_argument("--baseline", help="Baseline file (default: <results-dir>/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    args = parser.parse_args(argv)
+
+    profiles = {name: CORPUS_PROFILES[name] for name in args.profiles}
+    with tempfile.TemporaryDirectory() as tmp:
+        decks = build_corpus(args.corpus_dir or tmp, profiles)
+        results = run_suite(decks, args.repeat)
+
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    os.makedirs(args.results_dir, exist_ok=True)
+    with open(os.path.join(args.results_dir, "latest.json"), "w", encoding="utf-8") as file:
+        json.dump(run, file, indent=2)
+    with open(os.path.join(args.results_dir, "history.jsonl"), "a", encoding="utf-8") as file:
+        file.write(json.dumps(run) + "\n")
+
+    baseline_path = args.baseline or os.path.join(args.results_dir, "baseline.json")
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    rows = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    print(f"{'deck/stage':<40} {'baseline ms':>12} {'median ms':>10} {'status':>11}")
+    for key, before, after, status in rows:
+        before_text = f"{before:.2f}" if before is not None else "-"
+        print(f"{key:<40} {before_text:>12} {after:>10.2f} {status:>11}")
+
+    if args.save_baseline:
+        with open(baseline_path, "w", encoding="utf-8") as file:
+            json.dump(run, file, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    regressions = [key for key, _, _, status in rows if status == "REGRESSION"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {baseline_path}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
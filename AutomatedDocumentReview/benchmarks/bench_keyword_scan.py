@@ -0,0 +1,111 @@
+"""
+Benchmark: one-pass keyword scanning vs. one `in` test per keyword.
+
+Extracts the slide texts of the keyword-heavy synthetic deck (CORPUS_PROFILES["keyword_heavy"],
+60 lines of notes per content slide) and times the Slide 3..N checks with growing
+keyword lists: validate_content_slide, which checks each slide with the rule set's
+title and observation KeywordScanners (`in` tests up to FIND_MAX_KEYWORDS keywords,
+the trie regex above), against the previous implementation that ran
+`any(keyword in ...)` per title line and again for the observations. Both must
+return the same results.
+
+Two rule sets are timed per size: the default keywords plus the extra ones
+("early hits": the synthetic titles contain "summary", so both checks are answered
+at the start of the text) and the extra keywords alone ("no hits": every keyword
+has to be looked for in the whole text, the worst case for per-keyword scans).
+
+Usage (from the AutomatedDocumentReview folder):
+    python benchmarks/bench_keyword_scan.py [--keywords 0 50 200 1000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_decks import CORPUS_PROFILES, NOTE_WORDS, build_deck  # noqa: E402
+from ppt_validator import PptxPackage, extract_text_from_slide, validate_content_slide  # noqa: E402
+from rules import DEFAULT_RULES, RuleSet, split_list  # noqa: E402
+
+
+def per_keyword_content_checks(slide_text, ruleset):
+    """The previous Slide 3..N checks: one scan of the text per keyword."""
+    slide_text = slide_text.strip().lower()
+    lines = [line.strip() for line in slide_text.splitlines() if line.strip()]
+
+    extracted_title = ""
+    for line in lines[:3]:
+        if any(keyword in line for keyword in ruleset.title_keywords):
+            extracted_title = line
+            break
+
+    if not extracted_title and lines:
+        extracted_title = lines[0]
+
+    extracted_observations = any(keyword in slide_text for keyword in ruleset.observation_keywords)
+
+    return {
+        "Title Found": "✅ Yes" if extracted_title else "❌ No",
+        "Observations Found": "✅ Yes" if extracted_observations else "❌ No",
+    }
+
+
+def keyword_heavy_ruleset(extra_keywords, with_defaults=True, seed=7):
+    """
+    The rules with extra_keywords title / observation keywords that share prefixes with the
+    notes but never occur in them (optionally without the default keywords).
+    """
+    rng = random.Random(seed)
+    extra = [f"{rng.choice(NOTE_WORDS)} {i}" for i in range(extra_keywords)]
+    title_keywords = split_list(DEFAULT_RULES["Slide3_TitleKeywords"]) if with_defaults else []
+    observation_keywords = split_list(DEFAULT_RULES["Slide3_ObservationKeywords"]) if with_defaults else []
+    return RuleSet({
+        **DEFAULT_RULES,
+        "Slide3_TitleKeywords": ", ".join(title_keywords + extra[::2]),
+        "Slide3_ObservationKeywords": ", ".join(observation_keywords + extra[1::2]),
+    })
+
+
+def time_checks(check, slide_texts, ruleset, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [check(slide_text, ruleset) for slide_text in slide_texts]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--keywords", type=int, nargs="+", default=[0, 50, 200, 1000],
+                        help="Extra keywords on top of the default title and observation keywords")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = build_deck(os.path.join(tmp, "keyword_heavy.pptx"), **CORPUS_PROFILES["keyword_heavy"])
+        with PptxPackage(deck) as package:
+            slide_texts = [extract_text_from_slide(package, n) for n in range(3, package.total_slides + 1)]
+
+    text_kb = sum(len(text) for text in slide_texts) / 1024
+    print(f"{len(slide_texts)} content slides, {text_kb:.0f} KB of text")
+    print(f"{'rules':>11} {'keywords':>8} {'per-keyword ms':>15} {'one-pass ms':>12} {'speedup':>8}")
+    for with_defaults, label in ((True, "early hits"), (False, "no hits")):
+        for extra_keywords in args.keywords:
+            if not with_defaults and not extra_keywords:
+                continue
+            ruleset = keyword_heavy_ruleset(extra_keywords, with_defaults)
+            keywords = len(set(ruleset.title_keywords) | set(ruleset.observation_keywords))
+            baseline, expected = time_checks(per_keyword_content_checks, slide_texts, ruleset, args.repeat)
+            elapsed, results = time_checks(validate_content_slide, slide_texts, ruleset, args.repeat)
+            assert results == expected, "one-pass results differ from the per-keyword checks"
+            print(f"{label:>11} {keywords:>8} {baseline * 1000:>15.2f} {elapsed * 1000:>12.2f} "
+                  f"{baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
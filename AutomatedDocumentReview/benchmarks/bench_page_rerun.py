@@ -0,0 +1,63 @@
+"""
+Benchmark: per-rerun latency of a page loaded with exec() vs. a cached import + render().
+
+"exec" reproduces the old main.load_page: read the page source, compile it and run
+it in fresh globals on every rerun. "import" is the current loader: the page module
+is imported once and every rerun only calls render(). Pages run in Streamlit bare
+mode, so the timings cover page code only (no browser round trip).
+
+Usage (from the AutomatedDocumentReview folder):
+    python benchmarks/bench_page_rerun.py [--pages uippt uiword uiupload] [--reruns 50]
+"""
+import argparse
+import importlib
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pages")
+WARMUP_RERUNS = 3
+
+
+def exec_rerun(page_name):
+    with open(os.path.join(PAGES_DIR, f"{page_name}.py"), "r", encoding="utf-8") as file:
+        namespace = {"__name__": f"exec_{page_name}"}
+        exec(file.read(), namespace)
+    namespace["render"]()
+
+
+def import_rerun(page_name):
+    importlib.import_module(f"pages.{page_name}").render()
+
+
+def time_reruns(rerun, page_name, reruns):
+    timings = []
+    for i in range(WARMUP_RERUNS + reruns):
+        started = time.perf_counter()
+        rerun(page_name)
+        if i >= WARMUP_RERUNS:
+            timings.append(time.perf_counter() - started)
+    timings.sort()
+    return statistics.median(timings), timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=["uippt", "uiword", "uiupload"])
+    parser.add_argument("--reruns", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)  # Bare-mode warnings ("missing ScriptRunContext", ...) on every call
+    print(f"{'page':>10} {'loader':>7} {'median ms':>10} {'p95 ms':>8}")
+    for page_name in args.pages:
+        for loader, rerun in (("exec", exec_rerun), ("import", import_rerun)):
+            median, p95 = time_reruns(rerun, page_name, args.reruns)
+            print(f"{page_name:>10} {loader:>7} {median * 1000:>10.2f} {p95 * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
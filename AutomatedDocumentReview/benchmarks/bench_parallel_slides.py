@@ -0,0 +1,55 @@
+"""
+Benchmark: sequential vs. parallel validation of slides 3..N.
+
+Builds 50-, 200- and 500-slide synthetic decks and times validate_ppt with
+slide_workers = 1 (sequential) and with thread / process pools of growing size.
+
+Usage (from the AutomatedDocumentReview folder):
+    python benchmarks/bench_parallel_slides.py [--table-rows 40] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_decks import CHECKLIST_ROW, build_deck  # noqa: E402
+from ppt_validator import validate_ppt  # noqa: E402
+
+
+def time_validation(deck_path, repeat, **kwargs):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = validate_ppt(deck_path, CHECKLIST_ROW, **kwargs)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--table-rows", type=int, default=40, help="Response-time table rows per content slide")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    workers_list = sorted(w for w in set(args.workers) if w > 1)
+    print(f"{'slides':>6} {'mode':>8} {'workers':>7} {'best ms':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            deck = build_deck(os.path.join(tmp, f"deck_{size}.pptx"), slides=size, table_rows=args.table_rows)
+            baseline, expected = time_validation(deck, args.repeat, slide_workers=1)
+            print(f"{size:>6} {'serial':>8} {1:>7} {baseline * 1000:>9.1f} {1.0:>7.2f}x")
+            for mode in ("thread", "process"):
+                for workers in workers_list:
+                    elapsed, results = time_validation(deck, args.repeat, slide_workers=workers, slide_executor=mode)
+                    assert results == expected, "parallel results differ from sequential results"
+                    print(f"{size:>6} {mode:>8} {workers:>7} {elapsed * 1000:>9.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
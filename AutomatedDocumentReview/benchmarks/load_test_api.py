@@ -0,0 +1,139 @@
+"""
+Load test for validation_api.py: throughput and p50 / p95 / p99 latency of POST /validate.
+
+Each client thread keeps one keep-alive connection and posts the deck as the raw
+request body until the request budget is spent. By default the result cache is
+bypassed (cache=0) so every request runs a full validation.
+
+Usage (from the AutomatedDocumentReview folder):
+    python benchmarks/load_test_api.py --spawn [--slides 50] [--concurrency 8] [--requests 200]
+    python benchmarks/load_test_api.py --url http://127.0.0.1:8765 --deck report.pptx --release 2025.M03
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_decks import build_deck  # noqa: E402
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, int(round(percent / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def wait_for_health(host, port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=2)
+            connection.request("GET", "/health")
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Validation API on {host}:{port} did not become healthy")
+
+
+def run_client(host, port, path, deck, budget, latencies, statuses, lock):
+    connection = http.client.HTTPConnection(host, port, timeout=300)
+    headers = {"Content-Type": PPTX_CONTENT_TYPE}
+    while next(budget, None) is not None:
+        started = time.perf_counter()
+        try:
+            connection.request("POST", path, body=deck, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+            if response.getheader("Connection", "").lower() == "close":
+                connection.close()
+        except (OSError, http.client.HTTPException):
+            status = "error"
+            connection.close()
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] = statuses.get(status, 0) + 1
+    connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--spawn", action="store_true", help="Start validation_api.py for the duration of the test")
+    parser.add_argument("--workers", type=int, default=None, help="API worker processes (with --spawn)")
+    parser.add_argument("--deck", help="Deck to post (default: a synthetic deck)")
+    parser.add_argument("--slides", type=int, default=50, help="Synthetic deck size")
+    parser.add_argument("--release", default="2025.M03", help="Enterprise Release ID to validate against")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--use-cache", action="store_true", help="Let the API answer from its result cache")
+    args = parser.parse_args(argv)
+
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    query = {"release": args.release}
+    if not args.use_cache:
+        query["cache"] = "0"
+    path = f"/validate?{urlencode(query)}"
+
+    server = None
+    with tempfile.TemporaryDirectory() as tmp:
+        deck_path = args.deck or build_deck(os.path.join(tmp, "load_test.pptx"), slides=args.slides, table_rows=20)
+        with open(deck_path, "rb") as deck_file:
+            deck = deck_file.read()
+
+        if args.spawn:
+            command = [sys.executable, os.path.join(APP_DIR, "validation_api.py"), "--host", host, "--port", str(port)]
+            if args.workers:
+                command += ["--workers", str(args.workers)]
+            server = subprocess.Popen(command, cwd=os.getcwd())
+        try:
+            wait_for_health(host, port)
+            latencies, statuses, lock = [], {}, threading.Lock()
+            budget = iter(range(args.requests))  # Shared request budget; next() on a range iterator is atomic
+            clients = [threading.Thread(target=run_client,
+                                        args=(host, port, path, deck, budget, latencies, statuses, lock))
+                       for _ in range(args.concurrency)]
+            started = time.perf_counter()
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            elapsed = time.perf_counter() - started
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=30)
+
+    latencies.sort()
+    report = {
+        "requests": len(latencies),
+        "concurrency": args.concurrency,
+        "deck_kb": round(len(deck) / 1024, 1),
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "seconds": round(elapsed, 2),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
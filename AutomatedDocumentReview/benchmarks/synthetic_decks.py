@@ -0,0 +1,250 @@
+"""
+Synthetic PPTX decks modeled on the bundled "Performance Test Report.pptx".
+
+Slides 1 and 2 are copied from the template; slides 3..N are content slides
+(title, response-time table, observations), so decks of any size exercise the
+same code paths as a real report. Slide 2 can carry embedded results workbooks
+and content slides can reference media (images), like real reports do.
+
+CORPUS_PROFILES describes a small corpus of deck shapes (small, typical, large,
+table-, embedding-, media- and text-heavy) that build_corpus() writes in one go.
+Generation is deterministic, so the same profile always yields the same deck.
+"""
+import io
+import os
+import random
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+TEMPLATE_PPTX = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             "Performance Test Report.pptx")
+
+SLIDE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+SLIDE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+LAYOUT_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+PACKAGE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/package"
+IMAGE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Release row matching the template's Slide 1 / Slide 2 text
+CHECKLIST_ROW = {"Enterprise Release ID": "1998.P03", "Project Name": "Project T - (Prototype)",
+                 "Release": "RLSE1230032323", "Project ID": "P007", "Application ID": "1002",
+                 "Business Application": "MyApplication - XYZ"}
+
+CORPUS_PROFILES = {
+    "small": dict(slides=10),
+    "typical": dict(slides=30, table_rows=20, embeddings=1, media=3),
+    "large": dict(slides=200, table_rows=40, embeddings=2, media=10),
+    "wide_tables": dict(slides=20, table_rows=1000, embeddings=1),
+    "embed_heavy": dict(slides=20, embeddings=8, workbook_rows=2000),
+    "media_heavy": dict(slides=50, embeddings=1, media=40, media_kb=500),
+    "keyword_heavy": dict(slides=100, text_lines=60),
+}
+
+SLIDE_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">'
+    '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+    '{shapes}</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>'
+)
+SHAPE_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr><p:spPr/>'
+    '<p:txBody><a:bodyPr/><a:lstStyle/><a:p><a:r><a:rPr lang="en-US" dirty="0"/><a:t>{text}</a:t></a:r></a:p>'
+    '</p:txBody></p:sp>'
+)
+CELL_XML = ('<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p><a:r><a:rPr lang="en-US" sz="1200" dirty="0"/>'
+            '<a:t>{text}</a:t></a:r></a:p></a:txBody><a:tcPr/></a:tc>')
+TABLE_COLUMNS = ["Transaction Name", "Min", "Avg", "90th Percentile", "Max", "Pass", "Fail"]
+PARAGRAPH_XML = '<a:p><a:r><a:rPr lang="en-US" dirty="0"/><a:t>{text}</a:t></a:r></a:p>'
+NOTE_WORDS = ["transaction", "response", "average", "throughput", "stable", "peak", "load", "server",
+              "latency", "error", "memory", "cpu", "percentile", "baseline", "checkout", "login"]
+WORKBOOK_COLUMNS = ["Transaction Name", "Minimum", "Average", "Maximum", "90 Percent", "Pass", "Fail"]
+
+
+def _inline_cell(ref, value):
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    return f'<c r="{ref}" t="inlineStr"><is><t>{escape(value)}</t></is></c>'
+
+
+def workbook_xlsx(rows=50):
+    """Bytes of a minimal .xlsx holding a LoadRunner-style results sheet with the given number of rows."""
+    columns = "ABCDEFG"
+    sheet_rows = ['<row r="1">' + "".join(_inline_cell(f"{c}1", h) for c, h in zip(columns, WORKBOOK_COLUMNS)) + "</row>"]
+    for i in range(rows):
+        values = [f"T{i:05d}_Submit_Order", 0.21, 0.87, 3.9, 1.42, 1000 + i, 0]
+        r = i + 2
+        sheet_rows.append(f'<row r="{r}">' + "".join(_inline_cell(f"{c}{r}", v) for c, v in zip(columns, values)) + "</row>")
+
+    main_ns = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/></Types>'),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+            'officeDocument" Target="xl/workbook.xml"/></Relationships>'),
+        "xl/workbook.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<workbook xmlns="{main_ns}" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<sheets><sheet name="Results" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+        "xl/_rels/workbook.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+            'worksheet" Target="worksheets/sheet1.xml"/></Relationships>'),
+        "xl/worksheets/sheet1.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{main_ns}">'
+            f'<sheetData>{"".join(sheet_rows)}</sheetData></worksheet>'),
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as workbook:
+        for name, data in parts.items():
+            workbook.writestr(name, data)
+    return buffer.getvalue()
+
+
+def media_png(size_kb, seed):
+    """PNG-signed, incompressible image payload of about size_kb (media parts are stored, never parsed)."""
+    return b"\x89PNG\r\n\x1a\n" + random.Random(seed).randbytes(size_kb * 1024)
+
+
+def table_xml(rows, shape_id):
+    """A graphicFrame holding a transaction response-time table with the given number of data rows."""
+    grid = "".join('<a:gridCol w="1300000"/>' for _ in TABLE_COLUMNS)
+    header = "<a:tr h=\"240000\">" + "".join(CELL_XML.format(text=c) for c in TABLE_COLUMNS) + "</a:tr>"
+    body = []
+    for i in range(rows):
+        cells = [f"T{i:05d}_Submit_Order", "0.21", "0.87", "1.42", "3.90", str(1000 + i), "0"]
+        body.append("<a:tr h=\"240000\">" + "".join(CELL_XML.format(text=c) for c in cells) + "</a:tr>")
+    return (f'<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{shape_id}" name="Transaction Table"/>'
+            '<p:cNvGraphicFramePr/><p:nvPr/></p:nvGraphicFramePr><p:xfrm/><a:graphic>'
+            '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+            f'<a:tbl><a:tblPr/><a:tblGrid>{grid}</a:tblGrid>{header}{"".join(body)}</a:tbl>'
+            '</a:graphicData></a:graphic></p:graphicFrame>')
+
+
+def notes_xml(lines, shape_id, seed):
+    """A text box of analysis notes: lines of domain words that the keyword checks must scan past."""
+    rng = random.Random(seed)
+    paragraphs = "".join(PARAGRAPH_XML.format(text=" ".join(rng.choice(NOTE_WORDS) for _ in range(12)))
+                         for _ in range(lines))
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Analysis Notes"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr/><p:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</p:txBody></p:sp>')
+
+
+def content_slide_xml(slide_number, table_rows=0, text_lines=0):
+    shapes = [SHAPE_XML.format(id=2, name="Title1", text=escape(f"Response Time Graphs - Summary {slide_number}"))]
+    if table_rows:
+        shapes.append(table_xml(table_rows, 3))
+    if text_lines:
+        shapes.append(notes_xml(text_lines, 5, seed=slide_number))
+    shapes.append(SHAPE_XML.format(id=4, name="Observations",
+                                   text="Observations: 90th percentile within SLA, no issues noted."))
+    return SLIDE_XML.format(shapes="".join(shapes))
+
+
+def _relationships_xml(relationships):
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(f'<Relationship Id="{rel_id}" Type="{rel_type}" Target="{target}"/>'
+                      for rel_id, rel_type, target in relationships)
+            + '</Relationships>')
+
+
+def build_deck(output_path, slides=50, table_rows=0, embeddings=0, media=0, workbook_rows=50, media_kb=200,
+               text_lines=0):
+    """
+    Writes a synthetic report deck.
+
+    :param output_path: Destination .pptx path.
+    :param slides: Total slide count (slides 1 and 2 come from the template).
+    :param table_rows: Data rows in the response-time table of every content slide (0 = no table).
+    :param embeddings: Results workbooks (.xlsx) embedded on Slide 2.
+    :param media: Images spread over the content slides.
+    :param workbook_rows: Transaction rows in each embedded workbook.
+    :param media_kb: Size of each image.
+    :param text_lines: Lines of analysis notes on every content slide (keyword-heavy text).
+    :return: output_path
+    """
+    with zipfile.ZipFile(TEMPLATE_PPTX) as template:
+        parts = {name: template.read(name) for name in template.namelist()
+                 if not re.match(r"ppt/slides/(_rels/)?slide([3-9]|\d\d+)\.xml", name)}
+
+    # Register slides 3..N with the package, the presentation and its relationships
+    content_types = parts["[Content_Types].xml"].decode("utf-8")
+    presentation = parts["ppt/presentation.xml"].decode("utf-8")
+    presentation_rels = parts["ppt/_rels/presentation.xml.rels"].decode("utf-8")
+    content_types = re.sub(r'<Override PartName="/ppt/slides/slide([3-9]|\d\d+)\.xml"[^>]*/>', "", content_types)
+    presentation_rels = re.sub(r'<Relationship Id="[^"]+" Type="[^"]+/slide" Target="slides/slide([3-9]|\d\d+)\.xml"/>',
+                               "", presentation_rels)
+    slide_ids = re.search(r"<p:sldIdLst>(.*?)</p:sldIdLst>", presentation).group(1)
+    kept_ids = "".join(re.findall(r'<p:sldId id="\d+" r:id="rId[23]"/>', slide_ids))
+
+    overrides, relationships, ids = [], [], [kept_ids]
+    for n in range(3, slides + 1):
+        rel_id = f"rIdSlide{n}"
+        overrides.append(f'<Override PartName="/ppt/slides/slide{n}.xml" ContentType="{SLIDE_CONTENT_TYPE}"/>')
+        relationships.append(f'<Relationship Id="{rel_id}" Type="{SLIDE_REL_TYPE}" Target="slides/slide{n}.xml"/>')
+        ids.append(f'<p:sldId id="{255 + n}" r:id="{rel_id}"/>')
+    for extension, content_type in (("xlsx", XLSX_CONTENT_TYPE), ("png", "image/png")):
+        if f'Extension="{extension}"' not in content_types:
+            overrides.append(f'<Default Extension="{extension}" ContentType="{content_type}"/>')
+    parts["[Content_Types].xml"] = content_types.replace("</Types>", "".join(overrides) + "</Types>").encode("utf-8")
+    parts["ppt/_rels/presentation.xml.rels"] = presentation_rels.replace(
+        "</Relationships>", "".join(relationships) + "</Relationships>").encode("utf-8")
+    parts["ppt/presentation.xml"] = presentation.replace(
+        slide_ids, "".join(ids)).encode("utf-8")
+
+    # Embedded results workbooks hang off Slide 2; images are spread over the content slides
+    layout = ("rId1", LAYOUT_REL_TYPE, "../slideLayouts/slideLayout2.xml")
+    slide2_rels = [layout]
+    for k in range(1, embeddings + 1):
+        slide2_rels.append((f"rIdEmbed{k}", PACKAGE_REL_TYPE, f"../embeddings/Microsoft_Excel_Worksheet{k}.xlsx"))
+        parts[f"ppt/embeddings/Microsoft_Excel_Worksheet{k}.xlsx"] = workbook_xlsx(workbook_rows)
+    parts["ppt/slides/_rels/slide2.xml.rels"] = _relationships_xml(slide2_rels).encode("utf-8")
+
+    content_slide_rels = {n: [layout] for n in range(3, slides + 1)}
+    for k in range(1, media + 1):
+        parts[f"ppt/media/image{k}.png"] = media_png(media_kb, seed=k)
+        if content_slide_rels:
+            slide_number = 3 + (k - 1) % len(content_slide_rels)
+            content_slide_rels[slide_number].append((f"rIdImage{k}", IMAGE_REL_TYPE, f"../media/image{k}.png"))
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as deck:
+        for name, data in parts.items():
+            # Media is stored, as PowerPoint does for already-compressed images
+            deck.writestr(name, data, zipfile.ZIP_STORED if name.startswith("ppt/media/") else zipfile.ZIP_DEFLATED)
+        for n in range(3, slides + 1):
+            deck.writestr(f"ppt/slides/slide{n}.xml", content_slide_xml(n, table_rows, text_lines))
+            deck.writestr(f"ppt/slides/_rels/slide{n}.xml.rels", _relationships_xml(content_slide_rels[n]))
+    return output_path
+
+
+def build_corpus(output_dir, profiles=None):
+    """
+    Writes one deck per corpus profile (reusing decks already in output_dir).
+
+    :param output_dir: Folder for the decks (created if needed).
+    :param profiles: {name: build_deck keyword arguments}; default CORPUS_PROFILES.
+    :return: {profile name: deck path}, in profile order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    decks = {}
+    for name, options in (profiles or CORPUS_PROFILES).items():
+        deck_path = os.path.join(output_dir, f"{name}.pptx")
+        if not os.path.exists(deck_path):
+            build_deck(deck_path, **options)
+        decks[name] = deck_path
+    return decks
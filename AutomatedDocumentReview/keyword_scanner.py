@@ -0,0 +1,157 @@
+"""
+One-pass multi-keyword matching for the slide checks.
+
+A KeywordScanner compiles every keyword of a rule set (e.g. the Slide 3..N title
+and observation keywords) into one regex, so a slide's text is scanned once
+however many keywords there are, instead of once per keyword:
+
+    scanner = KeywordScanner({"title": ["title", "chart"], "observation": ["observation", "issue"]})
+    scanner.scan("chart of observations")
+    # [KeywordHit(keyword="chart", group="title", start=0, end=5),
+    #  KeywordHit(keyword="observation", group="observation", start=9, end=20)]
+
+The regex is the keyword trie written out as nested groups ("chart|check" becomes
+"ch(?:art|eck)"), so each position of the text costs a walk down the trie rather
+than one attempt per keyword; a plain "kw1|kw2|..." alternation is slower than
+separate `in` tests once there are more than a handful of keywords. The trie sits
+in a lookahead and prefers the longest keyword, so every position where a keyword
+starts is found, overlapping hits included. Shorter keywords starting at the same
+position are prefixes of the longest one and are added from a table built at
+compile time, so no hit is lost.
+
+The regex only pays off for large keyword sets: Python's re tries the trie at
+every position of the text, while `keyword in text` runs a fast substring
+search per keyword. Sets of up to FIND_MAX_KEYWORDS keywords (the default rules
+have about a dozen) are therefore scanned with str.find instead, one window of
+FIND_WINDOW characters at a time, so a text without any hit costs no more than
+one `in` test per keyword, and an early hit stops the scan after the first window.
+contains_any() and groups_found() on such a set are a plain `in` test per keyword,
+in the order of the rules, stopping at the first keyword found.
+
+Keywords are lower-cased; scan lower-cased text.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+KeywordHit = namedtuple("KeywordHit", "keyword group start end")
+
+WORD_BOUNDARY_RE = re.compile(r"\b")
+FIND_MAX_KEYWORDS = 64  # Up to this many keywords, per-keyword str.find beats the trie regex
+FIND_WINDOW = 2048      # Characters searched per round of str.find calls
+
+
+def trie_pattern(keywords):
+    """Regex source matching any of the keywords, longest first, with common prefixes factored out."""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of a keyword
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?" if len(branches) == 1 else body + "?"  # Greedy: the longer keyword first
+        return body
+
+    return build(trie)
+
+
+class KeywordScanner:
+    """
+    Keyword groups compiled into a single regex.
+
+    :param groups: {group name: [keywords]}; a keyword may belong to several groups.
+    :param whole_word: Only match keywords between word boundaries (\\b...\\b).
+    """
+
+    def __init__(self, groups, whole_word=False):
+        self.whole_word = whole_word
+        self.groups = [group for group, keywords in groups.items() if any(keywords)]
+        self._groups = {}  # keyword -> [group names], in the order of the rules
+        self._group_keywords = {group: [] for group in self.groups}  # group name -> [keywords]
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword and group not in self._groups.setdefault(keyword, []):
+                    self._groups[keyword].append(group)
+                    self._group_keywords[group].append(keyword)
+
+        keywords = sorted(self._groups, key=len)
+        self._find_keywords = keywords if len(keywords) <= FIND_MAX_KEYWORDS else None
+        self._prefixes = {keyword: [k for k in keywords if keyword.startswith(k)] for keyword in keywords}
+        boundary = r"\b" if whole_word else ""
+        self.pattern = re.compile(rf"(?=({boundary}(?:{trie_pattern(keywords)}){boundary}))") if keywords else None
+
+    def iter_hits(self, text):
+        """
+        The keyword hits of the text, in order of position (shorter keywords first at the same
+        position). The text is scanned as the hits are consumed, so a caller that has its answer
+        can stop early.
+        """
+        if self.pattern is None or not text:
+            return
+        if self._find_keywords is not None:
+            yield from self._iter_hits_find(text)
+            return
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            for keyword in self._prefixes[match.group(1)]:
+                end = start + len(keyword)
+                if self.whole_word and not WORD_BOUNDARY_RE.match(text, end):
+                    continue
+                for group in self._groups[keyword]:
+                    yield KeywordHit(keyword, group, start, end)
+
+    def _iter_hits_find(self, text):
+        """iter_hits for small keyword sets: str.find per keyword, one window of the text at a time."""
+        for window_start in range(0, len(text), FIND_WINDOW):
+            window_end = window_start + FIND_WINDOW
+            found = []
+            for keyword in self._find_keywords:
+                end = window_end + len(keyword) - 1  # Hits starting in the window
+                start = text.find(keyword, window_start, end)
+                while start != -1:
+                    found.append((start, len(keyword), keyword))
+                    start = text.find(keyword, start + 1, end)
+            found.sort()  # By position, shorter keywords first
+            for start, length, keyword in found:
+                if self.whole_word and not (WORD_BOUNDARY_RE.match(text, start)
+                                            and WORD_BOUNDARY_RE.match(text, start + length)):
+                    continue
+                for group in self._groups[keyword]:
+                    yield KeywordHit(keyword, group, start, start + length)
+
+    def scan(self, text):
+        """Every keyword hit in the text, in order of position."""
+        return list(self.iter_hits(text))
+
+    def contains_any(self, text):
+        """Whether any keyword occurs in the text (the scan stops at the first hit)."""
+        if self._find_keywords is not None and not self.whole_word:
+            return any(keyword in text for keyword in self._groups)
+        return next(self.iter_hits(text), None) is not None
+
+    def groups_found(self, text):
+        """Names of the groups with at least one hit in the text (the scan stops once every group is found)."""
+        if self._find_keywords is not None and not self.whole_word:
+            # ⚡ Small sets: one substring test per keyword, each group stops at its first keyword found
+            return {group for group, keywords in self._group_keywords.items()
+                    if any(keyword in text for keyword in keywords)} if text else set()
+        found = set()
+        for hit in self.iter_hits(text):
+            found.add(hit.group)
+            if len(found) == len(self.groups):
+                break
+        return found
+
+
+@lru_cache(maxsize=1024)
+def whole_word_scanner(**groups):
+    """Cached whole-word KeywordScanner for per-release values, e.g. whole_word_scanner(project=(name,))."""
+    return KeywordScanner(groups, whole_word=True)
@@ -1,6 +1,9 @@
 import os
+import importlib
 import streamlit as st
 import base64
+from functools import lru_cache
+from session_store import default_store
 
 # ✅ Set Page Title & Layout
 st.set_page_config(page_title="Validation App", layout="wide", page_icon="📊")
@@ -106,7 +109,8 @@ st.markdown(custom_css, unsafe_allow_html=True)
 
 
 
-# Function to encode an image to Base64
+# Function to encode an image to Base64 (read once per process, not on every rerun)
+@lru_cache(maxsize=8)
 def get_base64_image(image_path):
     with open(image_path, "rb") as img_file:
         return base64.b64encode(img_file.read()).decode()
@@ -146,12 +150,14 @@ selected_page = st.sidebar.radio("Go to:", ["🏠 Home", "📊 PPT Review", "
 # **Get the absolute path of the "pages" folder**
 pages_dir = os.path.join(os.path.dirname(__file__), "pages")
 
-# **Dynamically load the selected script**
+# **Load the selected page module and render it**
+# Pages are imported once per process (sys.modules caches them), so their imports,
+# compiled rules and release catalog are set up once; each rerun only calls render().
 def load_page(script_name):
     script_path = os.path.join(pages_dir, script_name)
-    if os.path.exists(script_path):  # Check if the file exists before executing
-        with open(script_path, "r", encoding="utf-8") as file:
-            exec(file.read(), globals())  # Execute the script content safely
+    if os.path.exists(script_path):  # Check if the file exists before importing
+        page = importlib.import_module(f"pages.{os.path.splitext(script_name)[0]}")
+        page.render()
     else:
         st.error(f"🚨 Error: `{script_name}` not found in `pages/` folder.")
 
@@ -167,4 +173,11 @@ elif selected_page == "📝 Word Review":
     load_page("uiword.py")
 
 elif selected_page == "\U0001F4C2 Document Upload":
-    load_page("uiupload.py")
\ No newline at end of file
+    load_page("uiupload.py")
+
+# 🧠 Memory gauge: values kept for all sessions in the shared store (drawn after the page has updated it)
+store_stats = default_store.stats()
+st.sidebar.progress(min(store_stats["bytes"] / store_stats["max_bytes"], 1.0),
+                    text=f"🧠 Session store: {store_stats['bytes'] / 1024 / 1024:.1f} of "
+                         f"{store_stats['max_bytes'] / 1024 / 1024:.0f} MB · {store_stats['entries']} values · "
+                         f"{store_stats['evictions']} evicted")
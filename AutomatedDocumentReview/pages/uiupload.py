@@ -1,6 +1,11 @@
 import streamlit as st
 import os
+import zipfile
 import pandas as pd
+from release_catalog import SAMPLE_RELEASES_FILE, load_catalog
+from release_updates import (DEFAULT_MERGE_KEY, CatalogSchemaError, merge_releases, published_versions,
+                             replace_releases)
+from zip_budget import ZipBudgetError
 
 
 # Define the config folder
@@ -14,27 +19,62 @@ def upload_sample_releases():
     # Description with heading and larger text
     st.header("Welcome to the Sample Releases Upload Page!")
     st.markdown(
-        '<p style="font-size:18px;">Here, you can upload an Excel file containing sample release data. '
-        'Once uploaded, click <b>Submit</b> to save the file.</p>',
+        '<p style="font-size:18px;">Here, you can upload an Excel file containing sample release data: '
+        'only the new and changed releases, merged by key, or the complete catalog. '
+        'Once uploaded, click <b>Submit</b> to publish it as a new version.</p>',
         unsafe_allow_html=True
     )
 
+    catalog_exists = os.path.exists(SAMPLE_RELEASES_FILE)
+    modes = ["🔀 Merge new and changed releases", "📄 Replace the whole catalog"]
+    mode = st.radio("Upload type", modes if catalog_exists else modes[1:], horizontal=True)
+    merge = mode == modes[0]
+    if merge:
+        columns = load_catalog(SAMPLE_RELEASES_FILE).columns
+        key_columns = st.multiselect("Key columns (identify a release)", columns,
+                                     default=[column for column in DEFAULT_MERGE_KEY if column in columns])
+        st.caption("ℹ️ A merge publishes the catalog as a plain single-sheet workbook: formatting and other "
+                   "sheets are not kept (numbers stay numbers). Replace the whole catalog to keep them.")
 
-    uploaded_file = st.file_uploader("Choose an Excel file to upload", type=["xlsx", "xls"])
+    uploaded_file = st.file_uploader("Choose an Excel file to upload", type=["xlsx"])
 
+    # The uploader widget holds the file until it is removed; nothing is copied into session state
     if uploaded_file is not None:
-        # Store the file temporarily
-        st.session_state["uploaded_file"] = uploaded_file  # Store in session state
         st.success("File selected! Click 'Submit' to save.")
-    
-    # Submit button
-    if "uploaded_file" in st.session_state:
+
+        # Submit button
         if st.button("✅ Submit"):
-            file_path = os.path.join(CONFIG_FOLDER, "SampleReleases.xlsx")
-            with open(file_path, "wb") as f:
-                f.write(st.session_state["uploaded_file"].getbuffer())
+            try:
+                with st.spinner("Checking and publishing the catalog..."):
+                    if merge:
+                        version = merge_releases(uploaded_file.getvalue(), key_columns)
+                    else:
+                        version = replace_releases(uploaded_file.getvalue())
+            except CatalogSchemaError as exc:
+                st.error(f"❌ The upload does not match the catalog: {exc}")
+            except (ZipBudgetError, zipfile.BadZipFile, KeyError) as exc:
+                st.error(f"❌ The file cannot be read: {exc}")
+            else:
+                if version["version"] is None:
+                    st.info(f"ℹ️ No changes: the {version['unchanged']} uploaded releases match the catalog.")
+                else:
+                    changes = f"{version['added']} added, {version['updated']} updated, " \
+                              f"{version['unchanged']} unchanged" if merge else "full replacement"
+                    st.success(f"✅ Published catalog version {version['version']} ({version['rows']} releases; "
+                               f"{changes}). Open pages switch to it on their next refresh.")
+                    st.toast("Upload completed! 🎉")
+
+    # 🕒 Published versions (kept in config/versions)
+    versions = published_versions()
+    if versions:
+        st.subheader("🕒 Published Versions")
+        st.dataframe(pd.DataFrame(versions, columns=["version", "published", "mode", "rows", "added", "updated",
+                                                     "unchanged", "file"]), hide_index=True)
+
+def render():
+    """Entry point called by main.py on every rerun."""
+    upload_sample_releases()
 
-            st.success("File uploaded successfully and saved in the config folder!")
-            st.toast("Upload completed! 🎉")
 
-upload_sample_releases()
\ No newline at end of file
+if __name__ == "__main__":
+    render()
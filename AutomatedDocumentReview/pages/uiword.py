@@ -0,0 +1,89 @@
+import streamlit as st
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+from word_validator import validate_docx
+from zip_budget import ZipBudgetError
+from ppt_validator import excel_report_bytes
+from release_catalog import load_catalog
+from release_grid import release_grid
+from session_store import default_store
+
+
+# Define the path for the config file (assumes it's in a "config" folder next to the script)
+CONFIG_FOLDER = os.path.join(os.getcwd(), "config")
+SAMPLE_RELEASES_FILE = os.path.join(CONFIG_FOLDER,'SampleReleases.xlsx')
+
+
+def render():
+    """Draws the Word review page. Called by main.py on every rerun; module-level setup runs once per process."""
+    st.markdown(
+        """
+        <style>
+            .block-container { padding-top: 3.0rem; } /* Reduce top padding */
+        </style>
+        """,
+        unsafe_allow_html=True
+    )
+
+    # Streamlit UI
+    st.title("📝 Test Strategy Validation Application - Word Format")
+
+    # Load Sample Releases (SQLite snapshot, cached process-wide until the workbook changes)
+    release_catalog = load_catalog(SAMPLE_RELEASES_FILE)
+
+    # Display the table for selection (one page at a time, queried from the catalog)
+    st.subheader("📋 Select a Release for Validation")
+    selected_release = release_grid(release_catalog, "word_releases")
+
+    # File Upload Section
+    st.subheader("📂 Upload Word Document")
+    uploaded_docx = st.file_uploader("Upload DOCX File", type=["docx"])
+
+    # Button to trigger validation
+    if "word_validation_results" not in st.session_state:
+        st.session_state.word_validation_results = None
+
+
+    # 📌 Layout for Validate button & Export button side by side
+    col1, col2 = st.columns([0.8, 0.2])  # Adjust width ratio to align buttons properly
+
+
+    if uploaded_docx is not None and selected_release is not None:
+        selected_row_data = selected_release
+        with col1:
+            if st.button("✅ Validate Document"):
+                # Validate straight from the uploaded buffer (single streamed pass over word/document.xml)
+                try:
+                    word_validation_results = validate_docx(uploaded_docx, selected_row_data)
+                except (ZipBudgetError, zipfile.BadZipFile, ET.ParseError) as exc:
+                    st.error(f"❌ The document cannot be validated: {exc}")
+                except KeyError:
+                    st.error("❌ The file is not a Word document: word/document.xml is missing.")
+                else:
+                    # The session keeps a handle; the results live in the shared, bounded store
+                    default_store.discard(st.session_state.word_validation_results)
+                    st.session_state.word_validation_results = default_store.put(word_validation_results)
+
+                    # Display results
+                    st.subheader("✅ Validation Results")
+                    for section, result in word_validation_results.items():
+                        st.write(f"### {section}")
+                        for key, value in result.items():
+                            st.write(f"**{key}:** {value}")
+                    st.toast("✅ Validation Completed!")
+
+
+    # Generate & Download Excel Report
+    with col2:
+        report_results = default_store.get(st.session_state.word_validation_results)  # None once evicted
+        st.download_button(
+            label="📥 Download Validation Report",
+            data=lambda: excel_report_bytes(report_results),  # ⚡ Built on click, memoized per results
+            file_name="Word_Validation_Report.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+
+
+if __name__ == "__main__":
+    render()
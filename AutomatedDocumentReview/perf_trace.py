@@ -0,0 +1,171 @@
+"""
+Per-stage timing spans for the validators.
+
+A Trace collects spans (stage, start, duration, bytes read, attributes such as
+the slide) for one validation. Instrumented code calls span("xml_parse", slide=3),
+which costs nothing unless a trace is active in the current context:
+
+    trace = Trace("validate_ppt", file="report.pptx")
+    with trace.activate():
+        results = validate_ppt(pptx_bytes, checklist_row)
+    trace.summary()       # {stage: {"count", "ms", "bytes"}}
+    trace.write_jsonl()   # one JSON line in logs/performance.jsonl
+
+Stages nest (a "slide" span contains its "zip_io", "xml_parse" and "keyword_match"
+spans), so stage totals overlap and only the outermost span adds up to the total.
+The active trace is held in a context variable: work handed to a thread or
+process pool is recorded as one span around the pool, not per slide.
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+PERF_LOG_FILE = os.path.join(os.getcwd(), "logs", "performance.jsonl")
+LOG_SPAN_DEPTH = 1  # Spans nested deeper than this are only logged through the stage totals
+
+_active_trace = contextvars.ContextVar("active_trace", default=None)
+
+
+class Trace:
+    """
+    Timing spans of one traced operation.
+
+    :param name: What is traced (e.g. "validate_ppt", "excel_report").
+    :param attributes: Extra fields for the log line (file name, release, ...).
+    """
+
+    def __init__(self, name, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self.started_at = datetime.now()
+        self.spans = []
+        self.bytes_read = 0
+        self._origin = time.perf_counter()
+        self._depth = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self):
+        """Makes this the trace that span() / add_bytes() report to, for the current context."""
+        token = _active_trace.set(self)
+        try:
+            yield self
+        finally:
+            _active_trace.reset(token)
+
+    def add_bytes(self, count):
+        with self._lock:
+            self.bytes_read += count
+
+    def record(self, stage, seconds, bytes_read=0, started=None, **attributes):
+        """Adds a span measured by the caller (e.g. time spent inside a wrapped reader)."""
+        if started is None:
+            started = time.perf_counter() - seconds
+        with self._lock:
+            self.bytes_read += bytes_read
+            self.spans.append({"stage": stage, "start_ms": round((started - self._origin) * 1000, 3),
+                               "ms": round(seconds * 1000, 3), "bytes": bytes_read,
+                               "depth": self._depth, **attributes})
+
+    @contextmanager
+    def span(self, stage, **attributes):
+        """Times the enclosed block; its bytes are the bytes read while it ran."""
+        started = time.perf_counter()
+        bytes_before = self.bytes_read
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.spans.append({"stage": stage, "start_ms": round((started - self._origin) * 1000, 3),
+                                   "ms": round(elapsed * 1000, 3), "bytes": self.bytes_read - bytes_before,
+                                   "depth": self._depth, **attributes})
+
+    @property
+    def total_ms(self):
+        """Duration of the outermost spans (wall time of the traced work)."""
+        return round(sum(span["ms"] for span in self.spans if span["depth"] == 0), 3)
+
+    def summary(self):
+        """Per-stage totals, in the order the stages first finished."""
+        stages = {}
+        for span in self.spans:
+            stage = stages.setdefault(span["stage"], {"count": 0, "ms": 0.0, "bytes": 0})
+            stage["count"] += 1
+            stage["ms"] += span["ms"]
+            stage["bytes"] += span["bytes"]
+        for stage in stages.values():
+            stage["ms"] = round(stage["ms"], 3)
+        return stages
+
+    def slide_timings(self):
+        """The per-slide spans: [{"slide", "ms", "bytes"}, ...] in slide order."""
+        slides = [span for span in self.spans if span["stage"] == "slide"]
+        return [{"slide": span.get("slide"), "ms": span["ms"], "bytes": span["bytes"]}
+                for span in sorted(slides, key=lambda span: span["start_ms"])]
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "started_at": self.started_at.isoformat(timespec="milliseconds"),
+            **self.attributes,
+            "total_ms": self.total_ms,
+            "bytes_read": self.bytes_read,
+            "stages": self.summary(),
+            "slides": self.slide_timings(),
+            "spans": [span for span in self.spans if span["depth"] <= LOG_SPAN_DEPTH and span["stage"] != "slide"],
+        }
+
+    def write_jsonl(self, path=PERF_LOG_FILE):
+        """Appends the trace as one JSON line (created on first use) for offline analysis."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        line = json.dumps(self.to_dict(), ensure_ascii=False, default=str)
+        with open(path, "a", encoding="utf-8") as log_file:
+            log_file.write(line + "\n")
+
+
+def current_trace():
+    """The trace active in this context, or None."""
+    return _active_trace.get()
+
+
+@contextmanager
+def span(stage, **attributes):
+    """Times the enclosed block on the active trace; a no-op when nothing is traced."""
+    trace = _active_trace.get()
+    if trace is None:
+        yield
+        return
+    with trace.span(stage, **attributes):
+        yield
+
+
+def add_bytes(count):
+    trace = _active_trace.get()
+    if trace is not None:
+        trace.add_bytes(count)
+
+
+class TimedReader:
+    """
+    Wraps a file object and accumulates the time and bytes spent in read(), so the
+    decompression of a streamed zip member can be told apart from the parser consuming it.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.seconds = 0.0
+        self.bytes = 0
+
+    def read(self, size=-1):
+        started = time.perf_counter()
+        data = self.raw.read(size)
+        self.seconds += time.perf_counter() - started
+        self.bytes += len(data)
+        return data
@@ -0,0 +1,920 @@
+"""
+PPTX extraction and validation engine.
+
+Pure Python (no Streamlit) so the same rules run from the PPT Review page,
+the batch CLI and any other headless caller.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import posixpath
+import re
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+
+import pandas as pd
+from openpyxl import Workbook
+
+from keyword_scanner import whole_word_scanner
+from perf_trace import TimedReader, add_bytes, current_trace, span
+from rules import load_ruleset, normalize_header
+from workbook_reader import XlsxStreamReader, iterparse_released
+from zip_budget import ZipBudget, is_skipped, open_budgeted_zip
+
+
+# Namespaced tags used by the streaming slide parser
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+TAG_SP = f"{{{P_NS}}}sp"
+TAG_NV_SP_PR = f"{{{P_NS}}}nvSpPr"
+TAG_C_NV_PR = f"{{{P_NS}}}cNvPr"
+TAG_TEXT = f"{{{A_NS}}}t"
+TAG_TABLE = f"{{{A_NS}}}tbl"
+TAG_ROW = f"{{{A_NS}}}tr"
+TAG_CELL = f"{{{A_NS}}}tc"
+
+# Package-level parts used to resolve embedded objects
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+TAG_CT_DEFAULT = f"{{{CT_NS}}}Default"
+TAG_CT_OVERRIDE = f"{{{CT_NS}}}Override"
+TAG_RELATIONSHIP = f"{{{REL_NS}}}Relationship"
+
+
+class SlideContent:
+    """Everything the validators need from one slide, collected in a single pass."""
+
+    def __init__(self, shapes, text, tables):
+        self.shapes = shapes  # {shape name: joined text}, as returned by extract_named_shapes
+        self.text = text      # all text runs joined with spaces, as returned by extract_text_from_slide
+        self.tables = tables  # [[[cell, ...], ...], ...], as returned by extract_tables_from_slide
+
+
+def parse_slide_xml(source):
+    """
+    Streams a slide XML part with iterparse and collects shape names, text runs and table cells.
+
+    Every element is dropped from the tree once its end tag has been handled (iterparse_released),
+    so slides carrying large generated tables are never held in memory as a full DOM.
+
+    Args:
+        source: A file-like object (or path) containing the slide XML.
+
+    Returns:
+        SlideContent: The named shape texts, the full slide text and the tables of the slide.
+    """
+    shapes = {}
+    texts = []
+    tables = []
+
+    shape_texts = None      # Text runs of the <p:sp> currently open
+    shape_name = None
+    name_seen = False       # Only the first <p:nvSpPr>/<p:cNvPr> of a shape names it
+    in_nv_sp_pr = False
+    table = row = None
+    cell_text = None
+    in_cell = False
+
+    for event, elem in iterparse_released(source, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == TAG_SP:
+                shape_texts, shape_name, name_seen = [], None, False
+            elif tag == TAG_NV_SP_PR:
+                in_nv_sp_pr = True
+            elif tag == TAG_TABLE:
+                table = []
+            elif tag == TAG_ROW and table is not None:
+                row = []
+            elif tag == TAG_CELL and row is not None:
+                in_cell, cell_text = True, None
+            continue
+
+        if tag == TAG_TEXT:
+            text = elem.text
+            if text:
+                texts.append(text)
+                if shape_texts is not None:
+                    shape_texts.append(text)
+            if in_cell and cell_text is None:
+                cell_text = text.strip() if text else ""  # ✅ First text run of the cell only
+        elif tag == TAG_C_NV_PR:
+            if in_nv_sp_pr and shape_texts is not None and not name_seen:
+                name_seen = True
+                shape_name = elem.attrib.get("name")
+        elif tag == TAG_NV_SP_PR:
+            in_nv_sp_pr = False
+        elif tag == TAG_CELL and row is not None:
+            row.append(cell_text if cell_text is not None else "")
+            in_cell = False
+        elif tag == TAG_ROW and row is not None:
+            table.append(row)
+            row = None
+        elif tag == TAG_TABLE:
+            tables.append(table)
+            table = None
+        elif tag == TAG_SP:
+            if shape_name is not None:
+                shapes[shape_name] = " ".join(shape_texts)
+            shape_texts = None
+
+    return SlideContent(shapes, " ".join(texts).strip(), tables)
+
+
+class PptxPackage:
+    """
+    Opens a PPTX (zip) archive once and serves every extractor from the same parsed view.
+
+    The central directory is read a single time and indexed by member name, and each
+    slide XML part is parsed at most once, so validating an N-slide deck no longer
+    reopens the archive and rescans ``namelist()`` for every extractor call.
+
+    The source may be a file path, the raw PPTX bytes or a seekable file-like object
+    (e.g. Streamlit's UploadedFile), so uploads are validated without a temp file.
+
+    Every read goes through a zip_budget.ZipBudget (member count, part size, compression
+    ratio and total inflated bytes), and media parts are left out of the member index, so
+    they are never read.
+
+    :raises zip_budget.ZipBudgetError: When the deck (or a part read later) exceeds the budget.
+    """
+
+    def __init__(self, source, budget=None):
+        self.zip_path = source
+        self.budget = budget or ZipBudget()
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = BytesIO(source)  # ✅ BytesIO shares (does not copy) a bytes object
+        with span("zip_open"):
+            self._zip = open_budgeted_zip(source, self.budget, "The deck")
+            # ✅ Index members once (media is never needed by the validators)
+            self.members = {info.filename: info for info in self._zip.infolist() if not is_skipped(info.filename)}
+        self._slide_contents = {}
+        self._content_types = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._zip.close()
+
+    def has_member(self, name):
+        return name in self.members
+
+    def read(self, name):
+        with span("zip_io", part=name):
+            data = self.budget.read(self._zip, self.members[name])
+        add_bytes(len(data))
+        return data
+
+    def open(self, name):
+        return self.budget.open(self._zip, self.members[name])
+
+    def names_with_prefix(self, prefix):
+        return [name for name in self.members if name.startswith(prefix)]
+
+    @property
+    def total_slides(self):
+        return len([f for f in self.members if f.startswith("ppt/slides/slide") and f.endswith(".xml")])
+
+    def content_type(self, part_name):
+        """Content type of a part from [Content_Types].xml (Override first, then Default by extension)."""
+        if self._content_types is None:
+            overrides, defaults = {}, {}
+            if "[Content_Types].xml" in self.members:
+                for elem in ET.fromstring(self.read("[Content_Types].xml")):
+                    if elem.tag == TAG_CT_OVERRIDE:
+                        overrides[elem.get("PartName", "").lstrip("/")] = elem.get("ContentType", "")
+                    elif elem.tag == TAG_CT_DEFAULT:
+                        defaults[elem.get("Extension", "").lower()] = elem.get("ContentType", "")
+            self._content_types = (overrides, defaults)
+        overrides, defaults = self._content_types
+        if part_name in overrides:
+            return overrides[part_name]
+        return defaults.get(posixpath.splitext(part_name)[1].lstrip(".").lower(), "")
+
+    def slide_relationships(self, slide_number):
+        """Internal relationships of a slide as (type, resolved part name) pairs, in .rels order."""
+        rels_path = f"ppt/slides/_rels/slide{slide_number}.xml.rels"
+        if rels_path not in self.members:
+            return []
+        relationships = []
+        for rel in ET.fromstring(self.read(rels_path)).iter(TAG_RELATIONSHIP):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = posixpath.normpath(posixpath.join("ppt/slides", rel.get("Target", "")))
+            relationships.append((rel.get("Type", ""), target))
+        return relationships
+
+    def slide_content(self, slide_number):
+        """Returns the streamed SlideContent of a slide (or None if the slide is missing)."""
+        if slide_number not in self._slide_contents:
+            slide_path = f"ppt/slides/slide{slide_number}.xml"
+            content = None
+            if slide_path in self.members:
+                trace = current_trace()
+                with self.open(slide_path) as f:
+                    if trace is None:
+                        content = parse_slide_xml(f)
+                    else:
+                        # Split the streamed parse into decompression (zip I/O) and XML parsing time
+                        reader = TimedReader(f)
+                        started = time.perf_counter()
+                        content = parse_slide_xml(reader)
+                        elapsed = time.perf_counter() - started
+                        trace.record("zip_io", reader.seconds, reader.bytes, started, part=slide_path)
+                        trace.record("xml_parse", elapsed - reader.seconds, 0, started, slide=slide_number)
+            self._slide_contents[slide_number] = content
+        return self._slide_contents[slide_number]
+
+@contextmanager
+def open_pptx_package(source):
+    """Yields a PptxPackage for a path, bytes or file object, reusing an already open package."""
+    if isinstance(source, PptxPackage):
+        yield source
+    else:
+        with PptxPackage(source) as package:
+            yield package
+
+
+# Extract text from named shapes in a slide
+def extract_named_shapes(zip_path, slide_number):
+    with open_pptx_package(zip_path) as package:
+        content = package.slide_content(slide_number)
+        return dict(content.shapes) if content is not None else {}
+
+# Check if embedded Excel files exist
+def check_embedded_excel(zip_path):
+    with open_pptx_package(zip_path) as package:
+        return any(f.startswith("ppt/embeddings/") and f.endswith(".xlsx") for f in package.members)
+
+
+def extract_tables_from_slide(zip_path, slide_number):
+    """
+    Extracts tables from a given slide in the PowerPoint (.pptx) file.
+
+    Args:
+        zip_path (str | PptxPackage): Path to the PPTX file (as a zip archive) or an open package.
+        slide_number (int): The slide number to extract tables from.
+
+    Returns:
+        list: A list of tables, where each table is a list of rows, and each row is a list of cell values.
+    """
+    with open_pptx_package(zip_path) as package:
+        content = package.slide_content(slide_number)
+        if content is None:
+            return []  # If slide XML is missing, return an empty list
+        return content.tables
+
+# Content types and magic bytes used to recognise embedded spreadsheets
+SPREADSHEET_CONTENT_TYPES = {
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "xlsx",
+    "application/vnd.ms-excel.sheet.macroEnabled.12": "xlsm",
+    "application/vnd.ms-excel": "xls",
+    "text/csv": "csv",
+}
+SPREADSHEET_KINDS = ("xlsx", "xlsm", "xls", "csv")
+ZIP_MAGIC = b"PK\x03\x04"
+OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+
+class EmbeddedObject:
+    """
+    An embedded part (Excel, CSV, OLE object, ...) referenced by a slide.
+
+    Its bytes stay inside the open PptxPackage: the type is worked out on first use from
+    the part's content type or, failing that, from its magic bytes, and nothing is written
+    to disk unless save() is called.
+    """
+
+    def __init__(self, package, part_name):
+        self.package = package
+        self.part_name = part_name
+        self.name = posixpath.basename(part_name)
+        self.size = package.members[part_name].file_size
+        self.saved_path = None
+        self._kind = None
+
+    def open(self):
+        return self.package.open(self.part_name)
+
+    def read(self):
+        return self.package.read(self.part_name)
+
+    @property
+    def kind(self):
+        """"xlsx", "xlsm", "xls", "csv", "ole" or "other"."""
+        if self._kind is None:
+            content_type = self.package.content_type(self.part_name)
+            self._kind = SPREADSHEET_CONTENT_TYPES.get(content_type) or self._sniff_kind()
+        return self._kind
+
+    @property
+    def is_spreadsheet(self):
+        return self.kind in SPREADSHEET_KINDS
+
+    def _sniff_kind(self):
+        with self.open() as f:
+            head = f.read(4096)
+        if head.startswith(ZIP_MAGIC):
+            # An OOXML package: its own [Content_Types].xml says whether it is a workbook
+            try:
+                with open_budgeted_zip(self.read(), self.package.budget, self.name) as inner:
+                    inner_types = self.package.budget.read(inner, "[Content_Types].xml")
+            except (zipfile.BadZipFile, KeyError):
+                return "other"
+            if b"sheet.macroEnabled.main+xml" in inner_types:
+                return "xlsm"
+            if b"spreadsheetml.sheet.main+xml" in inner_types:
+                return "xlsx"
+            return "other"
+        if head.startswith(OLE2_MAGIC):
+            # Excel 97-2003 workbooks carry a "Workbook" (or "Book") stream in the OLE directory
+            data = self.read()
+            if "Workbook".encode("utf-16-le") in data or "Book\x00".encode("utf-16-le") in data:
+                return "xls"
+            return "ole"
+        try:
+            first_line = head.decode("utf-8").splitlines()[0] if head else ""
+        except UnicodeDecodeError:
+            return "other"
+        return "csv" if "," in first_line or ";" in first_line else "other"
+
+    def save(self, output_dir):
+        """Writes the object to output_dir and returns the path (only when a caller asks for it)."""
+        os.makedirs(output_dir, exist_ok=True)
+        self.saved_path = os.path.join(output_dir, self.name)
+        with self.open() as source, open(self.saved_path, "wb") as target:
+            while True:
+                chunk = source.read(1024 * 1024)
+                if not chunk:
+                    break
+                target.write(chunk)
+        return self.saved_path
+
+
+def extract_embedded_files(zip_path, slide_number, output_dir=None):
+    """
+    Resolves the embedded files (Excel, CSV, OLE, ...) of a specific slide through its .rels part.
+
+    The objects are inspected lazily in memory. Nothing is written to disk unless output_dir
+    is given, so concurrent sessions never share an extraction folder.
+
+    :param zip_path: Path to the PPTX zip archive (or an open PptxPackage).
+    :param slide_number: The slide number to check for embedded files.
+    :param output_dir: Optional directory to also save the objects into.
+    :return: List of EmbeddedObject referenced by the slide; when the slide references none,
+             every object under ppt/embeddings/ (as before).
+    """
+    with open_pptx_package(zip_path) as package:
+        slide_parts = []
+        for _, part_name in package.slide_relationships(slide_number):
+            if part_name.startswith("ppt/embeddings/") and package.has_member(part_name) \
+                    and part_name not in slide_parts:
+                slide_parts.append(part_name)
+
+        part_names = slide_parts or package.names_with_prefix("ppt/embeddings/")
+        embedded_objects = [EmbeddedObject(package, part_name) for part_name in part_names]
+
+        if output_dir is not None:
+            for embedded_object in embedded_objects:
+                embedded_object.save(output_dir)
+
+    return embedded_objects
+
+def _is_metric_value(value):
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    try:
+        float(str(value).strip().rstrip("%"))
+        return True
+    except ValueError:
+        return False
+
+
+def check_results_sheet(rows, required_columns, header_scan_rows):
+    """
+    Scans the rows of one sheet for a header row holding every required column, followed by
+    a metric row (a non-empty first required column and a numeric value in the others).
+
+    Stops reading as soon as the metric row is found, so only the top of a large sheet is read.
+
+    :return: None when the sheet is valid, otherwise the reason it is not.
+    """
+    column_index = None
+    best_missing = required_columns
+    for row_number, row in enumerate(rows, start=1):
+        if column_index is None:
+            if row_number > header_scan_rows:
+                break
+            cells = [normalize_header(value) for value in row]
+            missing = [column for column in required_columns if column not in cells]
+            if len(missing) < len(best_missing):
+                best_missing = missing
+            if not missing:
+                column_index = [cells.index(column) for column in required_columns]
+                header_row = row_number
+            continue
+
+        values = [row[i] if i < len(row) else None for i in column_index]
+        if values and values[0] not in (None, "") and \
+                (len(values) == 1 or any(_is_metric_value(v) for v in values[1:] if v not in (None, ""))):
+            return None
+
+    if column_index is None:
+        return f"header columns missing: {', '.join(best_missing)}"
+    return f"no metric rows under the header (row {header_row})"
+
+
+def _iter_workbook_sheets(embedded_object):
+    """Yields (sheet name, row iterator) for an embedded workbook, streaming the rows."""
+    if embedded_object.kind == "csv":
+        with embedded_object.open() as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8-sig", errors="replace", newline="")
+            yield embedded_object.name, csv.reader(text)
+        return
+
+    # Streams each worksheet's XML row by row instead of loading the whole workbook
+    with XlsxStreamReader(embedded_object.read(), budget=embedded_object.package.budget) as workbook:
+        for sheet_name in workbook.sheet_names:
+            yield sheet_name, workbook.iter_rows(sheet_name)
+
+
+def inspect_embedded_workbook(embedded_object, ruleset=None):
+    """
+    Validates the contents of an embedded results workbook (.xlsx/.xlsm/.csv).
+
+    Checks the required sheets, their header columns and that metric rows follow the header.
+    Rows are streamed and reading stops as soon as every check is satisfied.
+
+    :return: (is_valid, message)
+    """
+    ruleset = ruleset or load_ruleset()
+    if embedded_object.kind not in ("xlsx", "xlsm", "csv"):
+        return False, f"⚠️ {embedded_object.name} ({embedded_object.kind}) cannot be inspected"
+
+    required_sheets = {sheet.lower(): sheet for sheet in ruleset.workbook_required_sheets}
+    problems = []
+    try:
+        for sheet_name, rows in _iter_workbook_sheets(embedded_object):
+            if required_sheets and sheet_name.lower() not in required_sheets:
+                continue  # Not one of the sheets we have to check: its rows are never read
+            problem = check_results_sheet(rows, ruleset.workbook_required_columns,
+                                          ruleset.workbook_header_scan_rows)
+            if required_sheets:
+                required_sheets.pop(sheet_name.lower())
+                if problem:
+                    problems.append(f"Sheet '{sheet_name}': {problem}")
+            elif problem is None:
+                return True, f"✅ Valid (Sheet '{sheet_name}' in {embedded_object.name})"
+            else:
+                problems.append(f"Sheet '{sheet_name}': {problem}")
+    except (zipfile.BadZipFile, KeyError, OSError, ValueError) as exc:
+        return False, f"❌ {embedded_object.name} could not be read ({exc})"
+
+    if required_sheets:
+        problems.insert(0, f"Missing sheet(s): {', '.join(required_sheets.values())}")
+    if not problems:
+        return True, f"✅ Valid ({embedded_object.name})"
+    return False, f"❌ {embedded_object.name}: {'; '.join(problems)}"
+
+
+def get_total_slides(pptx_path):
+    """Extracts the total number of slides from a PowerPoint file."""
+    with open_pptx_package(pptx_path) as package:
+        return package.total_slides
+    
+
+# Function to get a slide's display name based on its extracted title
+def get_slide_display_name(slide_number, slide_shapes):
+    """Extract slide title and format slide name dynamically"""
+    default_names = {1: "Title Page", 2: "Observations Slide"}  # Custom names for Slide 1 & 2
+    extracted_title = slide_shapes.get("Title", "").strip()  # Extract the title text
+
+    if slide_number in default_names:
+        return f"Slide {slide_number} - {default_names[slide_number]}"
+    elif extracted_title:
+        return f"Slide {slide_number} - {extracted_title}"  # Use extracted title
+    else:
+        return f"Slide {slide_number}"  # Default fallback if no title
+
+
+def extract_text_from_slide(zip_path, slide_number):
+    with open_pptx_package(zip_path) as package:
+        content = package.slide_content(slide_number)
+        return content.text if content is not None else ""
+
+
+DASH_RE = re.compile(r"\s*[\-–—]\s*")
+SPACE_RE = re.compile(r"\s+")
+DEMO_RE = re.compile(r"\(\s*demo\s*\)")
+
+def normalize_text(text):
+    if text is None:
+        return ""
+    text = str(text).strip()  # Convert to lowercase & strip spaces
+    text = DASH_RE.sub("-", text)  # Replace different dashes with a standard hyphen
+    text = SPACE_RE.sub(" ", text)  # Normalize spaces
+    return text
+
+# Concurrency for the independent slide 3..N checks
+SLIDE_WORKERS = 1            # 1 = sequential; >1 fans the slides out to a pool
+SLIDE_EXECUTOR = "process"   # "process" (parses in parallel) or "thread"
+PARALLEL_MIN_SLIDES = 32     # Below this the pool start-up costs more than it saves
+
+
+def validate_content_slide(slide_text, ruleset=None):
+    """Checks one slide from 3..N for a title and for observations."""
+    ruleset = ruleset or load_ruleset()
+    slide_text = slide_text.strip().lower()
+
+    # The first three non-empty lines, where the title is looked for
+    title_lines = []
+    for line in slide_text.splitlines():
+        line = line.strip()
+        if line:
+            title_lines.append(line)
+            if len(title_lines) == 3:
+                break
+
+    # ⚡ Each scan stops at the first keyword found
+    extracted_title = next((line for line in title_lines if ruleset.title_scanner.contains_any(line)), "")
+    extracted_observations = ruleset.observation_scanner.contains_any(slide_text)
+
+    if not extracted_title and title_lines:
+        extracted_title = title_lines[0]
+
+    return {
+        "Title Found": "✅ Yes" if extracted_title else "❌ No",
+        "Observations Found": "✅ Yes" if extracted_observations else "❌ No",
+        # "Extracted Title": extracted_title
+    }
+
+
+def _validate_slide_xml(slide_xml, ruleset):
+    """Process-pool task: parse one slide part and run the slide 3..N checks on it."""
+    slide_text = parse_slide_xml(BytesIO(slide_xml)).text if slide_xml is not None else ""
+    return validate_content_slide(slide_text, ruleset)
+
+
+def validate_content_slides_parallel(package, slide_numbers, workers, executor="process", ruleset=None):
+    """
+    Runs the slide 3..N checks on a thread or process pool.
+
+    Results are returned in the order of slide_numbers. The process pool only receives the raw
+    slide XML bytes (the archive is read once, here), so parsing runs truly in parallel.
+    """
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda n: validate_content_slide(extract_text_from_slide(package, n), ruleset),
+                                 slide_numbers))
+
+    slide_xmls = []
+    for slide_number in slide_numbers:
+        slide_path = f"ppt/slides/slide{slide_number}.xml"
+        slide_xmls.append(package.read(slide_path) if package.has_member(slide_path) else None)
+
+    chunksize = max(1, len(slide_xmls) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(partial(_validate_slide_xml, ruleset=ruleset), slide_xmls, chunksize=chunksize))
+
+
+# Main validation function
+def validate_ppt(zip_path, checklist_row, slide_workers=None, slide_executor=None, ruleset=None, progress=None,
+                 trace=None):
+    """
+    Validates a PPT test report against the selected checklist (release) row.
+
+    :param zip_path: PPTX file path, bytes, file-like object (e.g. an UploadedFile) or an open PptxPackage.
+    :param checklist_row: Release row (dict or pandas Series) holding the expected values.
+    :param slide_workers: Pool size for slides 3..N (default SLIDE_WORKERS; 1 = sequential).
+    :param slide_executor: "thread" or "process" (default SLIDE_EXECUTOR).
+    :param ruleset: Compiled rules.RuleSet (default: the rules in config/config.xlsx).
+    :param progress: Optional callback progress(slide_key, slide_result, completed, total), called as
+                     each slide's results become available (in slide order).
+    :param trace: Optional perf_trace.Trace that records per-stage and per-slide timing spans
+                  (default: the trace active in the caller's context, if any).
+    :return: Dict of "Slide N" -> {check name: result}, in slide order.
+    """
+    if trace is not None:
+        with trace.activate():
+            return validate_ppt(zip_path, checklist_row, slide_workers, slide_executor, ruleset, progress)
+
+    # ✅ Open the archive once and share the parsed view with every extractor
+    with span("validate_ppt"), open_pptx_package(zip_path) as package:
+        return validate_ppt_package(package, checklist_row, slide_workers, slide_executor, ruleset, progress)
+
+def extract_slide1_text(zip_path):
+    """All shape text of Slide 1 (the project details block), joined with spaces."""
+    # Extract all shape text from Slide 1 (unnamed)
+    slide1_shapes = extract_named_shapes(zip_path, 1)
+    return " ".join(
+        shape_text.strip()
+        for shape_text in slide1_shapes.values()
+        if isinstance(shape_text, str)
+    ).strip()
+
+
+def extract_slide1_fields(zip_path, ruleset=None):
+    """
+    Extracts the release fields (Enterprise Release ID, Project ID, Release, ...) from Slide 1.
+
+    :param zip_path: Path to the PPTX zip archive (or an open PptxPackage).
+    :param ruleset: Compiled rules.RuleSet holding the Slide 1 patterns (default: config/config.xlsx).
+    :return: Dict of field name -> normalized extracted value (only fields that were found).
+    """
+    project_details_text = extract_slide1_text(zip_path)
+
+    ruleset = ruleset or load_ruleset()
+
+    # Extract values using the precompiled patterns (with fallback support)
+    extracted_values = {}
+    with span("regex", slide=1):
+        for key, pattern in ruleset.slide1_patterns.items():
+            match = pattern.search(project_details_text)
+            if match:
+                extracted_values[key] = normalize_text(match.group(1).strip())
+
+    return extracted_values
+
+def validate_slide1(package, checklist_row, ruleset):
+    """Compares the release fields extracted from Slide 1 with the checklist row."""
+    # Required fields to validate
+    required_fields = ruleset.required_fields
+
+    extracted_values = extract_slide1_fields(package, ruleset)
+
+    # Slide 1 validation comparison
+    slide1_results = {}
+    for key, expected_value in checklist_row.items():
+        if key not in required_fields:
+            continue
+        expected_value = normalize_text(str(expected_value).strip())
+        extracted_value = extracted_values.get(key, None)
+
+        if extracted_value is None:
+            slide1_results[key] = f"🚫 Missing (Expected: {expected_value})"
+        elif key == "Application ID":
+            if extracted_value == expected_value.replace("APP-", "").lower():
+                slide1_results[key] = f"✅ Matched (Expected: {expected_value}, Found: APP-{extracted_value})"
+            else:
+                slide1_results[key] = f"❌ Not Matched (Expected: {expected_value}, Found: APP-{extracted_value})"
+        elif key == "Business Application":
+            def normalize_app_name_for_comparison(expected, found):
+                expected_clean = expected.lower().strip()
+                found_clean = found.lower().strip()
+
+                # Allow skipping variations of (DEMO) only in expected (if user put extra info, but not in PPT)
+                if DEMO_RE.search(expected_clean) and not DEMO_RE.search(found_clean):
+                    expected_clean = DEMO_RE.sub("", expected_clean).strip()
+
+                return expected_clean, found_clean
+
+            exp_clean, found_clean = normalize_app_name_for_comparison(expected_value, extracted_value)
+
+            if exp_clean == found_clean:
+                slide1_results[key] = f"✅ Matched (Expected: {expected_value}, Found: {extracted_value})"
+            else:
+                slide1_results[key] = f"❌ Not Matched (Expected: {expected_value}, Found: {extracted_value})"
+        elif extracted_value.lower() == expected_value.lower():
+            slide1_results[key] = f"✅ Matched (Expected: {expected_value}, Found: {extracted_value})"
+        else:
+            slide1_results[key] = f"❌ Not Matched (Expected: {expected_value}, Found: {extracted_value})"
+
+    return slide1_results
+
+
+def validate_slide2(package, checklist_row, ruleset):
+    """Checks Slide 2: project name and release ID in the text, the execution table and the embedded workbook."""
+    slide2_text = extract_text_from_slide(package, 2)
+    slide2_tables = extract_tables_from_slide(package, 2)
+    with span("embedded"):
+        embedded_files = extract_embedded_files(package, 2)
+
+    project_name = checklist_row.get("Project Name", "").strip().lower()
+    release_id = checklist_row.get("Enterprise Release ID", "").strip().lower()
+
+    with span("regex", slide=2):
+        # 🔹 Normalize full text for search
+        slide2_text_normalized = normalize_text(slide2_text.lower())
+
+        # ⚡ Project Name and Release ID are looked up in one scan of the text (whole words)
+        found = whole_word_scanner(project=(normalize_text(project_name),),
+                                   release=(normalize_text(release_id),)).groups_found(slide2_text_normalized)
+
+        # === Title Validation (Search for Project Name in entire text)
+        title_missing = "project" not in found
+
+        # === Summary Validation
+        summary_missing = []
+
+        # 🔹 Validate Release ID presence
+        if "release" not in found:
+            summary_missing.append(f"Release ID '{release_id.upper()}' Not Found")
+
+        # 🔹 Validate Project Name presence
+        if "project" not in found:
+            summary_missing.append(f"Project Name '{project_name.title()}' Not Found")
+
+    # === Table validation (same as before)
+    table_valid = False
+    date_row_valid = False
+
+    for table in slide2_tables:
+        for row_index, row in enumerate(table):
+            if row_index == 0:
+                continue
+
+            first_column_text = row[0].strip().lower() if row and row[0] else ""
+            second_column_text = str(row[1]).strip() if len(row) > 1 else ""
+            third_column_text = str(row[2]).strip() if len(row) > 2 else ""
+
+            if first_column_text in ruleset.test_types:
+                table_valid = True
+
+            if len(second_column_text) > 0 and len(third_column_text) > 0:
+                date_row_valid = True
+
+            if table_valid and date_row_valid:
+                break
+        if table_valid and date_row_valid:
+            break
+
+    table_validation_result = (
+        "✅ Valid" if table_valid and date_row_valid
+        else "❌ Found the Test Type, however, dates are missing." if table_valid
+        else "❌ Test Type is missing. Please validate and correct the Execution Details table."
+    )
+
+    # === Embedded Excel Check (type from content type / magic bytes, first match wins)
+    embedded_workbooks = [embedded_file for embedded_file in embedded_files if embedded_file.is_spreadsheet]
+    has_embedded_excel = bool(embedded_workbooks)
+
+    # === Embedded Workbook Content (first workbook that passes wins; otherwise report the first failure)
+    workbook_content_result = "❌ No Excel file found"
+    with span("embedded"):
+        for position, embedded_workbook in enumerate(embedded_workbooks):
+            workbook_valid, message = inspect_embedded_workbook(embedded_workbook, ruleset)
+            if workbook_valid or position == 0:
+                workbook_content_result = message
+            if workbook_valid:
+                break
+
+    # === Final Slide 2 Validation Result
+    slide2_results = {
+        "Title Validation": "✅ Valid" if not title_missing else "❌ Missing or Incorrect Project Name",
+        "Summary Validation": "✅ Valid" if not summary_missing else f"❌  {', '.join(summary_missing)}",
+        "Table Validation": table_validation_result,
+        "Embedded Excel": "✅ Found" if has_embedded_excel else "❌ No Excel file found",
+        "Embedded Workbook Content": workbook_content_result,
+    }
+    return slide2_results
+
+
+def validate_ppt_package(package, checklist_row, slide_workers=None, slide_executor=None, ruleset=None,
+                         progress=None, reuse=None):
+    """
+    validate_ppt on an open PptxPackage.
+
+    :param reuse: Optional {"Slide N": results} of slides known to be unchanged (see revisions.py);
+                  they are passed through instead of being extracted and validated again.
+    """
+    ruleset = ruleset or load_ruleset()
+    total_slides = get_total_slides(package)
+    reuse = reuse or {}
+    results = {}
+
+    def record(slide_key, slide_result):
+        results[slide_key] = slide_result
+        if progress is not None:
+            progress(slide_key, slide_result, len(results), max(total_slides, 2))
+
+    # === Slide 1 ===
+    if "Slide 1" in reuse:
+        slide1_results = reuse["Slide 1"]
+    else:
+        with span("slide", slide=1):
+            slide1_results = validate_slide1(package, checklist_row, ruleset)
+    record("Slide 1", slide1_results)
+
+    # === Slide 2 ===
+    if "Slide 2" in reuse:
+        slide2_results = reuse["Slide 2"]
+    else:
+        with span("slide", slide=2):
+            slide2_results = validate_slide2(package, checklist_row, ruleset)
+    record("Slide 2", slide2_results)
+
+    # === Slide 3+ ===
+    all_slide_numbers = range(3, total_slides + 1)
+    slide_numbers = [n for n in all_slide_numbers if f"Slide {n}" not in reuse]
+    workers = SLIDE_WORKERS if slide_workers is None else slide_workers
+    if workers > 1 and len(slide_numbers) >= PARALLEL_MIN_SLIDES:
+        with span("content_slides_parallel", slides=len(slide_numbers), workers=workers):
+            slide_results = validate_content_slides_parallel(package, slide_numbers, workers,
+                                                             slide_executor or SLIDE_EXECUTOR, ruleset)
+    else:
+        def check_slide(slide_number):
+            with span("slide", slide=slide_number):
+                slide_text = extract_text_from_slide(package, slide_number)
+                with span("keyword_match", slide=slide_number):
+                    return validate_content_slide(slide_text, ruleset)
+
+        # Lazily, one slide at a time, so progress is reported as each slide completes
+        slide_results = (check_slide(n) for n in slide_numbers)
+
+    # ✅ Merge back in slide order so the results dict (and the Excel report) keep the same layout
+    slide_results = iter(slide_results)
+    for slide_number in all_slide_numbers:
+        slide_key = f"Slide {slide_number}"
+        record(slide_key, reuse[slide_key] if slide_key in reuse else next(slide_results))
+    return results
+
+
+# Excel report layouts
+REPORT_LAYOUT_SHEETS = "sheets"   # One sheet per slide (page), as the report always looked
+REPORT_LAYOUT_SINGLE = "single"   # One "Validation Report" sheet: Slide | Check | Validation Result
+REPORT_CACHE_SIZE = 16            # Memoized report workbooks (by results digest and layout)
+
+_report_cache = OrderedDict()
+_report_cache_lock = threading.Lock()
+
+
+def results_digest(validation_results):
+    """Stable hash of a results dict (slide order included), used to memoize its report."""
+    payload = json.dumps(validation_results or {}, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _report_value(value):
+    return value if value is None or isinstance(value, (str, int, float)) else str(value)
+
+
+def write_excel_report(validation_results, layout=REPORT_LAYOUT_SHEETS):
+    """
+    Builds the report workbook with openpyxl's write-only mode: rows are streamed to the
+    file instead of being kept as cell objects, which matters for 500-slide decks.
+
+    :return: The .xlsx bytes.
+    """
+    workbook = Workbook(write_only=True)
+    if not validation_results:
+        # ✅ Ensure at least one sheet is present
+        sheet = workbook.create_sheet("Summary")
+        sheet.append([None, "Message"])
+        sheet.append([0, "No validation results found"])
+    elif layout == REPORT_LAYOUT_SINGLE:
+        sheet = workbook.create_sheet("Validation Report")
+        sheet.append(["Slide", "Check", "Validation Result"])
+        for slide, result in validation_results.items():
+            for check, value in result.items():
+                sheet.append([slide, check, _report_value(value)])
+    else:
+        for slide, result in validation_results.items():
+            sheet = workbook.create_sheet(slide)
+            sheet.append([None, "Validation Result"])
+            for check, value in result.items():
+                sheet.append([check, _report_value(value)])
+
+    output = BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def excel_report_bytes(validation_results, layout=REPORT_LAYOUT_SHEETS):
+    """
+    The report as .xlsx bytes, built once per distinct results and layout and then served
+    from a small in-process LRU memo (reruns with unchanged results cost one hash).
+    """
+    key = (results_digest(validation_results), layout)
+    with _report_cache_lock:
+        if key in _report_cache:
+            _report_cache.move_to_end(key)
+            return _report_cache[key]
+
+    with span("generate_excel_report", sheets=len(validation_results or {}), layout=layout):
+        report = write_excel_report(validation_results, layout)
+
+    with _report_cache_lock:
+        _report_cache[key] = report
+        while len(_report_cache) > REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+    return report
+
+
+# Generate validation report in Excel
+def generate_excel_report(validation_results, layout=REPORT_LAYOUT_SHEETS):
+    return BytesIO(excel_report_bytes(validation_results, layout))  # ✅ Positioned at the start
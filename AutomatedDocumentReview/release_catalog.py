@@ -0,0 +1,496 @@
+"""
+Release catalog (config/SampleReleases.xlsx) served from a SQLite snapshot.
+
+The first load streams the workbook once into cache/release_catalog/<name>-<sha256>.sqlite,
+where every cell is stored as text so IDs like 2025.3 or 1002 stay verbatim, next to
+a trigram full-text index of each row for the release grid search box. After
+that the catalog is served from a process-wide cache shared by every Streamlit
+session and rerun:
+
+    - same source mtime and size   -> cached ReleaseCatalog, no I/O at all
+    - changed mtime, same sha256   -> cached ReleaseCatalog (file was only touched)
+    - new sha256                   -> existing snapshot for that hash, or a rebuild
+
+Versions published through release_updates come with their snapshot already
+built: a merge upload derives it from the previous snapshot (derive_snapshot()),
+so running sessions switch to the new version without parsing the workbook.
+
+Other processes (batch runs, a restarted app) reuse the SQLite snapshot instead
+of re-parsing the workbook. Snapshots of earlier versions are only removed once
+they are neither among the last SNAPSHOTS_KEPT nor younger than
+SNAPSHOT_GRACE_SECONDS, so a process still holding the previous ReleaseCatalog
+can keep reading it after a new version is published.
+
+Pages of the catalog are served straight from the snapshot (page()): search,
+sort order and LIMIT / OFFSET run in SQLite, on a case-insensitive index per
+column, so the release grid only ever loads the rows it shows.
+
+The snapshot also holds a hash index of the key columns (MATCH_KEY_COLUMNS), so
+a deck can be matched to its release from the text of its Slide 1 alone: the
+text is cut into candidate keys once and every candidate is probed in the index
+with a single query, whatever the size of the catalog (see match_text()).
+"""
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from workbook_reader import XlsxStreamReader
+
+SAMPLE_RELEASES_FILE = os.path.join(os.getcwd(), "config", "SampleReleases.xlsx")
+CATALOG_CACHE_DIR = os.path.join(os.getcwd(), "cache", "release_catalog")
+CATALOG_TABLE = "releases"
+SEARCH_TABLE = "release_search"
+KEYS_TABLE = "release_keys"
+SNAPSHOT_FORMAT = "v4"  # Bump when the snapshot schema changes; old snapshots are then rebuilt
+SNAPSHOTS_KEPT = 2                # The current version and the one before it
+SNAPSHOT_GRACE_SECONDS = 60 * 60  # Older versions are kept this long for processes still reading them
+
+MIN_TRIGRAM_TERM = 3  # Shorter search terms cannot use the trigram index
+SEARCH_CACHE_SIZE = 64
+DEFAULT_PAGE_SIZE = 25
+
+# Columns whose values identify a release on Slide 1 (those missing from the workbook are skipped)
+MATCH_KEY_COLUMNS = ["Enterprise Release ID", "Release", "Clarity Project ID", "Project ID", "Application ID"]
+MIN_KEY_LENGTH = 3      # Shorter key values are too ambiguous to match free text
+MAX_KEY_TOKENS = 3      # Keys may be split over up to 3 tokens in the text ("PRJ-002", "APP ID 1002")
+MATCH_LIMIT = 10
+KEY_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def quote_identifier(name):
+    """SQLite identifier quoting, so column headers may hold spaces or quotes."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _cell_text(value):
+    return "" if value is None else str(value).strip()
+
+
+def _create_search_table(connection):
+    """Trigram FTS5 index when SQLite has it, otherwise a plain table scanned with LIKE."""
+    try:
+        connection.execute(f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(text, tokenize='trigram')")
+        return True
+    except sqlite3.OperationalError:
+        connection.execute(f"CREATE TABLE {SEARCH_TABLE} (text TEXT NOT NULL)")
+        return False
+
+
+def split_search_terms(query):
+    """Lower-cased, de-duplicated whitespace separated terms; every term must match (AND)."""
+    return list(dict.fromkeys(term.lower() for term in str(query).split()))
+
+
+def normalize_key(value):
+    """Key value as matched against text: lower-cased letters and digits only ("PRJ-002" -> "prj002")."""
+    return "".join(KEY_TOKEN_RE.findall(str(value).lower()))
+
+
+def key_candidates(text):
+    """Every run of 1..MAX_KEY_TOKENS consecutive tokens of the text, joined and normalized."""
+    tokens = KEY_TOKEN_RE.findall(str(text).lower())
+    candidates = set()
+    for start in range(len(tokens)):
+        key = ""
+        for token in tokens[start:start + MAX_KEY_TOKENS]:
+            key += token
+            if len(key) >= MIN_KEY_LENGTH:
+                candidates.add(key)
+    return candidates
+
+
+def _like_pattern(term):
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def read_columns(rows):
+    """Column names from the header row of a sheet (trailing empty cells dropped, unnamed ones numbered)."""
+    header = [_cell_text(name) for name in next(rows, ())]
+    while header and not header[-1]:
+        header.pop()  # Trailing empty header cells
+    return [name or f"Column {i + 1}" for i, name in enumerate(header)]
+
+
+def row_record(row, width):
+    """A sheet row as the text of its first width cells."""
+    return [_cell_text(row[i]) if i < len(row) else "" for i in range(width)]
+
+
+def _index_rows(connection, columns, rowids=None):
+    """Adds the search text and the key index entries of the given rows (all rows when rowids is None)."""
+    condition, params = ("", ()) if rowids is None else \
+        (" WHERE rowid IN (SELECT value FROM json_each(?))", (json.dumps(rowids),))
+
+    # Cells are joined with newlines so a search term never spans two columns
+    concat_sql = " || char(10) || ".join(quote_identifier(c) for c in columns) or "''"
+    connection.execute(f"INSERT INTO {SEARCH_TABLE} (rowid, text) "
+                       f"SELECT rowid, lower({concat_sql}) FROM {CATALOG_TABLE}{condition}", params)
+
+    # Hash index of the key columns: normalized value -> (column, row)
+    connection.create_function("normalize_key", 1, normalize_key, deterministic=True)
+    for column in [c for c in MATCH_KEY_COLUMNS if c in columns]:
+        connection.execute(f"INSERT INTO {KEYS_TABLE} SELECT key, ?, rowid FROM "
+                           f"(SELECT normalize_key({quote_identifier(column)}) AS key, rowid "
+                           f"FROM {CATALOG_TABLE}{condition}) WHERE length(key) >= ?",
+                           (column, *params, MIN_KEY_LENGTH))
+
+
+def build_snapshot(source_file, db_path):
+    """
+    Streams the first sheet of the workbook into a SQLite table of text columns
+    plus the search index (same rowid, one line of text per release row).
+
+    The snapshot is written to a temporary file and renamed into place, so
+    readers never see a half-written database.
+    """
+    with XlsxStreamReader(source_file) as workbook:
+        rows = workbook.iter_rows(workbook.sheet_names[0])
+        columns = read_columns(rows)
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".sqlite.tmp", dir=os.path.dirname(db_path))
+        os.close(fd)
+        try:
+            connection = sqlite3.connect(tmp_path)
+            try:
+                column_sql = ", ".join(f"{quote_identifier(c)} TEXT NOT NULL DEFAULT ''" for c in columns)
+                connection.execute(f"CREATE TABLE {CATALOG_TABLE} ({column_sql})")
+                placeholders = ", ".join("?" for _ in columns)
+                records = (row_record(row, len(columns)) for row in rows)
+                connection.executemany(f"INSERT INTO {CATALOG_TABLE} VALUES ({placeholders})",
+                                       (record for record in records if any(record)))
+                for position, column in enumerate(columns):  # Sort indexes for page()
+                    connection.execute(f"CREATE INDEX {CATALOG_TABLE}_sort_{position} ON {CATALOG_TABLE} "
+                                       f"({quote_identifier(column)} COLLATE NOCASE)")
+
+                _create_search_table(connection)
+                connection.execute(f"CREATE TABLE {KEYS_TABLE} (key TEXT NOT NULL, key_column TEXT NOT NULL, "
+                                   f"row INTEGER NOT NULL)")
+                _index_rows(connection, columns)
+                connection.execute(f"CREATE INDEX {KEYS_TABLE}_key ON {KEYS_TABLE} (key)")
+                connection.commit()
+            finally:
+                connection.close()
+            os.replace(tmp_path, db_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return db_path
+
+
+def derive_snapshot(catalog, updates, additions, db_path):
+    """
+    Builds the snapshot of a new catalog version from the snapshot of the current one.
+
+    The database is copied page by page (no workbook parsing), then only the changed
+    releases are rewritten and re-indexed. Catalog positions of existing releases
+    do not change; new releases are appended in order.
+
+    :param catalog: ReleaseCatalog of the current version.
+    :param updates: {catalog position: record} of changed releases.
+    :param additions: Records of new releases.
+    :param db_path: Where to write the new snapshot (written to a temporary file, then renamed).
+    """
+    columns = catalog.columns
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".sqlite.tmp", dir=os.path.dirname(db_path))
+    os.close(fd)
+    try:
+        source = catalog.connect()
+        connection = sqlite3.connect(tmp_path)
+        try:
+            source.backup(connection)  # ⚡ Unchanged rows and indexes are copied as they are
+            assignments = ", ".join(f"{quote_identifier(c)} = ?" for c in columns)
+            connection.executemany(f"UPDATE {CATALOG_TABLE} SET {assignments} WHERE rowid = ?",
+                                   ([*record, position + 1] for position, record in updates.items()))
+            placeholders = ", ".join("?" for _ in columns)
+            rowids = [position + 1 for position in updates]
+            for record in additions:
+                rowids.append(connection.execute(f"INSERT INTO {CATALOG_TABLE} VALUES ({placeholders})",
+                                                 record).lastrowid)
+
+            # Re-index the changed rows only
+            changed = json.dumps(rowids)
+            connection.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN (SELECT value FROM json_each(?))",
+                               (changed,))
+            connection.execute(f"DELETE FROM {KEYS_TABLE} WHERE row IN (SELECT value FROM json_each(?))",
+                               (changed,))
+            _index_rows(connection, columns, rowids)
+            connection.commit()
+        finally:
+            connection.close()
+            source.close()
+        os.replace(tmp_path, db_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return db_path
+
+
+class ReleaseCatalog:
+    """
+    An immutable snapshot of the release catalog.
+
+    :param source_file: The workbook the snapshot was built from.
+    :param sha256: Content hash of that workbook; doubles as the catalog version.
+    :param db_path: The SQLite snapshot.
+    """
+
+    def __init__(self, source_file, sha256, db_path):
+        self.source_file = source_file
+        self.sha256 = sha256
+        self.version = sha256[:16]
+        self.db_path = db_path
+        self._frame = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._search_cache = OrderedDict()  # query terms -> row positions
+        self._has_fts = None
+        self._columns = None
+        self._row_count = None
+
+    def connect(self):
+        """A new read-only connection to the snapshot (one per thread)."""
+        return sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self.connect()
+        return connection
+
+    @property
+    def has_fts(self):
+        """True when the search index is an FTS5 trigram table."""
+        if self._has_fts is None:
+            sql = self._connection().execute(
+                "SELECT sql FROM sqlite_master WHERE name = ?", (SEARCH_TABLE,)).fetchone()[0]
+            self._has_fts = "fts5" in sql.lower()
+        return self._has_fts
+
+    def search(self, query):
+        """
+        Positions (0-based, catalog order) of the rows containing every term of the query.
+
+        Terms match case-insensitively anywhere inside any cell, e.g. "bank rlse1230"
+        returns the Bank releases whose IDs contain RLSE1230. Results are memoized per
+        catalog version.
+
+        :param query: Search box text; blank returns every row.
+        """
+        terms = tuple(split_search_terms(query))
+        if not terms:
+            return list(range(len(self)))
+
+        with self._lock:
+            if terms in self._search_cache:
+                self._search_cache.move_to_end(terms)
+                return self._search_cache[terms]
+
+        condition, params = self._search_condition(terms)
+        sql = f"SELECT rowid - 1 FROM {SEARCH_TABLE} WHERE {condition} ORDER BY rowid"
+        positions = [row[0] for row in self._connection().execute(sql, params)]
+
+        with self._lock:
+            self._search_cache[terms] = positions
+            while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return positions
+
+    def _search_condition(self, terms):
+        """WHERE clause over the search table for the terms: (sql, params)."""
+        conditions, params = [], []
+        fts_terms = [t for t in terms if len(t) >= MIN_TRIGRAM_TERM] if self.has_fts else []
+        if fts_terms:
+            conditions.append(f"{SEARCH_TABLE} MATCH ?")
+            params.append(" AND ".join('"' + t.replace('"', '""') + '"' for t in fts_terms))
+        for term in terms:
+            if term not in fts_terms:
+                conditions.append("text LIKE ? ESCAPE '\\'")
+                params.append(_like_pattern(term))
+        return " AND ".join(conditions), params
+
+    def count(self, query=""):
+        """Number of rows matching the search query (see search)."""
+        return len(self.search(query)) if split_search_terms(query) else len(self)
+
+    def page(self, query="", sort_column=None, descending=False, offset=0, limit=DEFAULT_PAGE_SIZE):
+        """
+        One page of the rows matching the search query, read from the snapshot.
+
+        Sorting and paging run in SQLite on the (memoized) search result, so only the page is loaded.
+
+        :param query: Search box text (see search); blank matches every row.
+        :param sort_column: Column to sort by, case-insensitively with ties in catalog order;
+                            None keeps the catalog order.
+        :param descending: Reverse the order.
+        :return: DataFrame of the page's rows, indexed by catalog position.
+        """
+        columns = self.columns
+        if sort_column is not None and sort_column not in columns:
+            raise KeyError(f"Unknown column: {sort_column}")
+        direction = "DESC" if descending else "ASC"
+        select_sql = f"SELECT rowid - 1, {', '.join(quote_identifier(c) for c in columns)} FROM {CATALOG_TABLE}"
+
+        if not split_search_terms(query):
+            where, params = "", []
+        elif sort_column is None:
+            # Catalog order: the page is a slice of the search result
+            positions = self.search(query)
+            positions = positions[::-1] if descending else positions
+            where, params = "WHERE rowid IN (SELECT value + 1 FROM json_each(?))", \
+                [json.dumps(positions[offset:offset + limit])]
+            offset = 0
+        else:
+            where, params = "WHERE rowid IN (SELECT value + 1 FROM json_each(?))", [json.dumps(self.search(query))]
+
+        if sort_column is None:
+            order = f"rowid {direction}"
+        else:
+            order = f"{quote_identifier(sort_column)} COLLATE NOCASE {direction}, rowid"
+        sql = f"{select_sql} {where} ORDER BY {order} LIMIT ? OFFSET ?"
+        rows = self._connection().execute(sql, [*params, limit, offset]).fetchall()
+        return pd.DataFrame([row[1:] for row in rows], columns=columns, index=[row[0] for row in rows])
+
+    def match_text(self, text, limit=MATCH_LIMIT):
+        """
+        Releases whose key column values occur in a text, such as Slide 1 of a deck.
+
+        The text is scanned once into candidate keys (see key_candidates) and all of them are
+        looked up in the key index by one query, so the cost depends on the text, not on the
+        number of releases.
+
+        :return: [(position, [matched key columns]), ...], most matched key columns first.
+        """
+        candidates = list(key_candidates(text))
+        if not candidates:
+            return []
+        placeholders = ", ".join("?" for _ in candidates)
+        sql = (f"SELECT row - 1, group_concat(DISTINCT key_column) FROM {KEYS_TABLE} "
+               f"WHERE key IN ({placeholders}) GROUP BY row "
+               f"ORDER BY COUNT(DISTINCT key_column) DESC, row LIMIT ?")
+        return [(position, columns.split(","))
+                for position, columns in self._connection().execute(sql, [*candidates, limit])]
+
+    def best_matches(self, text):
+        """The match_text() entries matching the most key columns of the text (several on a tie, [] if none)."""
+        matches = self.match_text(text)
+        return [match for match in matches if len(match[1]) == len(matches[0][1])]
+
+    def row(self, position):
+        """One release (0-based catalog position) as a Series of column -> text, read from the snapshot."""
+        cursor = self._connection().execute(f"SELECT * FROM {CATALOG_TABLE} WHERE rowid = ?", (position + 1,))
+        values = cursor.fetchone()
+        if values is None:
+            raise IndexError(f"No release at position {position}")
+        return pd.Series(values, index=[column[0] for column in cursor.description], name=position)
+
+    @property
+    def frame(self):
+        """The whole catalog as a DataFrame of strings, loaded once and shared; treat it as read-only."""
+        if self._frame is None:
+            with self._lock:
+                if self._frame is None:
+                    connection = self.connect()
+                    try:
+                        frame = pd.read_sql_query(f"SELECT * FROM {CATALOG_TABLE} ORDER BY rowid", connection)
+                    finally:
+                        connection.close()
+                    self._frame = frame
+        return self._frame
+
+    @property
+    def columns(self):
+        if self._columns is None:
+            self._columns = [info[1] for info in self._connection().execute(f"PRAGMA table_info({CATALOG_TABLE})")]
+        return list(self._columns)
+
+    def __len__(self):
+        if self._row_count is None:
+            self._row_count = self._connection().execute(f"SELECT count(*) FROM {CATALOG_TABLE}").fetchone()[0]
+        return self._row_count
+
+
+def _snapshot_prefix(source_file):
+    return os.path.splitext(os.path.basename(source_file))[0] + "-"
+
+
+def snapshot_path(source_file, sha256, cache_dir=CATALOG_CACHE_DIR):
+    """Where load_catalog() looks for the snapshot of a workbook version."""
+    return os.path.join(cache_dir, f"{_snapshot_prefix(source_file)}{sha256}-{SNAPSHOT_FORMAT}.sqlite")
+
+
+def _prune_snapshots(cache_dir, source_file, keep_path, kept=SNAPSHOTS_KEPT, grace_seconds=SNAPSHOT_GRACE_SECONDS):
+    """
+    Removes the snapshots of earlier versions of the same workbook, except the newest
+    `kept` ones and those written in the last `grace_seconds`.
+    """
+    pattern = os.path.join(cache_dir, glob.escape(_snapshot_prefix(source_file)) + "*.sqlite")
+    snapshots = []
+    for path in glob.glob(pattern):
+        try:
+            snapshots.append((os.path.getmtime(path), path))
+        except OSError:
+            pass  # Removed meanwhile by another process
+    snapshots.sort(reverse=True)  # Newest first
+
+    expired = time.time() - grace_seconds
+    for position, (mtime, path) in enumerate(snapshots):
+        if position < kept or mtime > expired or os.path.abspath(path) == os.path.abspath(keep_path):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Still open elsewhere (Windows); removed on a later load
+
+
+_catalog_lock = threading.Lock()
+_catalog_cache = {}  # source path -> ((mtime_ns, size), ReleaseCatalog)
+
+
+def load_catalog(source_file=SAMPLE_RELEASES_FILE, cache_dir=CATALOG_CACHE_DIR):
+    """
+    Returns the ReleaseCatalog for a workbook, converting it to SQLite only when its content changes.
+
+    :raises FileNotFoundError: If the workbook does not exist.
+    """
+    source_file = os.path.abspath(source_file)
+    stat = os.stat(source_file)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _catalog_lock:
+        cached = _catalog_cache.get(source_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        sha256 = file_sha256(source_file)
+        if cached is not None and cached[1].sha256 == sha256 and os.path.exists(cached[1].db_path):
+            _catalog_cache[source_file] = (signature, cached[1])
+            return cached[1]
+
+        db_path = snapshot_path(source_file, sha256, cache_dir)
+        if not os.path.exists(db_path):
+            build_snapshot(source_file, db_path)
+        _prune_snapshots(cache_dir, source_file, db_path)  # Snapshots of published versions are pre-built
+        catalog = ReleaseCatalog(source_file, sha256, db_path)
+        _catalog_cache[source_file] = (signature, catalog)
+        return catalog
@@ -0,0 +1,117 @@
+"""
+Paginated release grid shared by the PPT and Word pages.
+
+Only the visible page of the release catalog is sent to the browser. The search
+box, sort order and page number become one catalog query (ReleaseCatalog.page)
+on the SQLite snapshot, so a rerun serializes one page of rows whatever the size
+of the catalog. AgGrid's own sorting and filtering are switched off since they
+would only see the current page, and the grid options are built once per column
+layout instead of on every rerun.
+
+The selected release is kept in session state as its catalog position (with the
+catalog version it refers to), so it survives paging, sorting and searching.
+"""
+import copy
+import math
+from functools import lru_cache
+
+import streamlit as st
+from st_aggrid import AgGrid, GridOptionsBuilder
+
+PAGE_SIZES = [25, 50, 100, 200]
+GRID_HEIGHT = 300
+CATALOG_ORDER = "Catalog order"
+
+
+@lru_cache(maxsize=16)
+def base_grid_options(columns):
+    """Grid options for a column layout: text columns, single checkbox selection, no client-side sort / filter."""
+    gb = GridOptionsBuilder()
+    gb.configure_default_column(sortable=False, filter=False)
+    if any("." in column for column in columns):
+        gb.configure_grid_options(suppressFieldDotNotation=True)
+    for column in columns:
+        gb.configure_column(field=column)
+    gb.configure_grid_options(autoSizeStrategy={"type": "fitGridWidth"})
+    gb.configure_selection('single', use_checkbox=True)
+    return gb.build()
+
+
+def release_label(release):
+    return f"{release.get('Enterprise Release ID', '')} - {release.get('Project Name', '')}"
+
+
+def release_grid(release_catalog, key, default_position=None):
+    """
+    Draws the search box, the sort and paging controls and the current page of the release grid.
+
+    :param release_catalog: release_catalog.ReleaseCatalog to browse.
+    :param key: Prefix of the session state keys (one per page using the grid).
+    :param default_position: Catalog position ticked when nothing has been selected (e.g. a matched release).
+    :return: The selected release as a pandas Series, or None.
+    """
+    selected_key, page_key, view_key = f"{key}_selected", f"{key}_page", f"{key}_view"
+    columns = release_catalog.columns
+
+    st_col1, st_col2 = st.columns([0.8, 0.2])
+
+    # Add a search bar for filtering
+    with st_col2:
+        search_text = st.text_input("Search", placeholder="🔍 Search...", key=f"{key}_search",
+                                    label_visibility="collapsed")
+
+    # Sorting and paging run in the catalog query, not in the browser
+    with st_col1:
+        sort_col, order_col, size_col, page_col = st.columns(4)
+        with sort_col:
+            sort_column = st.selectbox("Sort by", [CATALOG_ORDER] + columns, key=f"{key}_sort")
+        with order_col:
+            descending = st.selectbox("Order", ["Ascending", "Descending"], key=f"{key}_order") == "Descending"
+        with size_col:
+            page_size = st.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_page_size")
+
+        total = release_catalog.count(search_text)
+        pages = max(1, math.ceil(total / page_size))
+        view = (search_text.strip(), sort_column, descending, page_size)
+        if st.session_state.get(view_key) != view or st.session_state.get(page_key, 1) > pages:
+            st.session_state[view_key] = view
+            st.session_state[page_key] = 1  # ✅ New search or order: back to the first page
+        with page_col:
+            page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    page_df = release_catalog.page(search_text, None if sort_column == CATALOG_ORDER else sort_column,
+                                   descending, offset=(page - 1) * page_size, limit=page_size)
+    positions = list(page_df.index)
+
+    # Display the table for selection
+    selected_version, selected = st.session_state.get(selected_key, (None, None))
+    if selected_version != release_catalog.version:
+        selected = None  # The catalog was replaced since the release was selected
+    ticked = selected if selected is not None else default_position
+    grid_options = copy.deepcopy(base_grid_options(tuple(columns)))
+    if ticked in positions:
+        grid_options["initialState"] = {"rowSelection": [str(positions.index(ticked))]}
+
+    grid_response = AgGrid(
+        page_df.reset_index(drop=True),
+        gridOptions=grid_options,
+        update_on=["selectionChanged"],
+        height=GRID_HEIGHT,
+        key=f"{key}_grid_{release_catalog.version}_{hash(view)}_{page}",  # A fresh grid per page, so its state starts from initialState
+    )
+
+    selected_rows = grid_response.selected_rows
+    if selected_rows is not None and not selected_rows.empty:
+        selected = positions[int(selected_rows.index[0])]
+        st.session_state[selected_key] = (release_catalog.version, selected)
+    elif grid_response.grid_response and selected in positions:
+        selected = None  # Unticked on this page
+        st.session_state[selected_key] = (release_catalog.version, selected)
+
+    offset = (page - 1) * page_size
+    caption = f"Rows {offset + 1 if positions else 0}-{offset + len(positions)} of {total} (page {page} of {pages})"
+    selected_release = release_catalog.row(selected) if selected is not None else None
+    if selected_release is not None:
+        caption += f" · Selected: {release_label(selected_release)}"
+    st.caption(caption)
+    return selected_release
@@ -0,0 +1,287 @@
+"""
+Versioned updates of the release catalog (config/SampleReleases.xlsx).
+
+Two kinds of upload are published:
+
+    merge_releases(data, key_columns)   new and changed releases, merged by key into the current catalog
+    replace_releases(data)              a complete workbook replacing the catalog
+
+Both check the upload against the catalog schema first (CatalogSchemaError). A
+merge upload only needs the key columns and the columns it changes; the columns
+it leaves out keep their values for changed releases and stay empty for new
+ones. Releases are never removed by a merge (upload a full workbook for that).
+
+A merge writes the new workbook from the catalog snapshot: the first sheet only,
+without formatting, column widths or other sheets. Cells that were numbers stay
+numbers (see workbook_writer.as_number), everything else is text. Upload the
+complete workbook (replace) to keep a formatted or multi-sheet catalog.
+
+Publishing is atomic: the new workbook is written to a temporary file next to
+SampleReleases.xlsx and renamed over it, so a session never reads a half-written
+catalog. Before the rename the snapshot of the new version is put in place, so
+the next load_catalog() of any session switches to the new version without
+parsing the workbook. A merge derives that snapshot from the previous one and
+only re-indexes the changed releases. Each published workbook is also kept in
+config/versions (the last VERSIONS_KEPT) and logged to config/versions/versions.jsonl.
+The workbook in place before the first publication is archived and logged too
+(mode "original", e.g. SampleReleases.original-<sha256>.xlsx) and is never
+pruned, so the starting catalog can always be restored.
+"""
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime, timezone
+
+from release_catalog import (CATALOG_CACHE_DIR, CATALOG_TABLE, SAMPLE_RELEASES_FILE, ReleaseCatalog, build_snapshot,
+                             derive_snapshot, file_sha256, load_catalog, quote_identifier, read_columns, row_record,
+                             snapshot_path)
+from workbook_reader import XlsxStreamReader
+from workbook_writer import write_xlsx
+
+VERSIONS_DIR = os.path.join(os.getcwd(), "config", "versions")
+VERSION_LOG = "versions.jsonl"
+VERSIONS_KEPT = 10
+
+DEFAULT_MERGE_KEY = ["Enterprise Release ID", "Clarity Project ID"]  # Unique together in the catalog
+REQUIRED_COLUMNS = ["Enterprise Release ID", "Project Name"]         # Read by the slide checks
+MERGE = "merge"
+REPLACE = "replace"
+ORIGINAL = "original"  # The workbook in place before the first publication
+
+_publish_lock = threading.Lock()  # One publication at a time, each based on the latest version
+
+
+class CatalogSchemaError(ValueError):
+    """Raised when an upload does not fit the catalog (columns, keys)."""
+
+
+def read_upload(data):
+    """
+    The first sheet of an uploaded workbook as (columns, records), every cell as text.
+
+    :raises CatalogSchemaError: If the header is missing or names a column twice.
+    """
+    with XlsxStreamReader(data) as workbook:
+        rows = workbook.iter_rows(workbook.sheet_names[0])
+        columns = read_columns(rows)
+        records = [record for record in (row_record(row, len(columns)) for row in rows) if any(record)]
+
+    if not columns:
+        raise CatalogSchemaError("The workbook has no header row.")
+    duplicates = sorted({column for column in columns if columns.count(column) > 1})
+    if duplicates:
+        raise CatalogSchemaError(f"Columns named more than once: {', '.join(duplicates)}")
+    return columns, records
+
+
+def plan_merge(catalog, columns, records, key_columns):
+    """
+    Matches the uploaded releases to the catalog by key.
+
+    :return: ({catalog position: merged record} of changed releases, [records] of new releases,
+             number of uploaded releases that are unchanged).
+    :raises CatalogSchemaError: If the columns or keys do not fit the catalog.
+    """
+    catalog_columns = catalog.columns
+    if not key_columns:
+        raise CatalogSchemaError("Select at least one key column.")
+    unknown = [column for column in columns if column not in catalog_columns]
+    if unknown:
+        raise CatalogSchemaError(f"Columns not in the catalog: {', '.join(unknown)}. "
+                                 "Upload the complete workbook to change the columns.")
+    missing = [column for column in key_columns if column not in columns]
+    if missing:
+        raise CatalogSchemaError(f"Key columns missing from the upload: {', '.join(missing)}")
+
+    # Uploaded releases by key (rows numbered as in Excel, after the header)
+    key_index = [columns.index(column) for column in key_columns]
+    uploaded = {}
+    for row_number, record in enumerate(records, start=2):
+        key = tuple(record[i] for i in key_index)
+        if not all(key):
+            raise CatalogSchemaError(f"Row {row_number} has no value for {', '.join(key_columns)}")
+        if key in uploaded:
+            raise CatalogSchemaError(f"Rows {uploaded[key][0]} and {row_number} have the same key {key}")
+        uploaded[key] = (row_number, record)
+
+    # Catalog releases with the uploaded keys
+    connection = catalog.connect()
+    try:
+        key_sql = ", ".join(quote_identifier(column) for column in key_columns)
+        positions = {}
+        for rowid, *key in connection.execute(f"SELECT rowid, {key_sql} FROM {CATALOG_TABLE}"):
+            key = tuple(key)
+            if key in uploaded:
+                if key in positions:
+                    raise CatalogSchemaError(f"{key} matches several releases in the catalog. "
+                                             "Add key columns so that each release has its own key.")
+                positions[key] = rowid - 1
+        current = {}
+        if positions:
+            cursor = connection.execute(f"SELECT rowid, * FROM {CATALOG_TABLE} WHERE rowid IN "
+                                        f"(SELECT value FROM json_each(?))",
+                                        (json.dumps([position + 1 for position in positions.values()]),))
+            current = {rowid - 1: list(values) for rowid, *values in cursor}
+    finally:
+        connection.close()
+
+    updates, additions, unchanged = {}, [], 0
+    targets = [catalog_columns.index(column) for column in columns]
+    for key, (_, record) in uploaded.items():
+        position = positions.get(key)
+        merged = list(current[position]) if position is not None else [""] * len(catalog_columns)
+        for value, target in zip(record, targets):
+            merged[target] = value
+        if position is None:
+            additions.append(merged)
+        elif merged != current[position]:
+            updates[position] = merged
+        else:
+            unchanged += 1
+    return updates, additions, unchanged
+
+
+def write_workbook(catalog, path, sheet_name="Sheet1"):
+    """Writes the catalog snapshot to an .xlsx file, streaming the rows from SQLite."""
+    connection = catalog.connect()
+    try:
+        rows = connection.execute(f"SELECT * FROM {CATALOG_TABLE} ORDER BY rowid")
+        write_xlsx(path, itertools.chain([catalog.columns], rows), sheet_name)
+    finally:
+        connection.close()
+
+
+def _version_file(target, published, sha256):
+    name, extension = os.path.splitext(os.path.basename(target))
+    return f"{name}-{published.strftime('%Y%m%dT%H%M%S')}-{sha256[:12]}{extension}"
+
+
+def _log_version(versions_dir, published, version_file, entry):
+    entry = {"version": entry["sha256"][:16], "published": published.isoformat(timespec="seconds"),
+             "file": version_file, **entry}
+    with open(os.path.join(versions_dir, VERSION_LOG), "a", encoding="utf-8") as log:
+        log.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def _archive_original(target, versions_dir):
+    """Before the first publication, archives and logs the workbook in place so it can be restored."""
+    if os.path.exists(os.path.join(versions_dir, VERSION_LOG)) or not os.path.exists(target):
+        return
+    sha256 = file_sha256(target)
+    name, extension = os.path.splitext(os.path.basename(target))
+    version_file = f"{name}.{ORIGINAL}-{sha256[:12]}{extension}"  # Not a "<name>-" file: never pruned
+    shutil.copyfile(target, os.path.join(versions_dir, version_file))
+    modified = datetime.fromtimestamp(os.path.getmtime(target), timezone.utc)
+    _log_version(versions_dir, modified, version_file, {"mode": ORIGINAL, "sha256": sha256})
+
+
+def _publish(tmp_path, target, entry, versions_dir):
+    """Archives the new workbook, renames it over the catalog (the atomic step) and logs the version."""
+    published = datetime.now(timezone.utc)
+    os.makedirs(versions_dir, exist_ok=True)
+    _archive_original(target, versions_dir)
+    version_file = _version_file(target, published, entry["sha256"])
+    shutil.copyfile(tmp_path, os.path.join(versions_dir, version_file))
+    os.replace(tmp_path, target)  # ✅ Readers see the old workbook or the new one, never a partial file
+    entry = _log_version(versions_dir, published, version_file, entry)
+
+    # ♻️ Keep the last VERSIONS_KEPT workbooks (the log keeps every entry)
+    name = os.path.splitext(os.path.basename(target))[0] + "-"
+    archived = sorted(f for f in os.listdir(versions_dir) if f.startswith(name) and f != VERSION_LOG)
+    for old in archived[:-VERSIONS_KEPT]:
+        os.remove(os.path.join(versions_dir, old))
+    return entry
+
+
+def _temporary_workbook(target):
+    fd, tmp_path = tempfile.mkstemp(suffix=".xlsx.tmp", dir=os.path.dirname(target))
+    os.close(fd)
+    return tmp_path
+
+
+def merge_releases(data, key_columns=DEFAULT_MERGE_KEY, target=SAMPLE_RELEASES_FILE, versions_dir=VERSIONS_DIR):
+    """
+    Merges new and changed releases into the catalog by key and publishes the result as a new version.
+
+    :param data: The uploaded workbook (bytes, file object or path).
+    :param key_columns: Columns identifying a release.
+    :return: The version log entry (version, added, updated, unchanged, rows, ...); version is None when
+             the upload changes nothing.
+    :raises CatalogSchemaError: If the upload does not fit the catalog.
+    """
+    columns, records = read_upload(data)
+    target = os.path.abspath(target)
+    with _publish_lock:
+        catalog = load_catalog(target)
+        updates, additions, unchanged = plan_merge(catalog, columns, records, list(key_columns))
+        entry = {"mode": MERGE, "key": list(key_columns), "added": len(additions), "updated": len(updates),
+                 "unchanged": unchanged}
+        if not updates and not additions:
+            return {"version": None, **entry, "rows": len(catalog)}
+
+        # New snapshot from the current one, then the workbook written from it
+        os.makedirs(CATALOG_CACHE_DIR, exist_ok=True)
+        fd, staging_path = tempfile.mkstemp(suffix=".sqlite.staging", dir=CATALOG_CACHE_DIR)
+        os.close(fd)
+        tmp_path = _temporary_workbook(target)
+        try:
+            derive_snapshot(catalog, updates, additions, staging_path)
+            with XlsxStreamReader(target) as workbook:
+                sheet_name = workbook.sheet_names[0]
+            write_workbook(ReleaseCatalog(target, "staging", staging_path), tmp_path, sheet_name)
+            entry["sha256"] = file_sha256(tmp_path)
+            os.replace(staging_path, snapshot_path(target, entry["sha256"]))
+            entry["rows"] = len(catalog) + len(additions)
+            return _publish(tmp_path, target, entry, versions_dir)
+        finally:
+            for path in (staging_path, tmp_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def replace_releases(data, target=SAMPLE_RELEASES_FILE, versions_dir=VERSIONS_DIR):
+    """
+    Publishes a complete workbook as the new version of the catalog.
+
+    :return: The version log entry.
+    :raises CatalogSchemaError: If required columns are missing or there are no releases.
+    """
+    columns, records = read_upload(data)
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise CatalogSchemaError(f"Required columns missing: {', '.join(missing)}")
+    if not records:
+        raise CatalogSchemaError("The workbook has no releases.")
+
+    target = os.path.abspath(target)
+    with _publish_lock:
+        tmp_path = _temporary_workbook(target)
+        try:
+            with open(tmp_path, "wb") as out:
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    out.write(data)
+                else:
+                    data.seek(0)
+                    shutil.copyfileobj(data, out)
+            entry = {"mode": REPLACE, "sha256": file_sha256(tmp_path), "rows": len(records)}
+            db_path = snapshot_path(target, entry["sha256"])
+            if not os.path.exists(db_path):
+                build_snapshot(tmp_path, db_path)  # Parsed here once, not by the first session
+            return _publish(tmp_path, target, entry, versions_dir)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def published_versions(versions_dir=VERSIONS_DIR, limit=VERSIONS_KEPT):
+    """The latest version log entries, newest first."""
+    try:
+        with open(os.path.join(versions_dir, VERSION_LOG), encoding="utf-8") as log:
+            entries = [json.loads(line) for line in log if line.strip()]
+    except FileNotFoundError:
+        return []
+    return entries[::-1][:limit]
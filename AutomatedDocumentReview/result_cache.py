@@ -0,0 +1,157 @@
+"""
+Content-addressed, on-disk cache of PPT validation results.
+
+An entry is keyed by the SHA-256 of the PPTX bytes, a hash of the selected
+checklist row and the version of the validation rules, so re-validating the
+same deck against the same release comes back instantly. The rules version is
+a fingerprint of the source of every module the results depend on
+(VALIDATION_MODULES) plus the compiled rules from config.xlsx: editing any of
+them invalidates every entry automatically. The cache directory is kept under
+a byte budget by evicting the least recently used entries.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import keyword_scanner
+import ppt_validator
+import rules
+import workbook_reader
+import zip_budget
+from rules import load_ruleset
+
+RESULT_CACHE_DIR = os.path.join(os.getcwd(), "cache", "validation_results")
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of cached results
+
+# Modules whose code shapes the validation results (add new ones that validate_ppt imports)
+VALIDATION_MODULES = (ppt_validator, rules, keyword_scanner, workbook_reader, zip_budget)
+
+
+def compute_code_version(modules=VALIDATION_MODULES):
+    """Fingerprint of the validation code (the sources of the modules, in order)."""
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+
+CODE_VERSION = compute_code_version()
+
+
+def current_rules_version(ruleset=None):
+    """
+    Version of the validation rules: the validation code plus the rule set.
+
+    :param ruleset: rules.RuleSet the results are computed with (default: the rules sheet in config.xlsx).
+    """
+    return f"{CODE_VERSION}-{(ruleset or load_ruleset()).fingerprint}"
+
+
+def hash_checklist_row(checklist_row):
+    """Stable hash of a checklist row (pandas Series or dict)."""
+    row = {str(key): str(value) for key, value in dict(checklist_row).items()}
+    return hashlib.sha256(json.dumps(row, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ValidationResultCache:
+    """Disk cache of validation results with LRU eviction and hit/miss counters."""
+
+    def __init__(self, cache_dir=RESULT_CACHE_DIR, max_bytes=RESULT_CACHE_MAX_BYTES, rules_version=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._fixed_rules_version = rules_version  # None: follow the live rules
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def rules_version(self):
+        return self._fixed_rules_version or current_rules_version()
+
+    def make_key(self, pptx_bytes, checklist_row):
+        """Cache key for a deck (bytes or any buffer, e.g. a memoryview of the upload) and a checklist row."""
+        pptx_hash = hashlib.sha256(pptx_bytes).hexdigest()
+        key_material = f"{pptx_hash}:{hash_checklist_row(checklist_row)}:{self.rules_version}"
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Returns the cached results for a key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # ✅ Mark as recently used for LRU eviction
+        except (OSError, ValueError):
+            entry = None
+
+        rules_version = self.rules_version
+        with self._lock:
+            if entry is None or entry.get("rules_version") != rules_version:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry["results"]
+
+    def put(self, key, results):
+        """Stores results atomically, then evicts least recently used entries over the byte budget."""
+        entry = {"rules_version": self.rules_version, "results": results}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self._entry_path(key))
+        self.evict()
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed by another session meanwhile
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        entries = sorted(self._entries())  # Oldest (least recently used) first
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self):
+        entries = self._entries()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes,
+                "rules_version": self.rules_version,
+            }
+
+
+# Process-wide cache shared by every Streamlit session
+default_cache = ValidationResultCache()
@@ -0,0 +1,173 @@
+"""
+Incremental revalidation of revised decks.
+
+Report authors upload revision after revision of the same deck, usually changing
+one or two slides. For every release (checklist row) the store remembers the last
+upload's per-slide signatures and results. A signature is built from the CRC32
+and size of each zip member the slide's checks read, taken straight from the
+central directory, so diffing a new upload against the previous one decompresses
+nothing up front:
+
+    Slide 1    ppt/slides/slide1.xml
+    Slide 2    slide2.xml, its .rels, [Content_Types].xml and every ppt/embeddings/ part
+    Slide N    ppt/slides/slideN.xml
+
+Slides whose signature is unchanged reuse the stored results; only the others are
+extracted and validated again. The directory is not trusted on its own: before a
+slide's results are reused, its members are read once so that zipfile checks the
+CRC32 against the actual data. A rewritten archive with stale or forged directory
+entries therefore fails the check, and the slide is validated again instead.
+Reading is much cheaper than validating (no XML or workbook parsing).
+
+Entries are tied to the rules version, including the fingerprint of a RuleSet
+passed by the caller, so editing config.xlsx or any of the validation modules
+(result_cache.VALIDATION_MODULES) starts from scratch, like the result cache.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zipfile
+from contextlib import nullcontext
+
+from perf_trace import span
+from ppt_validator import open_pptx_package, validate_ppt_package
+from result_cache import current_rules_version, hash_checklist_row
+
+REVISION_CACHE_DIR = os.path.join(os.getcwd(), "cache", "revisions")
+REVISION_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32 MB of remembered revisions
+
+
+def slide_members(package, slide_number):
+    """Zip members whose content the checks of a slide depend on."""
+    members = [f"ppt/slides/slide{slide_number}.xml"]
+    if slide_number == 2:
+        members += ["ppt/slides/_rels/slide2.xml.rels", "[Content_Types].xml"]
+        members += sorted(package.names_with_prefix("ppt/embeddings/"))
+    return members
+
+
+def slide_signatures(package):
+    """{"Slide N": signature} from the CRC32 and size of each slide's members (no decompression)."""
+    signatures = {}
+    for slide_number in range(1, max(package.total_slides, 2) + 1):
+        digest = hashlib.sha256()
+        for name in slide_members(package, slide_number):
+            info = package.members.get(name)
+            digest.update(f"{name}:{info.CRC:08x}:{info.file_size}\n".encode("utf-8") if info is not None
+                          else f"{name}:missing\n".encode("utf-8"))
+        signatures[f"Slide {slide_number}"] = digest.hexdigest()
+    return signatures
+
+
+def members_intact(package, names, chunk_size=1024 * 1024):
+    """True when every present member reads back with the CRC32 its directory entry declares."""
+    try:
+        for name in names:
+            if package.has_member(name):
+                with package.open(name) as part:
+                    while part.read(chunk_size):  # zipfile checks the CRC32 at the end of the member
+                        pass
+    except zipfile.BadZipFile:
+        return False
+    return True
+
+
+class RevisionStore:
+    """Last validated revision per release, kept on disk with LRU eviction over a byte budget."""
+
+    def __init__(self, cache_dir=REVISION_CACHE_DIR, max_bytes=REVISION_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_path(self, scope_key):
+        return os.path.join(self.cache_dir, f"{scope_key}.json")
+
+    def load(self, scope_key):
+        """The stored revision {"rules_version", "slides": {"Slide N": {"signature", "result"}}}, or None."""
+        path = self._entry_path(scope_key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # ✅ Mark as recently used for LRU eviction
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def save(self, scope_key, entry):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self._entry_path(scope_key))
+        self.evict()
+
+    def evict(self):
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json"):
+                    try:
+                        stat = os.stat(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, name))
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):  # Oldest (least recently used) first
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+                total -= size
+
+
+def validate_revision(zip_path, checklist_row, store=None, progress=None, trace=None, **validate_kwargs):
+    """
+    validate_ppt that only revalidates the slides changed since the last upload for the same release.
+
+    :param zip_path: PPTX file path, bytes, file-like object or an open PptxPackage.
+    :param checklist_row: Release row (dict or pandas Series); also the scope of the remembered revision.
+    :param store: RevisionStore (default: default_revisions).
+    :param progress: progress callback, as for validate_ppt (reused slides are reported too).
+    :param trace: Optional perf_trace.Trace.
+    :param validate_kwargs: slide_workers / slide_executor / ruleset, passed on to validate_ppt_package.
+    :return: (results, recomputed) where recomputed lists the "Slide N" keys that were validated
+             again; every slide is listed when there was no usable previous revision.
+    """
+    store = store or default_revisions
+    rules_version = current_rules_version(validate_kwargs.get("ruleset"))  # ✅ The rules actually applied
+    scope_key = hash_checklist_row(checklist_row)
+
+    with trace.activate() if trace is not None else nullcontext(), span("validate_ppt"), \
+            open_pptx_package(zip_path) as package:
+        with span("revision_diff"):
+            signatures = slide_signatures(package)
+            previous = store.load(scope_key)
+            reuse = {}
+            if previous is not None and previous.get("rules_version") == rules_version:
+                for slide_key, signature in signatures.items():
+                    stored = previous["slides"].get(slide_key)
+                    if stored is not None and stored["signature"] == signature:
+                        reuse[slide_key] = stored["result"]
+
+        with span("revision_verify", slides=len(reuse)):
+            for slide_key in list(reuse):
+                if not members_intact(package, slide_members(package, int(slide_key.split()[1]))):
+                    del reuse[slide_key]  # Directory entry does not match the data: validate it again
+
+        results = validate_ppt_package(package, checklist_row, progress=progress, reuse=reuse, **validate_kwargs)
+
+    store.save(scope_key, {
+        "rules_version": rules_version,
+        "slides": {slide_key: {"signature": signatures.get(slide_key), "result": result}
+                   for slide_key, result in results.items()},
+    })
+    return results, [slide_key for slide_key in results if slide_key not in reuse]
+
+
+# Process-wide store shared by every Streamlit session
+default_revisions = RevisionStore()
@@ -0,0 +1,172 @@
+"""
+Declarative PPT and Word validation rules, loaded from config/config.xlsx.
+
+The "ppt_test_report" sheet uses the same Key / Value layout as the Word
+strategy sheet. Lists are comma separated; every Slide 1 extraction pattern
+has its own row so regexes may contain commas:
+
+    Key                               Value
+    Slide1_MandatoryFieldsToValidate  Enterprise Release ID, Project Name, ...
+    Slide1_Pattern_<Field Name>       regex whose first group is the field value
+    Slide2_TestTypes                  load test, endurance test, load, endurance
+    Slide2_Workbook_RequiredSheets    sheets the embedded results workbook must have (blank = any sheet)
+    Slide2_Workbook_RequiredColumns   header columns a results sheet must have
+    Slide2_Workbook_HeaderScanRows    how many leading rows may hold the header row
+    Slide3_TitleKeywords              title, chart, graph, ...
+    Slide3_ObservationKeywords        observation, issue, finding, ...
+
+The title and observation keywords are compiled into a keyword_scanner.KeywordScanner
+each: titles are only looked for in the first lines of a content slide, while
+the observation scan covers the whole slide and stops at the first hit.
+
+The Word strategy sheet ("performance_testing_strategy") adds:
+
+    Key                               Value
+    Sections                          headings the strategy document must contain
+    Page1_MandatoryFieldsToValidate   release fields written as "Label: value" on page 1
+    Table_<Table Name>                header columns identifying a table whose rows must be filled
+
+Rules are compiled once into a RuleSet / WordRuleSet and reused across
+validations; the file is only re-read when its modification time changes.
+Keys missing from the sheet (or a missing sheet/file) fall back to
+DEFAULT_RULES / DEFAULT_WORD_RULES.
+"""
+import hashlib
+import os
+import re
+import threading
+
+import pandas as pd
+
+from keyword_scanner import KeywordScanner
+
+RULES_FILE = os.path.join(os.getcwd(), "config", "config.xlsx")
+RULES_SHEET = "ppt_test_report"
+WORD_RULES_SHEET = "performance_testing_strategy"
+
+PATTERN_PREFIX = "Slide1_Pattern_"
+TABLE_PREFIX = "Table_"
+
+DEFAULT_RULES = {
+    "Slide1_MandatoryFieldsToValidate": "Enterprise Release ID, Project Name, Release, Application ID, Business Application, Project ID",
+    "Slide1_Pattern_Project Name": r"(?:project name\s*[:\-–]?\s*)?([^\n\r]+?(?=\s*(performance test report|enterprise release id|rlse|rlsea|application name|app id|appid)))",
+    "Slide1_Pattern_Enterprise Release ID": r"enterprise\s+release\s+id\s*[:\-–]?\s*([^\s\n\r]+)",
+    "Slide1_Pattern_Project ID": r"prj[-\s]?(\w+)",
+    "Slide1_Pattern_Release": r"(rlse[a-z]*\d+)",
+    "Slide1_Pattern_Business Application": r"(?:application|app)\s+names?\s*[:\-–]?\s*(.*?)(?=\s*\(?appid\s*[-–]?\s*[a-zA-Z]?\s*\d+\)?)",
+    "Slide1_Pattern_Application ID": r"appid\s*[-–]?\s*[a-zA-Z]?\s*(\d+)",
+    "Slide2_TestTypes": "load test, endurance test, load, endurance",
+    "Slide2_Workbook_RequiredSheets": "",
+    "Slide2_Workbook_RequiredColumns": "Transaction Name, Average, 90 Percent",
+    "Slide2_Workbook_HeaderScanRows": "20",
+    "Slide3_TitleKeywords": "title, chart, graph, metrics, summary, observations, overview",
+    "Slide3_ObservationKeywords": "observation, issue, finding, remarks, note, conclusion, summary",
+}
+
+DEFAULT_WORD_RULES = {
+    "Sections": "Document Information, Introduction, Performance Test Approach, Test Environment, Schedule, Risks",
+    "Page1_MandatoryFieldsToValidate": "Project Name, Release, Project ID, Enterprise Release ID, Application Name, Application ID",
+    "Table_Revision History": "Revision Number, Author, Revision Date",
+    "Table_Distribution List": "Name, Area",
+    "Table_Test Environment": "Server Type, Host Name",
+    "Table_Test Schedule": "Test Activity / Milestone, Start Date, End Date",
+    "Table_Risks": "Risk, Priority, Avoidance",
+}
+
+
+def split_list(value):
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+def normalize_header(value):
+    """Header cell text compared case- and whitespace-insensitively."""
+    return " ".join(str(value).split()).lower() if value is not None else ""
+
+
+class RuleSet:
+    """Compiled validation rules, shared by every validation until the rules file changes."""
+
+    def __init__(self, raw_rules):
+        self.raw_rules = dict(raw_rules)
+        self.required_fields = split_list(raw_rules["Slide1_MandatoryFieldsToValidate"])
+        self.slide1_patterns = {
+            key[len(PATTERN_PREFIX):]: re.compile(pattern, re.IGNORECASE)
+            for key, pattern in raw_rules.items() if key.startswith(PATTERN_PREFIX)
+        }
+        self.test_types = [t.lower() for t in split_list(raw_rules["Slide2_TestTypes"])]
+        self.workbook_required_sheets = split_list(raw_rules["Slide2_Workbook_RequiredSheets"])
+        self.workbook_required_columns = [normalize_header(c) for c in
+                                          split_list(raw_rules["Slide2_Workbook_RequiredColumns"])]
+        self.workbook_header_scan_rows = int(float(raw_rules["Slide2_Workbook_HeaderScanRows"]))
+        self.title_keywords = [k.lower() for k in split_list(raw_rules["Slide3_TitleKeywords"])]
+        self.observation_keywords = [k.lower() for k in split_list(raw_rules["Slide3_ObservationKeywords"])]
+        self.title_scanner = KeywordScanner({"title": self.title_keywords})
+        self.observation_scanner = KeywordScanner({"observation": self.observation_keywords})
+        self.fingerprint = hashlib.sha256(
+            repr(sorted(self.raw_rules.items())).encode("utf-8")).hexdigest()[:16]
+
+
+class WordRuleSet:
+    """Compiled Word strategy rules: expected sections, page 1 release fields and required tables."""
+
+    def __init__(self, raw_rules):
+        self.raw_rules = dict(raw_rules)
+        self.sections = split_list(raw_rules["Sections"])
+        self.required_fields = split_list(raw_rules["Page1_MandatoryFieldsToValidate"])
+        self.required_tables = {
+            key[len(TABLE_PREFIX):]: [normalize_header(c) for c in split_list(columns)]
+            for key, columns in raw_rules.items() if key.startswith(TABLE_PREFIX) and split_list(columns)
+        }
+
+        # "Label: value" on page 1; a value ends at the next label, a tab or a wide gap
+        labels = "|".join(re.escape(field) for field in sorted(self.required_fields, key=len, reverse=True))
+        self.field_patterns = {
+            field: re.compile(rf"\b{re.escape(field)}\s*:\s*(.*?)\s*(?=\t|\s{{2,}}|\b(?:{labels})\s*:|$)",
+                              re.IGNORECASE)
+            for field in self.required_fields
+        }
+        self.fingerprint = hashlib.sha256(
+            repr(sorted(self.raw_rules.items())).encode("utf-8")).hexdigest()[:16]
+
+
+def read_raw_rules(rules_file=RULES_FILE, sheet_name=RULES_SHEET, defaults=DEFAULT_RULES):
+    """Reads the Key / Value rows of the rules sheet on top of the given defaults."""
+    raw_rules = dict(defaults)
+    if not os.path.exists(rules_file):
+        return raw_rules
+    sheets = pd.read_excel(rules_file, sheet_name=None, dtype=str)
+    if sheet_name not in sheets:
+        return raw_rules
+    for _, row in sheets[sheet_name].dropna(subset=["Key", "Value"]).iterrows():
+        raw_rules[row["Key"].strip()] = row["Value"].strip()
+    return raw_rules
+
+
+_ruleset_lock = threading.Lock()
+_ruleset_cache = {}  # (rules file, sheet) -> (mtime, RuleSet / WordRuleSet)
+
+
+def load_ruleset(rules_file=RULES_FILE, sheet_name=RULES_SHEET):
+    """Returns the compiled RuleSet, re-reading the rules file only when its mtime changes."""
+    return _load_cached(rules_file, sheet_name, RuleSet, DEFAULT_RULES)
+
+
+def load_word_ruleset(rules_file=RULES_FILE, sheet_name=WORD_RULES_SHEET):
+    """Returns the compiled WordRuleSet, re-reading the rules file only when its mtime changes."""
+    return _load_cached(rules_file, sheet_name, WordRuleSet, DEFAULT_WORD_RULES)
+
+
+def _load_cached(rules_file, sheet_name, ruleset_class, defaults):
+    try:
+        mtime = os.path.getmtime(rules_file)
+    except OSError:
+        mtime = None  # No rules file: built-in defaults
+
+    cache_key = (rules_file, sheet_name, ruleset_class)
+    with _ruleset_lock:
+        cached = _ruleset_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        ruleset = ruleset_class(read_raw_rules(rules_file, sheet_name, defaults))
+        _ruleset_cache[cache_key] = (mtime, ruleset)
+        return ruleset
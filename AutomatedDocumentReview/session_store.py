@@ -0,0 +1,142 @@
+"""
+Bounded, process-wide store for the large per-session values of the Streamlit pages.
+
+st.session_state lives as long as the browser session and has no size limit, so
+keeping whole validation results there made the server's memory grow with every
+user. The pages now put such values in default_store and keep only a StoreHandle
+in session state: the store key, the value's size and, where the value can be
+rebuilt, a loader (e.g. reading the results back from the on-disk result cache).
+
+    handle = default_store.put(results, loader=lambda: default_cache.get(cache_key))
+    st.session_state.validation_results = handle
+    results = default_store.get(handle)   # the value, reloaded if it was evicted, or None
+    default_store.stats()                 # memory gauge
+
+The store holds at most STORE_MAX_BYTES, evicting the least recently used values
+first, and drops values not read for STORE_TTL_SECONDS. Sizes are estimated from
+the byte length of bytes values and the JSON length of everything else. A handle
+whose value is gone and has no loader returns None; the page then asks the user
+to repeat the step.
+"""
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
+
+STORE_MAX_BYTES = 128 * 1024 * 1024   # 128 MB for all sessions together
+STORE_TTL_SECONDS = 60 * 60           # Values not read for an hour are dropped
+
+
+def estimate_size(value):
+    """Approximate size of a value: byte length for bytes, JSON length for results and other plain data."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+class StoreHandle:
+    """What a session keeps instead of the value itself."""
+
+    __slots__ = ("key", "size", "loader")
+
+    def __init__(self, key, size, loader=None):
+        self.key = key
+        self.size = size
+        self.loader = loader
+
+    def __repr__(self):
+        return f"StoreHandle({self.key!r}, {self.size} bytes)"
+
+
+class SessionStore:
+    """
+    In-memory values shared by all sessions, with LRU eviction over a byte budget and an idle TTL.
+
+    :param max_bytes: Budget for all stored values together (the newest value is always kept).
+    :param ttl_seconds: Values not read for this long are dropped.
+    """
+
+    def __init__(self, max_bytes=STORE_MAX_BYTES, ttl_seconds=STORE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> [value, size, last used]
+        self._bytes = 0
+        self._keys = itertools.count(1)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.evictions = 0
+
+    def put(self, value, loader=None):
+        """Stores a value and returns its handle; loader() must rebuild the value (or return None)."""
+        handle = StoreHandle(f"value-{next(self._keys)}", estimate_size(value), loader)
+        self._store(handle, value)
+        return handle
+
+    def get(self, handle):
+        """The value of a handle, reloaded through its loader when it was evicted; None when it is gone."""
+        if handle is None:
+            return None
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.get(handle.key)
+            if entry is not None:
+                entry[2] = time.monotonic()
+                self._entries.move_to_end(handle.key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        if handle.loader is None:
+            return None
+
+        value = handle.loader()  # Outside the lock: may read from disk
+        if value is not None:
+            with self._lock:
+                self.reloads += 1
+            self._store(handle, value)
+        return value
+
+    def discard(self, handle):
+        """Frees a value the session no longer needs (e.g. replaced by new results)."""
+        if handle is None:
+            return
+        with self._lock:
+            entry = self._entries.pop(handle.key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def stats(self):
+        with self._lock:
+            self._expire(time.monotonic())
+            return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "reloads": self.reloads,
+                    "evictions": self.evictions}
+
+    def _store(self, handle, value):
+        with self._lock:
+            previous = self._entries.pop(handle.key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[handle.key] = [value, handle.size, time.monotonic()]
+            self._bytes += handle.size
+            self._expire(time.monotonic())
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, size, _) = self._entries.popitem(last=False)  # Least recently used first
+                self._bytes -= size
+                self.evictions += 1
+
+    def _expire(self, now):
+        """Drops values idle for longer than the TTL (oldest first; called with the lock held)."""
+        while self._entries:
+            key, (_, size, last_used) = next(iter(self._entries.items()))
+            if now - last_used <= self.ttl_seconds:
+                break
+            del self._entries[key]
+            self._bytes -= size
+            self.evictions += 1
+
+
+# Process-wide store shared by every Streamlit session
+default_store = SessionStore()
@@ -0,0 +1,33 @@
+"""
+Shared setup for the tests (run from the AutomatedDocumentReview folder: python -m pytest -q tests).
+
+The app modules resolve config/ and cache/ from the working directory when they are
+imported, so the tests run in a temporary working directory holding a copy of
+config/. Nothing is written to the app's own cache.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORK_DIR = tempfile.mkdtemp(prefix="adr-tests-")
+
+shutil.copytree(os.path.join(APP_DIR, "config"), os.path.join(WORK_DIR, "config"))
+os.chdir(WORK_DIR)
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, os.path.join(APP_DIR, "benchmarks"))
+
+
+def pytest_unconfigure(config):
+    os.chdir(APP_DIR)
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def deck_path(tmp_path_factory):
+    """A small synthetic report deck: 8 slides, tables, one embedded workbook."""
+    from synthetic_decks import build_deck
+    return build_deck(str(tmp_path_factory.mktemp("decks") / "report.pptx"), slides=8, table_rows=5, embeddings=1)
@@ -0,0 +1,61 @@
+import multiprocessing
+import os
+
+import pandas as pd
+import pytest
+
+import batch_validate
+from synthetic_decks import CHECKLIST_ROW, build_deck
+from workbook_writer import write_xlsx
+
+_validate_deck = batch_validate.validate_deck
+
+
+def crashing_validate_deck(path):
+    """validate_deck whose worker dies on decks named crash*.pptx, as on running out of memory."""
+    if os.path.basename(path).startswith("crash"):
+        os._exit(1)
+    return _validate_deck(path)
+
+
+@pytest.fixture
+def releases_file(tmp_path):
+    path = str(tmp_path / "SampleReleases.xlsx")
+    write_xlsx(path, [list(CHECKLIST_ROW), list(CHECKLIST_ROW.values())])
+    return path
+
+
+def test_decks_are_validated_in_input_order(tmp_path, releases_file):
+    decks = [build_deck(str(tmp_path / f"deck{i}.pptx"), slides=4) for i in range(3)]
+    outcomes = batch_validate.run_batch(decks, releases_file, batch_validate.DEFAULT_KEY_COLUMNS, workers=2)
+
+    assert [outcome["File"] for outcome in outcomes] == decks
+    assert {outcome["Status"] for outcome in outcomes} == {"VALIDATED"}
+    assert outcomes[0]["Matched Release"] == CHECKLIST_ROW["Enterprise Release ID"]
+
+
+def test_match_release_row_uses_the_key_index():
+    catalog = pd.DataFrame({"Enterprise Release ID": ["2025.M01", "2025.m01 ", "2025.M02"],
+                            "Release": ["RLSE1", "RLSE2", "RLSE1"]})
+    keys = ["Enterprise Release ID", "Release"]
+    index = batch_validate.build_key_index(catalog, keys)
+
+    rows, error = batch_validate.match_release_row(catalog, keys, {"Enterprise Release ID": "2025.M01",
+                                                                   "Release": "rlse2"}, index)
+    assert error is None and rows == [{"Enterprise Release ID": "2025.m01 ", "Release": "RLSE2"}]
+    rows, error = batch_validate.match_release_row(catalog, keys[:1], {"Enterprise Release ID": " 2025.M01"})
+    assert [row["Release"] for row in rows] == ["RLSE1", "RLSE2"]
+    rows, error = batch_validate.match_release_row(catalog, keys, {"Enterprise Release ID": "2025.M03",
+                                                                   "Release": "RLSE1"}, index)
+    assert rows == [] and error.startswith("No release row matches")
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="workers must inherit the patched validate_deck")
+def test_only_the_deck_that_kills_its_worker_is_crashed(tmp_path, releases_file, monkeypatch):
+    monkeypatch.setattr(batch_validate, "validate_deck", crashing_validate_deck)
+    names = ["a.pptx", "b.pptx", "crash.pptx", "c.pptx", "d.pptx", "e.pptx"]
+    decks = [build_deck(str(tmp_path / name), slides=4) for name in names]
+
+    outcomes = batch_validate.run_batch(decks, releases_file, batch_validate.DEFAULT_KEY_COLUMNS, workers=2)
+    assert [outcome["Status"] for outcome in outcomes] == ["VALIDATED"] * 2 + ["CRASHED"] + ["VALIDATED"] * 3
@@ -0,0 +1,86 @@
+import random
+import re
+
+import pytest
+
+import keyword_scanner
+from keyword_scanner import KeywordHit, KeywordScanner, trie_pattern
+
+
+def naive_hits(groups, text, whole_word=False):
+    """Every occurrence of every keyword, found one keyword at a time."""
+    hits = set()
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            keyword = keyword.lower()
+            boundary = r"\b" if whole_word else ""
+            for match in re.finditer(rf"(?=({boundary}{re.escape(keyword)}{boundary}))", text):
+                hits.add(KeywordHit(keyword, group, match.start(), match.start() + len(keyword)))
+    return hits
+
+
+def test_overlapping_keywords_are_all_reported():
+    scanner = KeywordScanner({"title": ["chart", "art"], "observation": ["observation"]})
+    assert scanner.scan("chart of observations") == [
+        KeywordHit("chart", "title", 0, 5),
+        KeywordHit("art", "title", 2, 5),
+        KeywordHit("observation", "observation", 9, 20),
+    ]
+
+
+def test_prefixes_at_the_same_position_come_shortest_first():
+    scanner = KeywordScanner({"a": ["obs", "observation", "observations"]})
+    assert [(hit.keyword, hit.start, hit.end) for hit in scanner.scan("observations")] == [
+        ("obs", 0, 3), ("observation", 0, 11), ("observations", 0, 12)]
+
+
+def test_keyword_in_several_groups_hits_each_group():
+    scanner = KeywordScanner({"title": ["summary"], "observation": ["Summary"]})
+    assert [hit.group for hit in scanner.scan("summary")] == ["title", "observation"]
+    assert scanner.groups_found("executive summary") == {"title", "observation"}
+
+
+def test_whole_word_skips_prefixes_that_end_inside_a_word():
+    scanner = KeywordScanner({"a": ["test", "test plan", "plan"]}, whole_word=True)
+    assert [hit.keyword for hit in scanner.scan("test plans and a test plan")] == ["test", "test", "test plan", "plan"]
+
+
+def test_groups_without_keywords_are_ignored():
+    scanner = KeywordScanner({"title": [], "observation": [""]})
+    assert scanner.groups == [] and scanner.pattern is None
+    assert scanner.scan("anything") == [] and scanner.groups_found("anything") == set()
+
+
+def test_trie_pattern_factors_out_common_prefixes():
+    assert trie_pattern(["chart", "check"]) == "ch(?:art|eck)"
+    assert re.fullmatch(trie_pattern(["ab", "abc"]), "abc")
+
+
+@pytest.fixture(params=["find", "regex"])
+def scan_path(request, monkeypatch):
+    """Runs a test once on small keyword sets (str.find) and once with every set compiled to the regex."""
+    if request.param == "regex":
+        monkeypatch.setattr(keyword_scanner, "FIND_MAX_KEYWORDS", 0)
+    return request.param
+
+
+def test_groups_found_stops_at_the_first_keyword_of_each_group(scan_path):
+    scanner = KeywordScanner({"title": ["chart", "summary"], "observation": ["issue"], "empty": []})
+    assert scanner.groups_found("summary chart") == {"title"}
+    assert scanner.groups_found("an issue in the chart") == {"title", "observation"}
+    assert scanner.groups_found("nothing here") == set() and scanner.groups_found("") == set()
+
+
+def test_scan_matches_naive_search(scan_path):
+    rng = random.Random(7)
+    words = ["load", "loads", "peak", "peak load", "ad", "oad", "a", "response", "res", "resp", "on", "nse"]
+    for _ in range(200):
+        groups = {f"g{i}": rng.sample(words, rng.randint(1, 4)) for i in range(3)}
+        text = " ".join(rng.choice(words + ["x", "loading", "peaks"]) for _ in range(12))
+        for whole_word in (False, True):
+            hits = KeywordScanner(groups, whole_word=whole_word).scan(text)
+            assert len(hits) == len(set(hits))
+            assert set(hits) == naive_hits(groups, text, whole_word)
+            assert [hit.start for hit in hits] == sorted(hit.start for hit in hits)
+            assert KeywordScanner(groups, whole_word=whole_word).groups_found(text) == {
+                group for _, group, _, _ in naive_hits(groups, text, whole_word)}
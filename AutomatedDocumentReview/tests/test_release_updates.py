@@ -0,0 +1,152 @@
+import io
+import os
+
+import openpyxl
+import pytest
+
+from release_catalog import build_snapshot, load_catalog, row_record
+from release_updates import (VERSIONS_KEPT, CatalogSchemaError, merge_releases, published_versions,
+                             replace_releases)
+from workbook_reader import XlsxStreamReader
+from workbook_writer import write_xlsx
+
+COLUMNS = ["Enterprise Release ID", "Clarity Project ID", "Project Name", "Release"]
+RELEASES = [
+    ["2025.M01", "PRJ-001", "Payments", "RLSE1001"],
+    ["2025.M02", "PRJ-002", "Lending", "RLSE1002"],
+    ["2025.M03", "PRJ-003", "Cards", "RLSE1003"],
+]
+
+
+def workbook_bytes(rows):
+    buffer = io.BytesIO()
+    write_xlsx(buffer, rows)
+    return buffer.getvalue()
+
+
+def read_workbook(path):
+    """The first sheet as text rows, as the catalog reads it."""
+    with XlsxStreamReader(path) as workbook:
+        return [row_record(row, len(COLUMNS)) for row in workbook.iter_rows(workbook.sheet_names[0])]
+
+
+@pytest.fixture
+def target(tmp_path):
+    path = tmp_path / "SampleReleases.xlsx"
+    path.write_bytes(workbook_bytes([COLUMNS, *RELEASES]))
+    return str(path)
+
+
+@pytest.fixture
+def versions_dir(tmp_path):
+    return str(tmp_path / "versions")
+
+
+def test_merge_updates_and_adds_releases_by_key(target, versions_dir):
+    upload = workbook_bytes([["Enterprise Release ID", "Clarity Project ID", "Project Name"],
+                             ["2025.M02", "PRJ-002", "Lending v2"],
+                             ["2025.M01", "PRJ-001", "Payments"],  # Unchanged
+                             ["2025.M04", "PRJ-004", "Savings"]])
+    entry = merge_releases(upload, target=target, versions_dir=versions_dir)
+
+    assert (entry["added"], entry["updated"], entry["unchanged"], entry["rows"]) == (1, 1, 1, 4)
+    expected = [COLUMNS, RELEASES[0], ["2025.M02", "PRJ-002", "Lending v2", "RLSE1002"], RELEASES[2],
+                ["2025.M04", "PRJ-004", "Savings", ""]]
+    assert read_workbook(target) == expected
+    assert load_catalog(target).frame.values.tolist() == expected[1:]
+    assert published_versions(versions_dir)[0]["version"] == entry["version"]
+    assert os.path.exists(os.path.join(versions_dir, entry["file"]))
+
+
+def test_merged_snapshot_matches_a_rebuild(target, versions_dir, tmp_path):
+    upload = workbook_bytes([["Enterprise Release ID", "Clarity Project ID", "Release"],
+                             ["2025.M03", "PRJ-003", "RLSE9999"],
+                             ["2025.M05", "PRJ-005", "RLSE1005"]])
+    merge_releases(upload, target=target, versions_dir=versions_dir)
+    merged = load_catalog(target)
+    rebuilt = type(merged)(target, merged.sha256, build_snapshot(target, str(tmp_path / "rebuilt.sqlite")))
+
+    assert merged.frame.equals(rebuilt.frame)
+    for query in ("rlse9999", "cards", "rlse1003", "prj 005"):
+        assert merged.search(query) == rebuilt.search(query)
+    assert merged.match_text("Release RLSE9999 for Cards") == rebuilt.match_text("Release RLSE9999 for Cards")
+    assert merged.match_text("RLSE1003") == []  # The old key is gone from the index
+
+
+def test_merge_without_changes_publishes_nothing(target, versions_dir):
+    before = read_workbook(target)
+    entry = merge_releases(workbook_bytes([COLUMNS, RELEASES[1]]), target=target, versions_dir=versions_dir)
+    assert entry["version"] is None and entry["unchanged"] == 1
+    assert read_workbook(target) == before
+    assert published_versions(versions_dir) == []
+
+
+@pytest.mark.parametrize("rows, message", [
+    ([["Enterprise Release ID", "Clarity Project ID", "Budget"], ["2025.M01", "PRJ-001", "1"]], "not in the catalog"),
+    ([["Enterprise Release ID", "Project Name"], ["2025.M01", "Payments"]], "Key columns missing"),
+    ([COLUMNS, RELEASES[0], RELEASES[0]], "same key"),
+    ([COLUMNS, ["", "PRJ-001", "Payments", ""]], "no value"),
+])
+def test_merge_rejects_uploads_that_do_not_fit(target, versions_dir, rows, message):
+    before = read_workbook(target)
+    with pytest.raises(CatalogSchemaError, match=message):
+        merge_releases(workbook_bytes(rows), target=target, versions_dir=versions_dir)
+    assert read_workbook(target) == before
+
+
+def test_replace_publishes_the_upload_as_is(target, versions_dir):
+    upload = workbook_bytes([COLUMNS, RELEASES[2]])
+    entry = replace_releases(upload, target=target, versions_dir=versions_dir)
+
+    with open(target, "rb") as published:
+        assert published.read() == upload
+    assert entry["rows"] == 1
+    assert load_catalog(target).frame.values.tolist() == [RELEASES[2]]
+    assert [version["mode"] for version in published_versions(versions_dir)] == ["replace", "original"]
+
+
+def test_replace_requires_the_catalog_columns(target, versions_dir):
+    with pytest.raises(CatalogSchemaError, match="Required columns missing"):
+        replace_releases(workbook_bytes([["Enterprise Release ID"], ["2025.M09"]]), target=target,
+                         versions_dir=versions_dir)
+    with pytest.raises(CatalogSchemaError, match="no releases"):
+        replace_releases(workbook_bytes([COLUMNS]), target=target, versions_dir=versions_dir)
+
+
+def test_previous_version_stays_readable_after_publishing(target, versions_dir):
+    previous = load_catalog(target)
+    replace_releases(workbook_bytes([COLUMNS, RELEASES[0]]), target=target, versions_dir=versions_dir)
+
+    assert len(load_catalog(target)) == 1
+    assert os.path.exists(previous.db_path)
+    assert previous.page(limit=10).values.tolist() == RELEASES  # A session still holding the old version
+
+
+def test_original_workbook_is_archived_once_and_never_pruned(target, versions_dir):
+    with open(target, "rb") as source:
+        original = source.read()
+    for i in range(VERSIONS_KEPT + 2):
+        replace_releases(workbook_bytes([COLUMNS, [f"2025.R{i:02d}", "PRJ-001", "Payments", ""]]), target=target,
+                         versions_dir=versions_dir)
+
+    entries = published_versions(versions_dir, limit=None)
+    assert [entry["mode"] for entry in entries].count("original") == 1
+    archived = os.path.join(versions_dir, entries[-1]["file"])
+    with open(archived, "rb") as source:
+        assert entries[-1]["mode"] == "original" and source.read() == original
+    assert len(os.listdir(versions_dir)) == VERSIONS_KEPT + 2  # Kept versions, the original and the log
+
+
+def test_merge_keeps_numeric_cells_numeric(tmp_path, versions_dir):
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["Enterprise Release ID", "Clarity Project ID", "Application ID", "Project Name"])
+    workbook.active.append([2025.3, "PRJ-001", 1002, "Payments"])
+    workbook.active.append(["2025.M02", "PRJ-002", "007", "Lending"])
+    target = str(tmp_path / "SampleReleases.xlsx")
+    workbook.save(target)
+
+    upload = workbook_bytes([["Enterprise Release ID", "Clarity Project ID", "Project Name"],
+                             ["2025.M02", "PRJ-002", "Lending v2"]])
+    merge_releases(upload, target=target, versions_dir=versions_dir)
+    rows = list(openpyxl.load_workbook(target).active.iter_rows(values_only=True))
+    assert rows[1:] == [(2025.3, "PRJ-001", 1002, "Payments"), ("2025.M02", "PRJ-002", "007", "Lending v2")]
@@ -0,0 +1,96 @@
+import io
+import struct
+import zipfile
+
+import pytest
+
+from ppt_validator import open_pptx_package, validate_ppt
+from revisions import RevisionStore, members_intact, validate_revision
+from rules import DEFAULT_RULES, RuleSet
+from synthetic_decks import CHECKLIST_ROW
+
+SLIDE5 = "ppt/slides/slide5.xml"
+
+
+def rewrite_member(data, name, transform):
+    """The deck with one member rewritten (zipfile records the new CRC and size)."""
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            content = source.read(info)
+            target.writestr(info, transform(content) if info.filename == name else content)
+    return output.getvalue()
+
+
+def forge_directory_entry(data, name, crc, file_size):
+    """The deck with the central directory entry of one member claiming another CRC and size."""
+    data = bytearray(data)
+    position = data.find(b"PK\x01\x02")
+    while True:
+        name_length = struct.unpack_from("<H", data, position + 28)[0]
+        if data[position + 46:position + 46 + name_length] == name.encode("utf-8"):
+            break
+        position = data.find(b"PK\x01\x02", position + 4)
+    struct.pack_into("<I", data, position + 16, crc)
+    struct.pack_into("<I", data, position + 24, file_size)
+    return bytes(data)
+
+
+def change_text(content):
+    return content.replace(b"<a:t>", b"<a:t>Revised ", 1)
+
+
+@pytest.fixture
+def deck(deck_path):
+    with open(deck_path, "rb") as source:
+        return source.read()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RevisionStore(str(tmp_path / "revisions"))
+
+
+def test_first_upload_validates_every_slide(deck, store):
+    results, recomputed = validate_revision(deck, CHECKLIST_ROW, store=store)
+    assert results == validate_ppt(deck, CHECKLIST_ROW)
+    assert recomputed == list(results)
+
+
+def test_unchanged_upload_reuses_every_slide(deck, store):
+    first, _ = validate_revision(deck, CHECKLIST_ROW, store=store)
+    results, recomputed = validate_revision(deck, CHECKLIST_ROW, store=store)
+    assert recomputed == []
+    assert results == first
+
+
+def test_revised_slide_is_the_only_one_validated_again(deck, store):
+    validate_revision(deck, CHECKLIST_ROW, store=store)
+    revised = rewrite_member(deck, SLIDE5, change_text)
+
+    results, recomputed = validate_revision(revised, CHECKLIST_ROW, store=store)
+    assert recomputed == ["Slide 5"]
+    assert results == validate_ppt(revised, CHECKLIST_ROW)
+
+
+def test_other_release_or_ruleset_starts_from_scratch(deck, store):
+    first, _ = validate_revision(deck, CHECKLIST_ROW, store=store)
+
+    _, recomputed = validate_revision(deck, {**CHECKLIST_ROW, "Project Name": "Another project"}, store=store)
+    assert recomputed == list(first)
+    ruleset = RuleSet({**DEFAULT_RULES, "Slide3_TitleKeywords": "unlikely keyword"})
+    _, recomputed = validate_revision(deck, CHECKLIST_ROW, store=store, ruleset=ruleset)
+    assert recomputed == list(first)
+
+
+def test_forged_directory_entry_is_not_reused(deck, store):
+    validate_revision(deck, CHECKLIST_ROW, store=store)
+    with zipfile.ZipFile(io.BytesIO(deck)) as original:
+        info = original.getinfo(SLIDE5)
+    forged = forge_directory_entry(rewrite_member(deck, SLIDE5, change_text), SLIDE5, info.CRC, info.file_size)
+
+    with open_pptx_package(forged) as package:
+        assert not members_intact(package, [SLIDE5])
+        assert members_intact(package, ["ppt/slides/slide4.xml"])
+    with pytest.raises(zipfile.BadZipFile):
+        validate_revision(forged, CHECKLIST_ROW, store=store)  # Validated again, and the data fails its CRC
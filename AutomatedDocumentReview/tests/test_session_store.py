@@ -0,0 +1,60 @@
+import pytest
+
+import session_store
+from session_store import SessionStore, estimate_size
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A monotonic clock the test moves by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(session_store.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_least_recently_used_values_are_evicted_over_budget():
+    store = SessionStore(max_bytes=250)
+    first, second = store.put(b"a" * 100), store.put(b"b" * 100)
+    assert store.get(first) == b"a" * 100  # Now more recently used than second
+
+    third = store.put(b"c" * 100)
+    assert store.get(second) is None
+    assert store.get(first) is not None and store.get(third) is not None
+    assert store.stats()["bytes"] == 200 and store.stats()["evictions"] == 1
+
+
+def test_newest_value_is_kept_even_over_budget():
+    store = SessionStore(max_bytes=10)
+    handle = store.put(b"x" * 100)
+    assert store.get(handle) == b"x" * 100
+
+
+def test_evicted_value_is_reloaded_through_its_loader():
+    store = SessionStore(max_bytes=150)
+    results = {"Slide 1": {"Project Name": "✅ Matched"}}
+    handle = store.put(results, loader=lambda: results)
+    store.put(b"x" * 140)
+
+    assert store.get(handle) == results
+    assert store.stats()["reloads"] == 1
+
+
+def test_idle_values_expire(clock):
+    store = SessionStore(ttl_seconds=60)
+    idle, active = store.put(b"idle"), store.put(b"active")
+    clock[0] += 45
+    store.get(active)
+    clock[0] += 30
+
+    assert store.get(idle) is None
+    assert store.get(active) == b"active"
+    assert store.stats()["entries"] == 1
+
+
+def test_discard_frees_the_value():
+    store = SessionStore()
+    handle = store.put({"rows": list(range(10))})
+    assert store.stats()["bytes"] == handle.size == estimate_size({"rows": list(range(10))})
+    store.discard(handle)
+    store.discard(None)
+    assert store.get(handle) is None and store.stats()["bytes"] == 0
@@ -0,0 +1,54 @@
+import http.client
+import json
+import os
+import threading
+
+import pytest
+
+from validation_api import ValidationHTTPServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ValidationHTTPServer(("127.0.0.1", 0), workers=1,
+                                  releases_file=os.path.join("config", "SampleReleases.xlsx"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=30)
+    try:
+        connection.putrequest(method, path)
+        for name, value in (headers or {}).items():
+            connection.putheader(name, value)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_releases_are_limited(server):
+    status, body = request(server, "GET", "/releases?limit=2")
+    assert status == 200 and len(body["releases"]) == 2 and body["total"] > 2
+
+
+@pytest.mark.parametrize("limit", ["0", "-1", "abc"])
+def test_invalid_limit_is_a_bad_request(server, limit):
+    status, body = request(server, "GET", f"/releases?limit={limit}")
+    assert status == 400 and "limit" in body["error"]
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", ""])
+def test_invalid_content_length_is_a_bad_request(server, length):
+    status, body = request(server, "POST", "/validate", b"PK", {"Content-Length": length})
+    assert status == 400 and "Content-Length" in body["error"]
+
+
+def test_missing_content_length_is_refused(server):
+    status, _ = request(server, "POST", "/validate")
+    assert status == 411
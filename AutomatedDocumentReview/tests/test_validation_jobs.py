@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from validation_jobs import DONE, FAILED, QueueFullError, ValidationJobQueue
+
+
+def wait_finished(queue, job_id, timeout=10):
+    job = queue.get(job_id)
+    for _ in range(int(timeout / 0.01)):
+        if not job.active:
+            return queue.snapshot(job_id)
+        threading.Event().wait(0.01)
+    raise AssertionError("The job did not finish")
+
+
+def slides(progress):
+    results = {}
+    for n in range(1, 4):
+        results[f"Slide {n}"] = {"Check": "✅ Valid"}
+        progress(f"Slide {n}", results[f"Slide {n}"], n, 3)
+    return results
+
+
+def test_finished_job_reports_its_results():
+    queue = ValidationJobQueue(workers=1)
+    snapshot = wait_finished(queue, queue.submit(slides))
+    assert snapshot["state"] == DONE and (snapshot["completed"], snapshot["total"]) == (3, 3)
+    assert list(snapshot["results"]) == ["Slide 1", "Slide 2", "Slide 3"]
+
+
+def test_released_job_keeps_only_its_state():
+    queue = ValidationJobQueue(workers=1)
+    job_id = queue.submit(slides)
+    wait_finished(queue, job_id)
+
+    assert queue.release(job_id)
+    snapshot = queue.snapshot(job_id)
+    assert snapshot["state"] == DONE and snapshot["released"] and snapshot["completed"] == 3
+    assert snapshot["results"] == {} and queue.get(job_id).results == {}
+    assert not queue.release("unknown")
+
+
+def test_job_released_while_running_does_not_collect_results():
+    queue = ValidationJobQueue(workers=1)
+    started, proceed = threading.Event(), threading.Event()
+
+    def task(progress):
+        started.set()
+        proceed.wait(10)
+        return slides(progress)
+
+    job_id = queue.submit(task)
+    started.wait(10)
+    queue.release(job_id)
+    proceed.set()
+    snapshot = wait_finished(queue, job_id)
+    assert snapshot["state"] == DONE and snapshot["results"] == {} and snapshot["completed"] == 3
+
+
+def test_failures_and_limits():
+    queue = ValidationJobQueue(workers=1, max_jobs_per_owner=1)
+    blocker = threading.Event()
+    job_id = queue.submit(lambda progress: blocker.wait(10) and {}, owner="session")
+    with pytest.raises(QueueFullError):
+        queue.submit(slides, owner="session")
+    blocker.set()
+    wait_finished(queue, job_id)
+
+    snapshot = wait_finished(queue, queue.submit(lambda progress: 1 / 0, owner="session"))
+    assert snapshot["state"] == FAILED and snapshot["error"].startswith("ZeroDivisionError")
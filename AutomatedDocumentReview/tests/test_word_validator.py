@@ -0,0 +1,62 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+from word_validator import W_NS, parse_document_xml, read_docx, validate_docx
+
+STRATEGY_DOCX = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             "performance-testing-strategy.docx")
+
+
+def paragraph(text, style=None, outline=None):
+    properties = ""
+    if style or outline is not None:
+        properties = "<w:pPr>" + (f'<w:pStyle w:val="{style}"/>' if style else "") + \
+                     (f'<w:outlineLvl w:val="{outline}"/>' if outline is not None else "") + "</w:pPr>"
+    return f"<w:p>{properties}<w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def table(*rows):
+    return "<w:tbl>" + "".join("<w:tr>" + "".join(f"<w:tc>{cell}</w:tc>" for cell in row) + "</w:tr>"
+                               for row in rows) + "</w:tbl>"
+
+
+def document_xml(body):
+    return f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'.encode("utf-8")
+
+
+def test_document_is_split_into_front_matter_headings_and_tables():
+    inner = table([paragraph("Tool"), paragraph("Version")])
+    body = (paragraph("Performance Test Strategy") + paragraph("Project Name: Payments")
+            + paragraph("Introduction", style="Heading1") + paragraph("Body text")
+            + paragraph("Scope", outline=1) + paragraph("Not a heading", style="Normal")
+            + table([paragraph("Name"), paragraph("Role")], [paragraph("Ann") + paragraph("Lead"), inner]))
+    content = parse_document_xml(io.BytesIO(document_xml(body)), {"Heading1": 0})
+
+    assert content.front_matter == ["Performance Test Strategy", "Project Name: Payments"]
+    assert content.headings == [(0, "Introduction"), (1, "Scope")]
+    assert content.tables == [[["Tool", "Version"]], [["Name", "Role"], ["Ann Lead", ""]]]  # Inner table closes first
+    assert content.paragraph_count == 6
+
+
+def test_bundled_strategy_document():
+    content = read_docx(STRATEGY_DOCX)
+    assert "Project Name: Project Y - ABC" in content.front_matter
+    assert (0, "Document Information") in content.headings
+
+    results = validate_docx(STRATEGY_DOCX, {"Project Name": "Project Y - ABC"})
+    assert set(results) == {"Page 1", "Sections", "Tables"}
+    assert results["Page 1"]["Project Name"].startswith("✅")
+    assert results["Sections"]["Introduction"] == "✅ Found"
+
+
+def test_unreadable_uploads_raise_what_the_page_reports():
+    with pytest.raises(zipfile.BadZipFile):
+        read_docx(b"not a zip file")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("xl/workbook.xml", "<workbook/>")
+    with pytest.raises(KeyError):
+        read_docx(buffer.getvalue())
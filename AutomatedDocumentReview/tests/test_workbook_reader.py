@@ -0,0 +1,59 @@
+import io
+
+import openpyxl
+import pytest
+
+from workbook_reader import XlsxStreamReader, column_index, iterparse_released
+from zip_budget import ZipBudget, ZipBudgetError
+
+
+@pytest.fixture
+def workbook_data():
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Results"
+    sheet.append(["Transaction Name", "Average", "Pass", "Released"])
+    sheet.append(["Login", 1.25, 100, True])
+    sheet.append(["Search", 2, 98, False])
+    sheet["F4"] = "after a gap"
+    workbook.create_sheet("Empty")
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_rows_read_like_openpyxl(workbook_data):
+    with XlsxStreamReader(workbook_data) as workbook:
+        assert workbook.sheet_names == ["Results", "Empty"]
+        rows = list(workbook.iter_rows("Results"))
+        assert list(workbook.iter_rows("Empty")) == []
+
+    # Same values as openpyxl, without its padding of every row to the widest one
+    expected = openpyxl.load_workbook(io.BytesIO(workbook_data), read_only=True)["Results"]
+    assert [row + (None,) * (6 - len(row)) for row in rows] == list(expected.iter_rows(values_only=True))
+    assert rows[1] == ("Login", 1.25, 100, True)
+
+
+def test_reads_are_charged_to_the_budget(workbook_data):
+    with pytest.raises(ZipBudgetError):
+        with XlsxStreamReader(workbook_data, ZipBudget(max_total_bytes=100)) as workbook:
+            list(workbook.iter_rows("Results"))
+
+
+def test_iterparse_released_keeps_only_open_elements():
+    xml = "<sheet><rows>" + "<row><c>1</c><c>2</c></row>" * 1000 + "</rows><footer/></sheet>"
+    root = None
+    cells_per_row = []
+    for event, elem in iterparse_released(io.BytesIO(xml.encode()), events=("start", "end"), release={"row"}):
+        if event == "start" and root is None:
+            root = elem
+        elif event == "end" and elem.tag == "row":
+            cells_per_row.append(len(elem))  # Cells are still there when the row ends
+
+    assert cells_per_row == [2] * 1000
+    assert len(root.find("rows")) == 0  # Every finished row was detached
+    assert root.find("footer") is not None  # Tags outside `release` stay in the tree
+
+
+def test_column_index():
+    assert [column_index(ref) for ref in ("A1", "Z9", "AA10", "AB12")] == [0, 25, 26, 27]
@@ -0,0 +1,67 @@
+import io
+import zipfile
+
+import pytest
+
+from zip_budget import ZipBudget, ZipBudgetError, open_budgeted_zip
+
+
+def make_zip(members, compression=zipfile.ZIP_DEFLATED):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_too_many_members_are_refused_when_opened():
+    data = make_zip({f"part{i}.xml": b"<a/>" for i in range(11)})
+    with pytest.raises(ZipBudgetError, match="11 parts"):
+        open_budgeted_zip(data, ZipBudget(max_members=10), "report.pptx")
+    open_budgeted_zip(data, ZipBudget(max_members=11)).close()
+
+
+def test_over_compressed_member_is_refused_before_inflating():
+    data = make_zip({"bomb.xml": b"\0" * (4 * 1024 * 1024)})
+    budget = ZipBudget(max_compression_ratio=100, ratio_check_min_bytes=1024 * 1024)
+    with open_budgeted_zip(data, budget) as archive:
+        with pytest.raises(ZipBudgetError, match="expands"):
+            budget.read(archive, "bomb.xml")
+    assert budget.bytes_read == 0
+
+
+def test_small_members_skip_the_ratio_check():
+    data = make_zip({"small.xml": b"\0" * 1000})
+    budget = ZipBudget(max_compression_ratio=2, ratio_check_min_bytes=1024 * 1024)
+    with open_budgeted_zip(data, budget) as archive:
+        assert budget.read(archive, "small.xml") == b"\0" * 1000
+
+
+def test_oversized_member_is_refused():
+    data = make_zip({"big.xml": b"x" * 5000}, zipfile.ZIP_STORED)
+    budget = ZipBudget(max_member_bytes=4096)
+    with open_budgeted_zip(data, budget) as archive:
+        with pytest.raises(ZipBudgetError, match="per part"):
+            budget.read(archive, "big.xml")
+
+
+def test_total_bytes_are_counted_across_members():
+    data = make_zip({"a.xml": b"a" * 3000, "b.xml": b"b" * 3000}, zipfile.ZIP_STORED)
+    budget = ZipBudget(max_total_bytes=5000)
+    with open_budgeted_zip(data, budget) as archive:
+        budget.read(archive, "a.xml")
+        assert budget.bytes_read == 3000
+        with pytest.raises(ZipBudgetError, match="budget for one validation"):
+            budget.read(archive, "b.xml")
+
+
+def test_streamed_bytes_are_charged_as_they_are_read():
+    data = make_zip({"a.xml": b"a" * 3000}, zipfile.ZIP_STORED)
+    budget = ZipBudget(max_total_bytes=5000)
+    with open_budgeted_zip(data, budget) as archive:
+        with budget.open(archive, archive.getinfo("a.xml")) as part:
+            part.read(1000)
+            assert budget.bytes_read == 1000
+            budget.consume(3500)  # E.g. an embedded workbook read meanwhile
+            with pytest.raises(ZipBudgetError, match="inflates beyond"):
+                part.read(1000)
@@ -0,0 +1,322 @@
+"""
+Local HTTP API for PPT validation, for tools that generate reports and want to check them.
+
+Endpoints (JSON responses):
+
+    GET  /health                               status, worker counts, catalog version
+    GET  /releases?q=bank+rlse123&limit=50     release grid search (every term must match)
+    GET  /releases?column=Release&value=RLSE1  exact lookup by one catalog column
+    POST /validate                             validate a deck
+
+POST /validate takes the .pptx either as the raw request body or as the "file"
+field of a multipart/form-data upload. The release row is picked with
+release=<value> (matched against key_column, default "Enterprise Release ID"),
+given as query or form fields; without it the release is matched from Slide 1
+like batch_validate does. cache=0 bypasses the result cache.
+
+Connections are HTTP/1.1 keep-alive and served by a bounded pool of connection
+threads; validations run on a process pool. Bodies above --max-request-mb are
+refused with 413, truncated or corrupt zips and zips that are not a presentation
+with 422, and when more than QUEUE_FACTOR validations per worker are
+pending new ones get 503 with Retry-After.
+
+Usage (from the AutomatedDocumentReview folder):
+    python validation_api.py [--port 8765] [--workers 4]
+    curl --data-binary @report.pptx "http://127.0.0.1:8765/validate?release=2025.M03"
+    curl -F file=@report.pptx -F release=2025.M03 http://127.0.0.1:8765/validate
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from batch_validate import DEFAULT_KEY_COLUMNS, DEFAULT_RELEASES_FILE, catalog_key_index, match_release_row
+from ppt_validator import ZIP_MAGIC, extract_slide1_fields, open_pptx_package, validate_ppt_package
+from release_catalog import load_catalog
+from result_cache import default_cache
+from zip_budget import ZipBudgetError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1))
+CONNECTION_THREADS = 32
+MAX_REQUEST_MB = 50
+KEEPALIVE_TIMEOUT = 15          # Seconds an idle keep-alive connection may hold a connection thread
+VALIDATION_TIMEOUT = 120        # Seconds before a pending validation answers 504
+QUEUE_FACTOR = 4                # Pending validations allowed per worker before answering 503
+DEFAULT_SEARCH_LIMIT = 50
+
+
+class NotAPresentationError(ValueError):
+    """Raised for a readable zip that is not a PowerPoint deck (no ppt/presentation.xml)."""
+
+
+class ApiError(Exception):
+    """An error answered to the client as {"error": message} with the given HTTP status."""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def validate_upload(pptx_bytes, releases_file, key_column=None, release=None, use_cache=True):
+    """
+    Validation task run in a worker process.
+
+    :return: {"status": "VALIDATED" | "UNMATCHED", "release": row or None, "results": {...},
+              "cached": bool, "error": message or None}
+    :raises NotAPresentationError: If the zip has no ppt/presentation.xml.
+    """
+    release_catalog = load_catalog(releases_file)
+    catalog = release_catalog.frame
+    with open_pptx_package(pptx_bytes) as package:
+        if not package.has_member("ppt/presentation.xml"):
+            raise NotAPresentationError("ppt/presentation.xml is missing")
+        if release is not None:
+            key_column = key_column or DEFAULT_KEY_COLUMNS[0]
+            rows, error = match_release_row(catalog, [key_column], {key_column: release},
+                                            catalog_key_index(release_catalog, [key_column]))
+        else:
+            rows, error = match_release_row(catalog, DEFAULT_KEY_COLUMNS, extract_slide1_fields(package),
+                                            catalog_key_index(release_catalog, DEFAULT_KEY_COLUMNS))
+        if error:
+            return {"status": "UNMATCHED", "release": None, "results": {}, "cached": False, "error": error}
+
+        row = rows[0]
+        cache_key = default_cache.make_key(pptx_bytes, row) if use_cache else None
+        results = default_cache.get(cache_key) if use_cache else None
+        cached = results is not None
+        if results is None:
+            results = validate_ppt_package(package, row)
+            if use_cache:
+                default_cache.put(cache_key, results)
+    warning = f"{len(rows)} release rows matched; validated against the first one" if len(rows) > 1 else None
+    return {"status": "VALIDATED", "release": row, "results": results, "cached": cached, "error": warning}
+
+
+def parse_multipart(content_type, body):
+    """Fields of a multipart/form-data body: name -> bytes (files) or str (plain fields)."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\nMIME-Version: 1.0\r\n\r\n".encode("latin-1") + body)
+    if not message.is_multipart():
+        raise ApiError(400, "Malformed multipart/form-data body")
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if not name:
+            continue
+        payload = part.get_payload(decode=True) or b""
+        fields[name] = payload if part.get_filename() else payload.decode(part.get_content_charset() or "utf-8")
+    return fields
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # ✅ Keep-alive: Content-Length is always sent
+    timeout = KEEPALIVE_TIMEOUT
+    server_version = "PPTValidationAPI/1.0"
+
+    def do_GET(self):
+        self._dispatch({"/health": self._health, "/releases": self._releases})
+
+    def do_POST(self):
+        self._dispatch({"/validate": self._validate})
+
+    def _dispatch(self, routes):
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            handler = routes.get(url.path.rstrip("/") or "/")
+            if handler is None:
+                self.close_connection = self.close_connection or "Content-Length" in self.headers  # Unread body
+                raise ApiError(404, f"Unknown endpoint: {self.command} {url.path}")
+            self._send_json(200, handler(query))
+        except ApiError as exc:
+            self._send_json(exc.status, {"error": str(exc)}, exc.headers)
+        except Exception:
+            traceback.print_exc()
+            self._send_json(500, {"error": "Internal server error"})
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            raise ApiError(411, "Content-Length is required")
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True  # The end of the body is unknown
+            raise ApiError(400, "Content-Length must be a non-negative integer")
+        if length > self.server.max_request_bytes:
+            self.close_connection = True  # The body is not read, so the connection cannot be reused
+            raise ApiError(413, f"Request body exceeds {self.server.max_request_bytes // (1024 * 1024)} MB")
+        return self.rfile.read(length)
+
+    def _health(self, query):
+        catalog = load_catalog(self.server.releases_file)
+        return {"status": "ok", "workers": self.server.workers, "pending": self.server.pending,
+                "catalog_version": catalog.version, "releases": len(catalog)}
+
+    def _releases(self, query):
+        catalog = load_catalog(self.server.releases_file)
+        frame = catalog.frame
+        if "column" in query:
+            if query["column"] not in frame.columns:
+                raise ApiError(400, f"Unknown column: {query['column']}")
+            rows = frame[frame[query["column"]] == query.get("value", "")]
+        else:
+            rows = frame.iloc[catalog.search(query.get("q", ""))]
+        try:
+            limit = int(query.get("limit", DEFAULT_SEARCH_LIMIT))
+        except ValueError:
+            raise ApiError(400, "limit must be an integer")
+        if limit < 1:
+            raise ApiError(400, "limit must be at least 1")
+        return {"total": len(rows), "releases": rows.head(limit).to_dict(orient="records")}
+
+    def _validate(self, query):
+        body = self._read_body()
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("multipart/form-data"):
+            fields = parse_multipart(content_type, body)
+            pptx_bytes = fields.pop("file", None)
+            if not isinstance(pptx_bytes, bytes):
+                raise ApiError(400, 'The multipart upload needs a "file" field')
+            query = {**{k: v for k, v in fields.items() if isinstance(v, str)}, **query}
+        else:
+            pptx_bytes = body
+        if not pptx_bytes.startswith(ZIP_MAGIC):
+            raise ApiError(415, "The upload is not a .pptx (zip) file")
+        key_column = query.get("key_column")
+        if key_column is not None and key_column not in load_catalog(self.server.releases_file).columns:
+            raise ApiError(400, f"Unknown key_column: {key_column}")
+
+        started = time.perf_counter()
+        outcome = self.server.run_validation(
+            pptx_bytes, key_column=key_column, release=query.get("release"),
+            use_cache=query.get("cache", "1") not in ("0", "false", "no"))
+        if outcome["status"] == "UNMATCHED":
+            raise ApiError(422, outcome["error"])
+        outcome["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return outcome
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ValidationHTTPServer(HTTPServer):
+    """
+    HTTP server with a bounded pool of connection threads and a process pool for validations.
+
+    :param address: (host, port) to listen on.
+    :param workers: Validation worker processes.
+    :param connection_threads: Connections served at once; further connections wait in the accept queue.
+    :param max_request_bytes: Largest accepted request body.
+    :param releases_file: Release catalog workbook.
+    """
+    request_queue_size = 128
+    allow_reuse_address = True
+
+    def __init__(self, address, workers=DEFAULT_WORKERS, connection_threads=CONNECTION_THREADS,
+                 max_request_bytes=MAX_REQUEST_MB * 1024 * 1024, releases_file=DEFAULT_RELEASES_FILE, verbose=False):
+        super().__init__(address, ValidationRequestHandler)
+        self.workers = workers
+        self.max_request_bytes = max_request_bytes
+        self.releases_file = releases_file
+        self.verbose = verbose
+        self.pending = 0
+        self._pending_lock = threading.Lock()
+        self._connections = ThreadPoolExecutor(max_workers=connection_threads, thread_name_prefix="api-connection")
+        # Spawned (not forked) workers: they neither inherit the listening socket nor fork a threaded process
+        self._validations = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def process_request(self, request, client_address):
+        self._connections.submit(self._serve_connection, request, client_address)
+
+    def _serve_connection(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def run_validation(self, pptx_bytes, **kwargs):
+        """Runs validate_upload on the process pool, refusing work beyond QUEUE_FACTOR per worker."""
+        with self._pending_lock:
+            if self.pending >= self.workers * QUEUE_FACTOR:
+                raise ApiError(503, "Too many validations in progress, retry shortly", {"Retry-After": "1"})
+            self.pending += 1
+        try:
+            future = self._validations.submit(validate_upload, pptx_bytes, self.releases_file, **kwargs)
+            return future.result(timeout=VALIDATION_TIMEOUT)
+        except FutureTimeoutError:
+            raise ApiError(504, f"Validation did not finish within {VALIDATION_TIMEOUT} s")
+        except ZipBudgetError as exc:
+            raise ApiError(413, f"The deck exceeds the parsing budget: {exc}")
+        except (zipfile.BadZipFile, ET.ParseError, NotAPresentationError) as exc:
+            raise ApiError(422, f"The upload is not a readable .pptx file: {exc}")
+        finally:
+            with self._pending_lock:
+                self.pending -= 1
+
+    def server_close(self):
+        super().server_close()
+        self._connections.shutdown(wait=False, cancel_futures=True)
+        self._validations.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind (default: localhost only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Validation worker processes")
+    parser.add_argument("--connections", type=int, default=CONNECTION_THREADS, help="Connection threads")
+    parser.add_argument("--max-request-mb", type=int, default=MAX_REQUEST_MB)
+    parser.add_argument("--releases", default=DEFAULT_RELEASES_FILE, help="Release catalog workbook")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    load_catalog(args.releases)  # ✅ Build / validate the catalog snapshot before accepting requests
+    server = ValidationHTTPServer((args.host, args.port), workers=args.workers, connection_threads=args.connections,
+                                  max_request_bytes=args.max_request_mb * 1024 * 1024,
+                                  releases_file=args.releases, verbose=args.verbose)
+    print(f"✅ Validation API listening on http://{args.host}:{args.port} ({args.workers} workers)", flush=True)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))  # Clean shutdown of the worker pool
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
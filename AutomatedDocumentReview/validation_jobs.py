@@ -0,0 +1,199 @@
+"""
+Background validation jobs for the Streamlit pages.
+
+A validation is submitted as a task to a small, process-wide pool of worker
+threads instead of running inside the session's script thread. The page keeps
+only the job ID in st.session_state and polls job.snapshot() for per-slide
+progress and the partial results collected so far.
+
+Admission control protects the server when many users validate at once:
+
+    - JOB_WORKERS validations run at the same time; later ones wait in the queue
+    - at most MAX_ACTIVE_JOBS jobs (queued + running) exist; further submissions are refused
+    - each session (owner) may have MAX_JOBS_PER_OWNER active jobs
+
+Finished jobs are kept for JOB_RETENTION_SECONDS so a page can still pick up
+their results after a rerun, then dropped. Once the page has taken the results
+(e.g. into session_store.default_store) it calls release(job_id): the results
+are dropped straight away and only the small state / progress record stays for
+the rest of the retention window, so no validation is held in memory twice.
+"""
+import itertools
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+JOB_WORKERS = 2
+MAX_ACTIVE_JOBS = 16
+MAX_JOBS_PER_OWNER = 1
+JOB_RETENTION_SECONDS = 15 * 60
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+class QueueFullError(RuntimeError):
+    """Raised by submit() when a concurrency limit would be exceeded."""
+
+
+class ValidationJob:
+    """State of one background validation, updated by the worker and read by the page."""
+
+    def __init__(self, job_id, owner, sequence):
+        self.id = job_id
+        self.owner = owner
+        self.sequence = sequence
+        self.state = QUEUED
+        self.completed = 0
+        self.total = None
+        self.results = {}
+        self.released = False
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self.state in (QUEUED, RUNNING)
+
+    def report_progress(self, slide_key, slide_result, completed, total):
+        """progress callback for validate_ppt: records one more finished slide."""
+        with self._lock:
+            if not self.released:
+                self.results[slide_key] = slide_result
+            self.completed = completed
+            self.total = total
+
+    def snapshot(self):
+        """A consistent copy of the job state, safe to render from another thread."""
+        with self._lock:
+            return {
+                "id": self.id,
+                "state": self.state,
+                "completed": self.completed,
+                "total": self.total,
+                "results": dict(self.results),
+                "released": self.released,
+                "error": self.error,
+                "submitted_at": self.submitted_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class ValidationJobQueue:
+    """
+    Bounded pool of background validation workers.
+
+    Usage:
+        job_id = default_queue.submit(lambda progress: validate_ppt(data, row, progress=progress), owner=session_id)
+        ...
+        snapshot = default_queue.snapshot(job_id)  # state, completed / total, results so far
+        default_queue.release(job_id)              # once the finished results are kept elsewhere
+
+    :param workers: Validations that run concurrently.
+    :param max_active_jobs: Queued + running jobs allowed across all sessions.
+    :param max_jobs_per_owner: Queued + running jobs allowed per owner (session).
+    :param retention_seconds: How long finished jobs stay available.
+    """
+
+    def __init__(self, workers=JOB_WORKERS, max_active_jobs=MAX_ACTIVE_JOBS,
+                 max_jobs_per_owner=MAX_JOBS_PER_OWNER, retention_seconds=JOB_RETENTION_SECONDS):
+        self.workers = workers
+        self.max_active_jobs = max_active_jobs
+        self.max_jobs_per_owner = max_jobs_per_owner
+        self.retention_seconds = retention_seconds
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validation-job")
+        self._jobs = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def submit(self, task, owner=None):
+        """
+        Queues task(progress) -> results and returns the new job ID.
+
+        :param task: Callable taking the job's progress callback and returning the final results.
+        :param owner: Session identifier used for the per-owner limit.
+        :raises QueueFullError: If the server-wide or per-owner limit is reached.
+        """
+        with self._lock:
+            self._prune()
+            active = [job for job in self._jobs.values() if job.active]
+            if len(active) >= self.max_active_jobs:
+                raise QueueFullError(f"The server is busy ({len(active)} validations queued). Please retry shortly.")
+            if owner is not None and sum(job.owner == owner for job in active) >= self.max_jobs_per_owner:
+                raise QueueFullError("A validation for this session is already running.")
+            job = ValidationJob(uuid.uuid4().hex, owner, next(self._sequence))
+            self._jobs[job.id] = job
+        self._pool.submit(self._run, job, task)
+        return job.id
+
+    def _run(self, job, task):
+        with job._lock:
+            job.state = RUNNING
+            job.started_at = time.time()
+        try:
+            results = task(job.report_progress)
+        except Exception as exc:  # Reported to the page, never raised in the worker
+            with job._lock:
+                job.state = FAILED
+                job.error = f"{type(exc).__name__}: {exc}"
+                job.finished_at = time.time()
+        else:
+            with job._lock:
+                job.results = {} if job.released else results
+                job.completed = job.total = len(results)
+                job.state = DONE
+                job.finished_at = time.time()
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def release(self, job_id):
+        """
+        Drops the results of a finished job once the page has taken them; its state and
+        progress stay available until the retention window ends.
+
+        :return: False for an unknown / expired job ID.
+        """
+        job = self.get(job_id)
+        if job is None:
+            return False
+        with job._lock:
+            job.results = {}
+            job.released = True
+        return True
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def snapshot(self, job_id):
+        """The job's snapshot(), or None for an unknown / expired job ID."""
+        job = self.get(job_id)
+        return job.snapshot() if job is not None else None
+
+    def queue_position(self, job_id):
+        """How many queued jobs are ahead of this one beyond the free workers (0 = starts next)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state != QUEUED:
+                return 0
+            running = sum(other.state == RUNNING for other in self._jobs.values())
+            ahead = sum(other.state == QUEUED and other.sequence < job.sequence for other in self._jobs.values())
+            return max(0, ahead + running - self.workers + 1)
+
+    def stats(self):
+        with self._lock:
+            states = [job.state for job in self._jobs.values()]
+        return {"workers": self.workers, "queued": states.count(QUEUED), "running": states.count(RUNNING),
+                "finished": states.count(DONE) + states.count(FAILED)}
+
+
+# Shared by every session of this server process
+default_queue = ValidationJobQueue()
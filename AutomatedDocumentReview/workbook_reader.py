@@ -0,0 +1,182 @@
+"""
+Minimal read-only, streaming .xlsx/.xlsm reader.
+
+Rows are produced one at a time with iterparse and dropped from the tree as
+soon as they are yielded (see iterparse_released), and the shared-strings table is parsed only as far as the
+highest string index actually referenced. A caller that stops iterating
+after the first few rows therefore reads only the top of the sheet, no
+matter how many rows of raw results the workbook holds.
+"""
+import posixpath
+import xml.etree.ElementTree as ET
+
+from zip_budget import ZipBudget, open_budgeted_zip
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+TAG_SHEET = f"{{{MAIN_NS}}}sheet"
+TAG_ROW = f"{{{MAIN_NS}}}row"
+TAG_CELL = f"{{{MAIN_NS}}}c"
+TAG_VALUE = f"{{{MAIN_NS}}}v"
+TAG_TEXT = f"{{{MAIN_NS}}}t"
+TAG_RUN = f"{{{MAIN_NS}}}r"
+TAG_INLINE = f"{{{MAIN_NS}}}is"
+TAG_SHARED_ITEM = f"{{{MAIN_NS}}}si"
+TAG_RELATIONSHIP = f"{{{PKG_REL_NS}}}Relationship"
+ATTR_REL_ID = f"{{{DOC_REL_NS}}}id"
+
+
+def iterparse_released(source, events=("end",), release=None):
+    """
+    ET.iterparse that drops finished elements from the tree: once the caller has handled
+    an element's "end" event, the element is removed from its parent. elem.clear() alone
+    leaves an empty element per row attached to the root, so a 200k-row sheet would still
+    build a 200k-child tree; here the tree only holds the path of open elements.
+
+    :param events: Events passed on to the caller ("start" and / or "end").
+    :param release: Tags to drop (default: every element). Leave out the children a caller
+                    still reads at its parent's end, e.g. the cells of a row.
+    """
+    parents = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            if "start" in events:
+                yield event, elem
+            continue
+        parents.pop()
+        if "end" in events:
+            yield event, elem
+        if parents and (release is None or elem.tag in release):
+            parents[-1].remove(elem)  # Earlier siblings are gone already, so this is O(1)
+
+
+def column_index(cell_ref):
+    """Zero-based column index of a cell reference such as "AB12"."""
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index - 1
+
+
+def _rich_text(elem):
+    """Text of an <si> or <is> element: a plain <t>, or the concatenated <r><t> runs."""
+    text_elem = elem.find(TAG_TEXT)
+    if text_elem is not None:
+        return text_elem.text or ""
+    return "".join(run.text or "" for run in elem.iterfind(f"{TAG_RUN}/{TAG_TEXT}"))
+
+
+class _SharedStrings:
+    """Shared-strings table parsed lazily, only up to the highest index requested."""
+
+    def __init__(self, xlsx_zip, part_name, budget):
+        self._strings = []
+        self._source = budget.open(xlsx_zip, xlsx_zip.NameToInfo[part_name]) \
+            if part_name in xlsx_zip.NameToInfo else None
+        self._events = iterparse_released(self._source, release={TAG_SHARED_ITEM}) \
+            if self._source is not None else None
+
+    def __getitem__(self, index):
+        while index >= len(self._strings) and self._events is not None:
+            for _, elem in self._events:
+                if elem.tag == TAG_SHARED_ITEM:
+                    self._strings.append(_rich_text(elem))
+                    break
+            else:
+                self.close()
+        return self._strings[index] if index < len(self._strings) else ""
+
+    def close(self):
+        self._events = None
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+
+class XlsxStreamReader:
+    """
+    Streams the rows of an .xlsx/.xlsm workbook.
+
+    Usage:
+        with XlsxStreamReader(data) as workbook:
+            for sheet_name in workbook.sheet_names:
+                for row in workbook.iter_rows(sheet_name):
+                    ...
+
+    :param source: Workbook bytes, a seekable file-like object or a path.
+    :param budget: zip_budget.ZipBudget the reads are charged to (e.g. the budget of the deck
+                   the workbook is embedded in); default: a fresh one.
+    """
+
+    def __init__(self, source, budget=None):
+        self._budget = budget or ZipBudget()
+        self._zip = open_budgeted_zip(source, self._budget, "The workbook")
+        self._sheet_parts = self._read_sheet_parts()
+        self._shared_strings = _SharedStrings(self._zip, "xl/sharedStrings.xml", self._budget)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._shared_strings.close()
+        self._zip.close()
+
+    @property
+    def sheet_names(self):
+        return list(self._sheet_parts)
+
+    def _read_sheet_parts(self):
+        """Sheet name -> worksheet part name, in workbook order."""
+        targets = {}
+        for rel in ET.fromstring(self._budget.read(self._zip, "xl/_rels/workbook.xml.rels")).iter(TAG_RELATIONSHIP):
+            target = rel.get("Target", "")
+            target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = target
+
+        sheet_parts = {}
+        for sheet in ET.fromstring(self._budget.read(self._zip, "xl/workbook.xml")).iter(TAG_SHEET):
+            part_name = targets.get(sheet.get(ATTR_REL_ID))
+            if part_name in self._zip.NameToInfo:
+                sheet_parts[sheet.get("name")] = part_name
+        return sheet_parts
+
+    def _cell_value(self, cell):
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            inline = cell.find(TAG_INLINE)
+            return _rich_text(inline) if inline is not None else ""
+        value_elem = cell.find(TAG_VALUE)
+        value = value_elem.text if value_elem is not None else None
+        if value is None:
+            return None
+        if cell_type == "s":
+            return self._shared_strings[int(value)]
+        if cell_type == "b":
+            return value == "1"
+        if cell_type in ("str", "e", "d"):
+            return value
+        number = float(value)
+        return int(number) if number.is_integer() and "." not in value and "E" not in value.upper() else number
+
+    def iter_rows(self, sheet_name):
+        """Yields each row of a sheet as a tuple of cell values (None for empty cells)."""
+        with self._budget.open(self._zip, self._zip.NameToInfo[self._sheet_parts[sheet_name]]) as sheet_xml:
+            for _, elem in iterparse_released(sheet_xml, release={TAG_ROW}):
+                if elem.tag != TAG_ROW:
+                    continue
+                values = []
+                for cell in elem.iterfind(TAG_CELL):
+                    ref = cell.get("r")
+                    position = column_index(ref) if ref else len(values)
+                    if position > len(values):
+                        values.extend([None] * (position - len(values)))
+                    values.append(self._cell_value(cell))
+                yield tuple(values)  # ✅ The row is then dropped: only the current row is held in memory
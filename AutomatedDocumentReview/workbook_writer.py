@@ -0,0 +1,104 @@
+"""
+Minimal streaming .xlsx writer, the counterpart of workbook_reader.
+
+Writes a single sheet straight into the zip stream, one row at a time, without
+building cell objects. For the release catalog that is several times faster
+than openpyxl's write-only mode, and the file reads back cell for cell with
+XlsxStreamReader, openpyxl or Excel.
+
+Cells are inline strings, except numbers and text that reads back as the very
+same number (e.g. "1002" or "2025.3", as the release catalog holds its numeric
+IDs): those are written as numeric cells, so a rewritten workbook keeps the
+cell types of the one it was read from. Text such as "007", "2025.30" or
+16-digit IDs stays text, since Excel would not keep it verbatim as a number.
+There is no styling: formatting, column widths and other sheets are not written.
+"""
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="xl/workbook.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+    '</Relationships>'
+)
+SHEET_HEADER = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+SHEET_FOOTER = '</sheetData></worksheet>'
+
+ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")  # Not allowed in XML 1.0
+MAX_SHEET_NAME = 31
+NUMBER_RE = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?")
+MAX_NUMBER_DIGITS = 15  # Excel keeps 15 significant digits
+
+
+def as_number(value):
+    """The text of a numeric cell for value, or None when it must be stored as text to read back unchanged."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        value = str(value)
+    if not isinstance(value, str) or not NUMBER_RE.fullmatch(value):
+        return None
+    if sum(char.isdigit() for char in value) > MAX_NUMBER_DIGITS:
+        return None
+    if "." in value and repr(float(value)) != value:
+        return None  # E.g. "2025.30" would read back as 2025.3
+    return value
+
+
+def _cell_xml(value):
+    if value is None or value == "":
+        return "<c/>"
+    number = as_number(value)
+    if number is not None:
+        return f"<c><v>{number}</v></c>"
+    text = escape(ILLEGAL_XML_CHARS_RE.sub("", str(value)))
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c t="inlineStr"><is><t{space}>{text}</t></is></c>'
+
+
+def write_xlsx(path, rows, sheet_name="Sheet1"):
+    """
+    Writes rows of values to a one-sheet workbook; numbers (see as_number) as numbers, everything else as text.
+
+    :param path: Destination path or writable binary file object.
+    :param rows: Iterable of row sequences (header first), consumed as it is written.
+    """
+    sheet_name = escape(ILLEGAL_XML_CHARS_RE.sub("", sheet_name)[:MAX_SHEET_NAME], {'"': "&quot;"})
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        package.writestr("_rels/.rels", ROOT_RELS_XML)
+        package.writestr("xl/workbook.xml", WORKBOOK_XML.format(name=sheet_name))
+        package.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS_XML)
+        with package.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(SHEET_HEADER.encode("utf-8"))
+            for row in rows:
+                sheet.write(("<row>" + "".join(_cell_xml(value) for value in row) + "</row>").encode("utf-8"))
+            sheet.write(SHEET_FOOTER.encode("utf-8"))
@@ -0,0 +1,140 @@
+"""
+Resource budgets for reading uploaded zip packages (.pptx, .docx and the workbooks embedded in them).
+
+Uploads are untrusted: a deck with a 500 MB video or a small, highly compressed
+"zip bomb" must not exhaust the memory of the shared app server. A ZipBudget
+enforces, per validation:
+
+    - MAX_MEMBERS            entries in one archive (checked when it is opened)
+    - MAX_MEMBER_BYTES       uncompressed size of any member that is read
+    - MAX_COMPRESSION_RATIO  uncompressed / compressed size of members above RATIO_CHECK_MIN_BYTES
+    - MAX_TOTAL_BYTES        uncompressed bytes actually read, counted while streaming
+
+Sizes are taken from the central directory before a member is opened; zipfile
+never inflates a member beyond its declared size, so an oversized or
+over-compressed part is refused before it is decompressed, and the running total
+stops a package as soon as it goes over budget. Nested packages (a workbook
+embedded in a deck) share the budget of their container.
+
+Parts under SKIPPED_PREFIXES (images, audio, video) are never needed by the
+validators and are not read at all.
+"""
+import io
+import zipfile
+
+MAX_MEMBERS = 5000
+MAX_MEMBER_BYTES = 64 * 1024 * 1024         # 64 MB per part
+MAX_TOTAL_BYTES = 256 * 1024 * 1024         # 256 MB inflated per validation
+MAX_COMPRESSION_RATIO = 250                 # Repetitive XML tables reach ~150x; deflate bombs ~1000x
+RATIO_CHECK_MIN_BYTES = 1024 * 1024         # Small parts may compress well without being suspicious
+SKIPPED_PREFIXES = ("ppt/media/", "word/media/", "xl/media/")
+
+
+class ZipBudgetError(ValueError):
+    """Raised when an archive or one of its members exceeds a budget."""
+
+
+def is_skipped(name):
+    return name.startswith(SKIPPED_PREFIXES)
+
+
+class ZipBudget:
+    """
+    Limits and running byte count for one validation. Omitted limits use the module constants.
+
+    Usage:
+        budget = ZipBudget()
+        budget.check_archive(zip_file, "report.pptx")
+        with budget.open(zip_file, info) as part:   # streamed, counted
+            ...
+        data = budget.read(zip_file, info)
+    """
+
+    def __init__(self, max_members=None, max_member_bytes=None, max_total_bytes=None,
+                 max_compression_ratio=None, ratio_check_min_bytes=None):
+        self.max_members = MAX_MEMBERS if max_members is None else max_members
+        self.max_member_bytes = MAX_MEMBER_BYTES if max_member_bytes is None else max_member_bytes
+        self.max_total_bytes = MAX_TOTAL_BYTES if max_total_bytes is None else max_total_bytes
+        self.max_compression_ratio = MAX_COMPRESSION_RATIO if max_compression_ratio is None \
+            else max_compression_ratio
+        self.ratio_check_min_bytes = RATIO_CHECK_MIN_BYTES if ratio_check_min_bytes is None \
+            else ratio_check_min_bytes
+        self.bytes_read = 0
+
+    def check_archive(self, zip_file, label="The package"):
+        """Refuses archives with too many entries; returns the infolist."""
+        infolist = zip_file.infolist()
+        if len(infolist) > self.max_members:
+            raise ZipBudgetError(f"{label} has {len(infolist)} parts (limit {self.max_members})")
+        return infolist
+
+    def check_member(self, info):
+        """Refuses a member by its declared size and compression ratio, before it is inflated."""
+        if info.file_size > self.max_member_bytes:
+            raise ZipBudgetError(f"{info.filename} is {info.file_size / 1024 / 1024:.1f} MB uncompressed "
+                                 f"(limit {self.max_member_bytes / 1024 / 1024:.0f} MB per part)")
+        if info.file_size >= self.ratio_check_min_bytes and \
+                info.file_size > self.max_compression_ratio * max(info.compress_size, 1):
+            raise ZipBudgetError(f"{info.filename} expands {info.file_size / max(info.compress_size, 1):.0f}x "
+                                 f"when decompressed (limit {self.max_compression_ratio}x)")
+        if self.bytes_read + info.file_size > self.max_total_bytes:
+            raise ZipBudgetError(f"Reading {info.filename} would exceed the "
+                                 f"{self.max_total_bytes / 1024 / 1024:.0f} MB budget for one validation")
+
+    def consume(self, count):
+        self.bytes_read += count
+        if self.bytes_read > self.max_total_bytes:
+            raise ZipBudgetError(f"The package inflates beyond the "
+                                 f"{self.max_total_bytes / 1024 / 1024:.0f} MB budget for one validation")
+
+    def open(self, zip_file, info):
+        """Streams a member through the budget."""
+        self.check_member(info)
+        return BudgetReader(zip_file.open(info), self)
+
+    def read(self, zip_file, info):
+        """Reads a whole member through the budget."""
+        if isinstance(info, str):
+            info = zip_file.getinfo(info)
+        with self.open(zip_file, info) as part:
+            return part.read()
+
+
+class BudgetReader(io.RawIOBase):
+    """A zip member stream that charges every chunk it returns to a ZipBudget."""
+
+    def __init__(self, raw, budget):
+        super().__init__()
+        self._raw = raw
+        self._budget = budget
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        self._budget.consume(len(data))
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._raw.close()
+        super().close()
+
+
+def open_budgeted_zip(source, budget, label="The package"):
+    """zipfile.ZipFile over a path, bytes or file object, with the member count checked."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    zip_file = zipfile.ZipFile(source, "r")
+    try:
+        budget.check_archive(zip_file, label)
+    except ZipBudgetError:
+        zip_file.close()
+        raise
+    return zip_file